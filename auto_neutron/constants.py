@@ -33,6 +33,11 @@ JOURNAL_PATH = (
 )
 STATUS_PATH = JOURNAL_PATH / "Status.json"
 ROUTE_FILE_NAME = "route.csv"
+ROUTE_SNAPSHOT_FILE_NAME = "route.snapshot"
+ROUTE_PROGRESS_FILE_NAME = "route_progress.log"
+JOURNAL_INDEX_FILE_NAME = "journal_index.json"
+ROUTE_CACHE_DIR_NAME = "route_cache"
+SYSTEM_NAME_CACHE_FILE_NAME = "system_name_cache.json"
 AHK_TEMPLATE = Template(
     """\
 stdin := FileOpen("*", "r")
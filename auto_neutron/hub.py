@@ -15,14 +15,23 @@ from __feature__ import snake_case, true_property  # noqa: F401
 
 import auto_neutron.locale
 from auto_neutron import Theme, settings
-from auto_neutron.constants import JOURNAL_PATH, ROUTE_FILE_NAME, get_config_dir
+from auto_neutron.constants import (
+    JOURNAL_PATH,
+    ROUTE_CACHE_DIR_NAME,
+    ROUTE_FILE_NAME,
+    ROUTE_PROGRESS_FILE_NAME,
+    ROUTE_SNAPSHOT_FILE_NAME,
+    get_config_dir,
+)
 from auto_neutron.dark_theme import set_theme
 from auto_neutron.fuel_warn import FuelWarn
 from auto_neutron.game_state import PlotterState
 from auto_neutron.plotters import AhkPlotter, CopyPlotter
-from auto_neutron.route import Route
+from auto_neutron.route import Route, RouteProgressLog
+from auto_neutron.route_cache import RouteCache
 from auto_neutron.self_updater import Updater
 from auto_neutron.settings import delay_sync
+from auto_neutron.spansh_request_manager import SpanshRequestManager
 from auto_neutron.utils.signal import ReconnectingSignal
 from auto_neutron.windows import (
     ErrorWindow,
@@ -67,6 +76,16 @@ class Hub(QtCore.QObject):
 
         self.window.show()
 
+        # Owned by the hub so routes passed on while they're decoded outlive the new route window.
+        self.request_manager = SpanshRequestManager(
+            self, route_cache=RouteCache(get_config_dir() / ROUTE_CACHE_DIR_NAME)
+        )
+        self.request_manager.route_rows_decoded.connect(self.append_route_rows)
+        self.request_manager.route_populated.connect(self.route_populated_callback)
+        self.request_manager.route_decode_failed.connect(
+            self.route_decode_failed_callback
+        )
+
         self.window.about_action.triggered.connect(self.display_license_window)
         self.window.new_route_action.triggered.connect(self.new_route_window)
         self.window.settings_action.triggered.connect(self.display_settings)
@@ -75,6 +94,8 @@ class Hub(QtCore.QObject):
 
         self.plotter_state = PlotterState(self)
         self.plotter_state.new_system_signal.connect(self.new_system_callback)
+        self.plotter_state.new_system_signal.connect(self.log_route_index)
+        self._progress_log: RouteProgressLog | None = None
         self.plotter_state.route_end_signal.connect(
             partial(self.new_system_callback, None)
         )
@@ -83,7 +104,7 @@ class Hub(QtCore.QObject):
         self.apply_settings()
 
         self.edit_route_update_connection = ReconnectingSignal(
-            self.window.table.itemChanged, self.update_route_from_edit
+            self.window.route_model.route_edited, self.update_route_from_edit
         )
         self.edit_route_update_connection.connect()
 
@@ -108,24 +129,26 @@ class Hub(QtCore.QObject):
     def new_route_window(self) -> None:
         """Display the `NewRouteWindow` and connect its signals."""
         log.info("Displaying new route window.")
-        route_window = create_or_activate_window(NewRouteWindow, "hub", self.window)
+        route_window = create_or_activate_window(
+            NewRouteWindow, "hub", self.window, self.request_manager
+        )
         if route_window is not None:
             route_window.route_created_signal.connect(self.new_route)
             route_window.show()
 
-    @QtCore.Slot(QtWidgets.QTableWidgetItem)
-    def update_route_from_edit(self, table_item: QtWidgets.QTableWidgetItem) -> None:
-        """Edit the plotter's route with the new data in `table_item`."""
-        log.debug(
-            f"Updating info from edited item at x={table_item.row()} y={table_item.column()}."
-        )
-        self.plotter_state.route.entries[table_item.row()][table_item.column()] = (
-            table_item.data(QtCore.Qt.ItemDataRole.DisplayRole)
-        )
-        if table_item.row() == self.plotter_state.route_index:
+    @QtCore.Slot(int, int, str)
+    def update_route_from_edit(
+        self, row: int, column: int, previous_system: str
+    ) -> None:
+        """Update the plotter's state after the route was edited at `row` and `column` from the table."""
+        log.debug(f"Updating info from edited item at x={row} y={column}.")
+        route = self.plotter_state.route
+        if self._progress_log is not None:
+            self._progress_log.log_edit(row, column, route.entries.value(row, column))
+        if row == self.plotter_state.route_index:
             self.plotter_state.route_index = self.plotter_state.route_index
         self.window.update_remaining_count()
-        self.plotter_state.route.update_indices()
+        route.update_indices(row, previous_system)
 
     @QtCore.Slot(object, int)
     def new_system_callback(self, _: t.Any, index: int) -> None:
@@ -133,6 +156,12 @@ class Hub(QtCore.QObject):
         with self.edit_route_update_connection.temporarily_disconnect():
             self.window.set_current_row(index)
 
+    @QtCore.Slot(str, int)
+    def log_route_index(self, _: str, index: int) -> None:
+        """Log the new route index to the route's progress log."""
+        if self._progress_log is not None:
+            self._progress_log.log_index(index)
+
     @QtCore.Slot(QtCore.QModelIndex)
     def get_index_row(self, index: QtCore.QModelIndex) -> None:
         """Set the current route index to `index`'s row."""
@@ -148,6 +177,7 @@ class Hub(QtCore.QObject):
 
         self.plotter_state.journal = journal
         self.plotter_state.create_worker_with_route(route)
+        self._update_progress_log()
         if self.plotter_state.plotter is None:
             if settings.General.copy_mode:
                 self.plotter_state.plotter = CopyPlotter()
@@ -163,6 +193,60 @@ class Hub(QtCore.QObject):
         self.warn_worker.start()
         self.fuel_warner.set_journal(journal)
 
+    @QtCore.Slot(object, int)
+    def append_route_rows(self, route: Route, _: int) -> None:
+        """Display the rows that were appended to `route`, if it's the current route."""
+        if route is self.plotter_state.route:
+            with self.edit_route_update_connection.temporarily_disconnect():
+                self.window.append_rows()
+            self.plotter_state.tail_worker.emit_pending_system()
+
+    @QtCore.Slot(object)
+    def route_populated_callback(self, route: Route) -> None:
+        """Start logging the progress of the fully decoded `route`, if it's the current route."""
+        if route is self.plotter_state.route:
+            self._update_progress_log()
+            self.plotter_state.tail_worker.emit_pending_system()
+
+    @QtCore.Slot(object, str)
+    def route_decode_failed_callback(self, route: Route, error: str) -> None:
+        """Warn the user that only a part of `route` was received, if it's the current route."""
+        if route is self.plotter_state.route:
+            self.plotter_state.tail_worker.emit_pending_system()
+            QtWidgets.QMessageBox.warning(
+                self.window,
+                "Auto_Neutron",
+                _("Only a part of the route was received: {}").format(error),
+            )
+
+    def _update_progress_log(self) -> None:
+        """
+        Log the current route's progress if routes are saved on quit, otherwise close and drop the progress log.
+
+        A new log starts with a snapshot of the route, so the route is restored even if no changes are logged.
+        Routes that are still being decoded or were truncated aren't logged, so they don't replace the saved route.
+        """
+        route = self.plotter_state.route
+        if (
+            settings.General.save_on_quit
+            and route is not None
+            and not route.populating
+            and not route.truncated
+        ):
+            if self._progress_log is not None and self._progress_log.route is route:
+                return
+            if self._progress_log is not None:
+                self._progress_log.close()
+            self._progress_log = RouteProgressLog(
+                route,
+                get_config_dir() / ROUTE_SNAPSHOT_FILE_NAME,
+                get_config_dir() / ROUTE_PROGRESS_FILE_NAME,
+            )
+            self._progress_log.save_snapshot()
+        elif self._progress_log is not None:
+            self._progress_log.close()
+            self._progress_log = None
+
     @QtCore.Slot()
     def apply_settings(self) -> None:
         """Update the appearance and plotter with new settings."""
@@ -186,6 +270,7 @@ class Hub(QtCore.QObject):
                 self.plotter_state.plotter = AhkPlotter(start_system=current_sys)
             else:
                 self.plotter_state.plotter.refresh_settings()
+        self._update_progress_log()
 
         new_locale = babel.Locale.parse(settings.General.locale)
         if new_locale != auto_neutron.locale.get_active_locale():
@@ -229,16 +314,33 @@ class Hub(QtCore.QObject):
             set_theme(dark)
 
     def save_on_exit(self) -> None:
-        """Save necessary settings when exiting."""
+        """
+        Save necessary settings when exiting.
+
+        The route's progress is already in its progress log, which is kept while routes are saved on quit.
+        Routes that weren't fully decoded don't have a log, and aren't saved.
+        """
         with delay_sync():
             settings.Window.geometry = self.window.save_geometry()
-            if settings.General.save_on_quit:
-                self.save_route()
+        if self._progress_log is not None:
+            self._progress_log.close()
 
     @QtCore.Slot()
     def save_route(self) -> None:
-        """If route auto saving is enabled, or force is True, save the route to the config directory."""
+        """Save the route's snapshot, and export the route as CSV to the config directory."""
         if self.plotter_state.route is not None:
-            log.info("Saving route.")
+            self.save_route_snapshot()
+            log.info("Exporting route to CSV.")
             self.plotter_state.route.to_csv_file(get_config_dir() / ROUTE_FILE_NAME)
             settings.General.last_route_index = self.plotter_state.route_index
+
+    def save_route_snapshot(self) -> None:
+        """Save a snapshot of the route with its current index to the config directory, compacting its progress log."""
+        if self.plotter_state.route is not None:
+            log.info("Saving route.")
+            if self._progress_log is not None:
+                self._progress_log.save_snapshot()
+            else:
+                self.plotter_state.route.to_snapshot_file(
+                    get_config_dir() / ROUTE_SNAPSHOT_FILE_NAME
+                )
@@ -3,17 +3,21 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import json
 import logging
+import mmap
+import os
 import typing as t
+from functools import partial
 from operator import attrgetter
 
 import more_itertools
 from PySide6 import QtCore
 from __feature__ import snake_case, true_property  # noqa: F401
 
-from auto_neutron.constants import JOURNAL_PATH
+from auto_neutron.constants import JOURNAL_INDEX_FILE_NAME, JOURNAL_PATH, get_config_dir
 from auto_neutron.game_state import Location
 from auto_neutron.ship import Ship
 from auto_neutron.utils.utils import get_sector_midpoint
@@ -22,8 +26,15 @@ if t.TYPE_CHECKING:
     import collections.abc
     from pathlib import Path
 
+    Buffer = bytes | mmap.mmap
+
 log = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 1024 * 1024
+HEADER_SCAN_SIZE = 64 * 1024
+_EVENT_MARKER = b'"event":"'
+JOURNAL_INDEX_VERSION = 1
+
 
 class Journal(QtCore.QObject):
     """Keep track of a journal file and the state of the game from it."""
@@ -46,83 +57,328 @@ class Journal(QtCore.QObject):
         self.cmdr = None
 
         self._last_file_pos = 0
-
-    def tail(self) -> collections.abc.Generator[None, None, None]:
-        """Follow a log file, and emit signals for new systems, loadout changes and game shut down."""
+        self._last_loadout: dict | None = None
+        self._event_handlers: dict[str, collections.abc.Callable[[dict], None]] = {
+            "Loadout": self._on_loadout,
+            "Location": self._on_location,
+            "FSDJump": self._on_location,
+            "FSDTarget": self._on_fsd_target,
+            "Cargo": self._on_cargo,
+            "Fileheader": self._on_fileheader,
+            "Commander": self._on_commander,
+            "Shutdown": self._on_shutdown,
+        }
+
+    def state_dict(self) -> dict[str, t.Any]:
+        """Get a JSON serializable dict of the state parsed from the journal, it can be restored with `restore_state`."""
+        return {
+            "last_file_pos": self._last_file_pos,
+            "loadout": self._last_loadout,
+            "location": self.location,
+            "last_target": self.last_target,
+            "cargo": self.cargo,
+            "shut_down": self.shut_down,
+            "is_oddysey": self.is_oddysey,
+            "cmdr": self.cmdr,
+        }
+
+    def restore_state(self, state: dict[str, t.Any]) -> None:
+        """
+        Restore the state from a `state` dict created by `state_dict`.
+
+        Further parses continue from the file position the state was created at. No signals are emitted.
+        """
+        self._last_file_pos = state["last_file_pos"]
+        self._last_loadout = state["loadout"]
+        if self._last_loadout is not None:
+            self.ship = Ship.from_loadout(self._last_loadout)
+        if state["location"] is not None:
+            self.location = Location(*state["location"])
+        if state["last_target"] is not None:
+            self.last_target = Location(*state["last_target"])
+        self.cargo = state["cargo"]
+        self.shut_down = state["shut_down"]
+        self.is_oddysey = state["is_oddysey"]
+        self.cmdr = state["cmdr"]
+
+    def tail(self) -> collections.abc.Generator[bool, None, None]:
+        """
+        Follow a log file, and emit signals for new systems, loadout changes and game shut down.
+
+        Following starts where the last parse ended, or at the end of the file if the journal wasn't parsed before.
+        Every advance reads all of the newly written lines, and yields whether there were any.
+        """
         log.info(f"Starting tailer of journal file {self.path.name} {id(self)=:x}.")
         try:
-            with self.path.open(encoding="utf8") as journal_file:
-                journal_file.seek(0, 2)
+            with self.path.open("rb") as journal_file:
+                if not self._last_file_pos:
+                    self._last_file_pos = journal_file.seek(0, 2)
                 while True:
-                    if line := journal_file.readline():
-                        self._last_file_pos = journal_file.tell()
-                        self._parse_journal_line(line)
-                    else:
-                        yield
+                    yield self._parse_new_lines(journal_file)
         finally:
             log.info(f"Stopping tailer of journal file {self.path.name} {id(self)=:x}.")
 
     def parse(self) -> None:
-        """Parse the whole journal file and update the fields that were set."""
+        """
+        Parse the whole journal file and update the fields that were set.
+
+        If the journal wasn't parsed before, its state is recovered by `recover_state` instead of a forward parse.
+        The file is memory mapped, and only lines of events with a handler are copied out of the mapping.
+        """
+        if not self._last_file_pos:
+            self.recover_state()
+            return
+
         log.info(
             f"Statically parsing journal file {self.path.name} from pos {self._last_file_pos}."
         )
-        with self.path.open(encoding="utf8") as journal_file:
-            journal_file.seek(self._last_file_pos)
-            while line := journal_file.readline():
-                self._last_file_pos = journal_file.tell()
-                self._parse_journal_line(line)
+        with self.path.open("rb") as journal_file, _map_file(journal_file) as buffer:
+            if buffer is None:
+                return
+            for line_start, line_end in _iter_line_spans(buffer, self._last_file_pos):
+                self._last_file_pos = line_end + 1
+                self._parse_journal_line(buffer, line_start, line_end)
+
+    def recover_state(self) -> None:
+        """
+        Recover the current state of the journal by reading the file backwards.
+
+        Only the last event of each kind is relevant for the state, so the memory mapped file is searched
+        from the end until the last loadout, location, target and cargo events are found,
+        and the found events are then parsed in their original order.
+        The file header and CMDR are read from the start of the file.
+        A shut down is only checked for in the last event, as it ends the journal,
+        blank and undecodable lines after it are skipped.
+
+        After recovery, further parses and tailing continue from the end of the file.
+        """
+        log.info(f"Recovering state of journal file {self.path.name}.")
+        with self.path.open("rb") as journal_file, _map_file(journal_file) as buffer:
+            if buffer is None:
+                return
+            data_end = buffer.rfind(b"\n") + 1
+            if not data_end:
+                return
+
+            found_commander = False
+            for line_start, line_end in _iter_line_spans(buffer, 0):
+                if line_start > HEADER_SCAN_SIZE:
+                    break
+                try:
+                    event = _get_event_name(buffer, line_start, line_end)
+                except ValueError:
+                    # Short journals may end in the header block, their trailing lines are handled below.
+                    continue
+                if event == "Fileheader" or event == "Commander":
+                    self._parse_journal_line(buffer, line_start, line_end)
+                    found_commander = found_commander or event == "Commander"
+
+            missing_events = set(_RECOVERED_EVENT_KINDS.values())
+            if found_commander:
+                missing_events.remove("Commander")
+
+            recovered_spans = []
+            found_last_event = False
+            for line_number, (line_start, line_end) in enumerate(
+                _iter_line_spans_reversed(buffer, data_end - 1)
+            ):
+                try:
+                    event = _get_event_name(buffer, line_start, line_end)
+                except ValueError:
+                    # A line cut off by the game can only be at the end of the file.
+                    if found_last_event:
+                        raise
+                    log.debug(f"Skipping undecodable line {line_number} from the end.")
+                    continue
+                if event is None:
+                    continue
+
+                is_last_event = not found_last_event
+                found_last_event = True
+                if is_last_event and event == "Shutdown":
+                    recovered_spans.append((line_start, line_end))
+                    continue
+                kind = _RECOVERED_EVENT_KINDS.get(event)
+                if kind is None or kind not in missing_events:
+                    continue
+                if (
+                    event == "Cargo"
+                    and json.loads(buffer[line_start:line_end])["Vessel"] != "Ship"
+                ):
+                    continue
+
+                recovered_spans.append((line_start, line_end))
+                missing_events.remove(kind)
+                if not missing_events:
+                    break
+
+            for line_start, line_end in reversed(recovered_spans):
+                self._parse_journal_line(buffer, line_start, line_end)
+
+        self._last_file_pos = data_end
+        log.info(
+            f"Recovered journal state from {len(recovered_spans)} events, "
+            f"stopped at line {line_number} from the end."
+        )
 
-    def _parse_journal_line(self, line: str) -> None:
-        """Parse a single line from the journal, setting attributes and emitting signals appropriately."""
-        entry = json.loads(line)
-        if entry["event"] == "Loadout":
-            if self.ship is None:
-                self.ship = Ship()
-            self.ship.update_from_loadout(entry)
-            self.loadout_sig.emit(self.ship)
-
-        elif entry["event"] == "Location" or entry["event"] == "FSDJump":
-            self.location = Location(entry["StarSystem"], *entry["StarPos"])
-            if entry["event"] == "FSDJump":
-                self.system_sig.emit(Location(entry["StarSystem"], *entry["StarPos"]))
-
-        elif entry["event"] == "FSDTarget":
-            self.last_target = Location(
-                entry["Name"], *get_sector_midpoint(entry["SystemAddress"])
-            )
-            self.target_signal.emit(self.last_target)
+    def _parse_new_lines(self, journal_file: t.BinaryIO) -> bool:
+        """
+        Parse all complete lines of `journal_file` after `self._last_file_pos`.
+
+        The file is read in large chunks, a partially written last line is left to be parsed by the next read.
+        Return whether any lines were parsed.
+        """
+        journal_file.seek(self._last_file_pos)
+        parsed_lines = False
+        remainder = b""
+        while chunk := journal_file.read(READ_CHUNK_SIZE):
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                self._last_file_pos += len(line) + 1
+                self._parse_journal_line(line)
+                parsed_lines = True
+        return parsed_lines
+
+    def _parse_journal_line(
+        self, buffer: Buffer, start: int = 0, end: int | None = None
+    ) -> None:
+        """
+        Parse a single line from `buffer` between `start` and `end`, setting attributes and emitting signals appropriately.
+
+        The event name is looked up in the raw line first, lines of events without a handler are not decoded.
+        """
+        if end is None:
+            end = len(buffer)
+        event = _sniff_event_name(buffer, start, end)
+        if event is not None and event not in self._event_handlers:
+            return
+
+        entry = json.loads(buffer[start:end])
+        if (handler := self._event_handlers.get(entry["event"])) is not None:
+            handler(entry)
+
+    def _on_loadout(self, entry: dict) -> None:
+        self._last_loadout = entry
+        if self.ship is None:
+            self.ship = Ship()
+        self.ship.update_from_loadout(entry)
+        self.loadout_sig.emit(self.ship)
+
+    def _on_location(self, entry: dict) -> None:
+        self.location = Location(entry["StarSystem"], *entry["StarPos"])
+        if entry["event"] == "FSDJump":
+            self.system_sig.emit(Location(entry["StarSystem"], *entry["StarPos"]))
+
+    def _on_fsd_target(self, entry: dict) -> None:
+        self.last_target = Location(
+            entry["Name"], *get_sector_midpoint(entry["SystemAddress"])
+        )
+        self.target_signal.emit(self.last_target)
 
-        elif entry["event"] == "Cargo" and entry["Vessel"] == "Ship":
+    def _on_cargo(self, entry: dict) -> None:
+        if entry["Vessel"] == "Ship":
             self.cargo = entry["Count"]
             self.cargo_signal.emit(self.cargo)
 
-        elif entry["event"] == "Fileheader":
-            self.is_oddysey = entry.get("Odyssey", False)
+    def _on_fileheader(self, entry: dict) -> None:
+        self.is_oddysey = entry.get("Odyssey", False)
+
+    def _on_commander(self, entry: dict) -> None:
+        self.cmdr = entry["Name"]
 
-        elif entry["event"] == "Commander":
-            self.cmdr = entry["Name"]
+    def _on_shutdown(self, entry: dict) -> None:
+        self.shut_down = True
+        self.shut_down_sig.emit()
 
-        elif entry["event"] == "Shutdown":
-            self.shut_down = True
-            self.shut_down_sig.emit()
+
+def _sniff_event_name(buffer: Buffer, start: int, end: int) -> str | None:
+    """
+    Get the event name from the raw journal line in `buffer` between `start` and `end` without decoding the line.
+
+    None is returned if the event isn't in the compact format written by the game.
+    """
+    event_start = buffer.find(_EVENT_MARKER, start, end)
+    if event_start == -1:
+        return None
+    event_start += len(_EVENT_MARKER)
+    event_end = buffer.find(b'"', event_start, end)
+    if event_end == -1:
+        return None
+    return buffer[event_start:event_end].decode()
+
+
+def _get_event_name(buffer: Buffer, start: int, end: int) -> str | None:
+    """Get the event name of the line in `buffer`, decoding it if it can't be sniffed. Return None for blank lines."""
+    event = _sniff_event_name(buffer, start, end)
+    if event is None and buffer[start:end].strip():
+        event = json.loads(buffer[start:end])["event"]
+    return event
+
+
+_RECOVERED_EVENT_KINDS = {
+    "Loadout": "Loadout",
+    "Location": "Location",
+    "FSDJump": "Location",
+    "FSDTarget": "FSDTarget",
+    "Cargo": "Cargo",
+    "Commander": "Commander",
+}
+
+
+@contextlib.contextmanager
+def _map_file(journal_file: t.BinaryIO) -> collections.abc.Iterator[mmap.mmap | None]:
+    """Map `journal_file` into memory for reading, None is yielded for empty files which can't be mapped."""
+    if not os.fstat(journal_file.fileno()).st_size:
+        yield None
+        return
+    with mmap.mmap(journal_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def _iter_line_spans(
+    buffer: Buffer, start: int
+) -> collections.abc.Iterator[tuple[int, int]]:
+    """Iterate over the start and end positions of complete lines in `buffer` after `start`."""
+    while (line_end := buffer.find(b"\n", start)) != -1:
+        yield start, line_end
+        start = line_end + 1
+
+
+def _iter_line_spans_reversed(
+    buffer: Buffer, end: int
+) -> collections.abc.Iterator[tuple[int, int]]:
+    """Iterate over the start and end positions of lines in `buffer` that end before `end`, from the last one."""
+    line_end = end
+    while True:
+        line_start = buffer.rfind(b"\n", 0, line_end) + 1
+        yield line_start, line_end
+        if not line_start:
+            return
+        line_end = line_start - 1
 
 
 journal_cache = {}
+_journal_index: dict[str, dict[str, t.Any]] | None = None
 
 
-def get_cached_journal(path: Path) -> Journal:
+def get_cached_journal(path: Path, stat: os.stat_result | None = None) -> Journal:
     """
     Get the journal object form `path`, if the journal was opened before, get the changed object.
 
-    The journal is parsed before being returned.
+    Journals not opened in this session are restored from the on-disk journal index when possible,
+    and then only parsed from the position the index was saved at.
+    The journal is parsed before being returned, unless `stat` shows it has no new data.
     """
+    if stat is None:
+        stat = path.stat()
     try:
         journal = journal_cache[path]
     except KeyError:
-        journal = journal_cache[path] = Journal(path)
+        journal = journal_cache[path] = _journal_from_index(path, stat)
 
-    journal.parse()
+    if journal._last_file_pos != stat.st_size:
+        journal.parse()
 
     return journal
 
@@ -131,8 +387,132 @@ def get_unique_cmdr_journals() -> list[Journal]:
     """
     Get the latest journals for each found CMDR.
 
-    Only the first 15 journals newer than a week are looked at.
+    Only the first 15 journals newer than a week are looked at,
+    the journal index is then updated with their state.
+    """
+    journals = []
+    index_entries = {}
+    for journal_path, stat in _get_candidate_journal_paths():
+        journal = get_cached_journal(journal_path, stat)
+        index_entries[journal_path.name] = _index_entry(journal, stat)
+        if not journal.shut_down:
+            journals.append(journal)
+    _save_journal_index(index_entries)
+
+    return list(more_itertools.unique_everseen(journals, attrgetter("cmdr")))
+
+
+class JournalScanner(QtCore.QObject):
+    """
+    Find the latest journals for each CMDR like `get_unique_cmdr_journals`, without blocking the GUI thread.
+
+    Journals that weren't opened in this session are parsed on the global thread pool.
+    `journal_found` is emitted with the journals in the same order as they'd be returned by
+    `get_unique_cmdr_journals`, as soon as they and all of the newer journals are parsed,
+    `finished` is emitted after all of the journals were processed.
     """
+
+    journal_found = QtCore.Signal(Journal)
+    finished = QtCore.Signal()
+    _journal_parsed = QtCore.Signal(int, int, object)
+
+    def __init__(self):
+        super().__init__()
+        self._scan_id = 0
+        self._candidates: list[tuple[Path, os.stat_result]] = []
+        self._results: list[Journal | None] = []
+        self._next_result_index = 0
+        self._found_cmdrs = set[str | None]()
+        self._journal_parsed.connect(self._store_result)
+
+    def scan(self) -> None:
+        """Start a new scan, results of a scan that's still running are discarded."""
+        self.cancel()
+        self._candidates = _get_candidate_journal_paths()
+        self._results = [None] * len(self._candidates)
+        self._next_result_index = 0
+        self._found_cmdrs.clear()
+        log.info(f"Scanning {len(self._candidates)} journals.")
+
+        thread_pool = QtCore.QThreadPool.global_instance()
+        for index, (path, stat) in enumerate(self._candidates):
+            if path in journal_cache:
+                self._results[index] = get_cached_journal(path, stat)
+                continue
+
+            journal = _journal_from_index(path, stat)
+            if journal._last_file_pos == stat.st_size:
+                self._results[index] = journal_cache[path] = journal
+            else:
+                thread_pool.start(
+                    partial(self._parse_in_thread, self._scan_id, index, journal)
+                )
+
+        self._emit_ready_results()
+
+    def cancel(self) -> None:
+        """Discard the results of the running scan, if any."""
+        self._scan_id += 1
+
+    def _parse_in_thread(self, scan_id: int, index: int, journal: Journal) -> None:
+        """Parse `journal` and send it to the scanner's thread, runs in a thread pool thread."""
+        try:
+            journal.parse()
+        except Exception as e:
+            log.error(f"Failed to parse journal {journal.path.name}.", exc_info=e)
+            journal = None
+        self._journal_parsed.emit(scan_id, index, journal)
+
+    @QtCore.Slot(int, int, object)
+    def _store_result(self, scan_id: int, index: int, journal: Journal | None) -> None:
+        """Store a journal parsed in the thread pool, unless it's from a previous scan."""
+        if scan_id != self._scan_id:
+            return
+
+        path = self._candidates[index][0]
+        if journal is None:
+            self._results[index] = _FAILED_JOURNAL
+        else:
+            self._results[index] = journal_cache.setdefault(path, journal)
+        self._emit_ready_results()
+
+    def _emit_ready_results(self) -> None:
+        """Emit `journal_found` for all finished journals not preceded by one that's still being parsed."""
+        scan_id = self._scan_id
+        while (
+            self._next_result_index < len(self._results)
+            and (journal := self._results[self._next_result_index]) is not None
+        ):
+            self._next_result_index += 1
+            if (
+                journal is not _FAILED_JOURNAL
+                and not journal.shut_down
+                and journal.cmdr not in self._found_cmdrs
+            ):
+                self._found_cmdrs.add(journal.cmdr)
+                self.journal_found.emit(journal)
+                if scan_id != self._scan_id:
+                    # A slot started a new scan.
+                    return
+
+        if self._next_result_index == len(self._results):
+            _save_journal_index(
+                {
+                    path.name: _index_entry(journal, stat)
+                    for (path, stat), journal in zip(self._candidates, self._results)
+                    if journal is not _FAILED_JOURNAL
+                }
+            )
+            self.cancel()
+            log.info("Finished journal scan.")
+            self.finished.emit()
+
+
+_FAILED_JOURNAL = t.cast(Journal, object())
+
+
+def _get_candidate_journal_paths() -> list[tuple[Path, os.stat_result]]:
+    """Get the paths and stats of the first 15 journals newer than a week, sorted from the newest."""
     if __debug__:
         week_before = float("-inf")
     else:
@@ -140,17 +520,77 @@ def get_unique_cmdr_journals() -> list[Journal]:
             datetime.datetime.now() - datetime.timedelta(weeks=1)
         ).timestamp()
 
-    journal_paths = [
-        path
-        for path in JOURNAL_PATH.glob("Journal.*.log")
-        if path.stat().st_ctime > week_before
-    ]
-    journal_paths.sort(key=lambda path: path.stat().st_ctime, reverse=True)
+    journal_stats = []
+    for path in JOURNAL_PATH.glob("Journal.*.log"):
+        stat = path.stat()
+        if stat.st_ctime > week_before:
+            journal_stats.append((path, stat))
+    journal_stats.sort(key=lambda path_stat: path_stat[1].st_ctime, reverse=True)
+    return journal_stats[:15]
+
+
+def _journal_from_index(path: Path, stat: os.stat_result) -> Journal:
+    """Create a journal for `path`, and restore its state from the journal index if it's valid for `stat`."""
+    journal = Journal(path)
+    index_entry = _get_journal_index().get(path.name)
+    if index_entry is not None and _index_entry_valid(index_entry, stat):
+        journal.restore_state(index_entry["state"])
+    return journal
 
-    journals = []
-    for journal_path in journal_paths[:15]:
-        journal = get_cached_journal(journal_path)
-        if not journal.shut_down:
-            journals.append(journal)
 
-    return list(more_itertools.unique_everseen(journals, attrgetter("cmdr")))
+def _index_entry(journal: Journal, stat: os.stat_result) -> dict[str, t.Any]:
+    """Create an index entry for `journal` with the file's `stat`."""
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "state": journal.state_dict(),
+    }
+
+
+def _index_entry_valid(index_entry: dict[str, t.Any], stat: os.stat_result) -> bool:
+    """
+    Check whether the journal state in `index_entry` can be used for a journal file with `stat`.
+
+    Journals are only appended to, so the state is only invalidated if the file shrunk,
+    or changed without its size changing.
+    """
+    if stat.st_size == index_entry["size"]:
+        return stat.st_mtime_ns == index_entry["mtime"]
+    return stat.st_size > index_entry["size"]
+
+
+def _get_journal_index() -> dict[str, dict[str, t.Any]]:
+    """Get the journal index, loading it from the config directory on the first call."""
+    global _journal_index
+    if _journal_index is None:
+        _journal_index = {}
+        index_path = get_config_dir() / JOURNAL_INDEX_FILE_NAME
+        try:
+            index = json.loads(index_path.read_bytes())
+            if index["version"] == JOURNAL_INDEX_VERSION:
+                _journal_index = index["journals"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning(f"Failed to load journal index from {index_path}.", exc_info=e)
+        else:
+            log.info(f"Loaded journal index with {len(_journal_index)} journals.")
+
+    return _journal_index
+
+
+def _save_journal_index(index_entries: dict[str, dict[str, t.Any]]) -> None:
+    """Replace the journal index with `index_entries` and atomically write it to the config directory."""
+    global _journal_index
+    _journal_index = index_entries
+
+    index_path = get_config_dir() / JOURNAL_INDEX_FILE_NAME
+    temp_path = index_path.with_stem("_TEMP" + index_path.stem)
+    try:
+        temp_path.write_text(
+            json.dumps({"version": JOURNAL_INDEX_VERSION, "journals": index_entries}),
+            encoding="utf8",
+        )
+        temp_path.replace(index_path)
+    except OSError as e:
+        log.warning(f"Failed to save journal index to {index_path}.", exc_info=e)
@@ -4,11 +4,18 @@
 from __future__ import annotations
 
 import abc
+import bisect
+import collections.abc
 import csv
 import dataclasses
+import functools
 import itertools
+import json
 import logging
+import struct
+import sys
 import typing as t
+from array import array
 from operator import attrgetter, itemgetter
 from pathlib import Path
 
@@ -19,6 +26,11 @@ if t.TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+ROUTE_SNAPSHOT_VERSION = 1
+# magic, version and the length of the json header that's followed by the column data
+_SNAPSHOT_PREFIX = struct.Struct("<4sHI")
+_SNAPSHOT_MAGIC = b"ANRS"
+
 
 class SystemEntry(abc.ABC):
     """
@@ -27,6 +39,8 @@ class SystemEntry(abc.ABC):
     This class must be subclassed by a dataclass.
     """
 
+    __slots__ = ()
+
     csv_header: t.ClassVar[tuple[str, ...]] = None  # type: ignore
     system: str
 
@@ -50,7 +64,7 @@ class SystemEntry(abc.ABC):
         """Create a list of the fields as csv."""
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class GenericPlotRow(SystemEntry):
     """Plot row of an unknown route or a route with only system names."""
 
@@ -68,7 +82,7 @@ class GenericPlotRow(SystemEntry):
         raise NotImplementedError("Can't create generic plot rows.")
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ExactPlotRow(SystemEntry):
     """One row entry of an exact plot from the Spansh Galaxy Plotter."""
 
@@ -120,7 +134,7 @@ class ExactPlotRow(SystemEntry):
         ]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NeutronPlotRow(SystemEntry):
     """One row entry of an exact plot from the Spansh Neutron Router."""
 
@@ -156,7 +170,7 @@ class NeutronPlotRow(SystemEntry):
         return [self.system, self.dist_to_arrival, self.dist_rem, "", self.jumps]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class RoadToRichesRow(SystemEntry):
     """
     One row entry of a road to riches  from the Spansh Road 2 Riches plotter.
@@ -220,29 +234,261 @@ _header_to_row_type: dict[tuple[str, ...], type[SystemEntry]] = {
     type_.csv_header: type_
     for type_ in (GenericPlotRow, NeutronPlotRow, ExactPlotRow, RoadToRichesRow)
 }
+_name_to_row_type = {type_.__name__: type_ for type_ in _header_to_row_type.values()}
 RowT = t.TypeVar("RowT", bound=SystemEntry)
 
+# array typecodes of the columns holding fields with the annotated type, other fields are held in lists
+_COLUMN_TYPECODES = {"float": "d", "int": "q", "bool": "b"}
+
+
+class RouteEntries(collections.abc.Sequence[RowT], t.Generic[RowT]):
+    """
+    Columnar storage of route rows.
+
+    Every field of `row_type` is stored in its own column, numeric fields are stored in typed arrays
+    and system names are interned.
+    Indexing returns views of the rows that read from and write to the columns,
+    and behave like instances of `row_type`.
+    """
+
+    __slots__ = (
+        "row_type",
+        "_columns",
+        "_interned_columns",
+        "_column_indices",
+        "_row_values",
+        "_view_type",
+        "_prefix_sums",
+    )
+
+    def __init__(self, row_type: type[RowT], rows: collections.abc.Iterable[RowT] = ()):
+        self.row_type = row_type
+        fields = dataclasses.fields(row_type)
+        self._columns: list[array | list] = [
+            (
+                array(typecode)
+                if (typecode := _COLUMN_TYPECODES.get(field.type)) is not None
+                else []
+            )
+            for field in fields
+        ]
+        self._interned_columns = [field.type == "str" for field in fields]
+        self._column_indices = {field.name: index for index, field in enumerate(fields)}
+        field_getter = attrgetter(*self._column_indices)
+        if len(fields) == 1:
+            self._row_values = lambda row: (field_getter(row),)
+        else:
+            self._row_values = field_getter
+        self._view_type = _row_view_type(row_type)
+        # Prefix sums of numeric columns, keyed by column index, created on the first `column_sum` call.
+        self._prefix_sums: dict[int, array] = {}
+        self.extend(rows)
+
+    def append(self, row: RowT) -> None:
+        """Append `row` to the end of the columns."""
+        for column, interned, value in zip(
+            self._columns, self._interned_columns, self._row_values(row)
+        ):
+            column.append(sys.intern(value) if interned else value)
+        for column_index, prefix_sums in self._prefix_sums.items():
+            prefix_sums.append(prefix_sums[-1] + self._columns[column_index][-1])
+
+    def extend(self, rows: collections.abc.Iterable[RowT]) -> None:
+        """Append all rows from `rows` to the end of the columns."""
+        # Transpose the rows so every column is extended in one call.
+        for column_index, (column, interned, values) in enumerate(
+            zip(
+                self._columns,
+                self._interned_columns,
+                zip(*map(self._row_values, rows)),
+            )
+        ):
+            column.extend(map(sys.intern, values) if interned else values)
+            if (prefix_sums := self._prefix_sums.get(column_index)) is not None:
+                prefix_sums.extend(
+                    itertools.islice(
+                        itertools.accumulate(values, initial=prefix_sums[-1]), 1, None
+                    )
+                )
+
+    def column(self, name: str) -> collections.abc.Sequence:
+        """Get the column of the field `name`, the returned column should not be modified."""
+        return self._columns[self._column_indices[name]]
+
+    def column_bytes(self) -> list[bytes]:
+        """
+        Get the data of every column as bytes.
+
+        Array columns are dumped in the machine's byte order,
+        string columns are encoded as utf8 with every string terminated by a null character.
+        """
+        return [
+            (
+                column.tobytes()
+                if isinstance(column, array)
+                else (("\0".join(column) + "\0") if column else "").encode("utf8")
+            )
+            for column in self._columns
+        ]
+
+    @classmethod
+    def from_column_bytes(
+        cls,
+        row_type: type[RowT],
+        column_bytes: collections.abc.Iterable[bytes],
+        *,
+        byteswap: bool = False,
+    ) -> RouteEntries[RowT]:
+        """
+        Create an instance from `column_bytes` created by `column_bytes` with rows of `row_type`.
+
+        If `byteswap` is true, the array columns were dumped in the other byte order.
+        """
+        entries = cls(row_type)
+        for column_index, data in enumerate(column_bytes):
+            column = entries._columns[column_index]
+            if isinstance(column, array):
+                column.frombytes(data)
+                if byteswap:
+                    column.byteswap()
+            else:
+                column.extend(map(sys.intern, str(data, "utf8").split("\0")[:-1]))
+        if len({len(column) for column in entries._columns}) > 1:
+            raise ValueError("Columns have different lengths.")
+        return entries
+
+    def column_sum(self, name: str, start: int = 0) -> float:
+        """
+        Get the sum of the values in the numeric column of the field `name`, starting from the row at `start`.
+
+        The sum is computed in constant time from prefix sums of the column,
+        which are kept up to date as rows are added or edited after the first call.
+        """
+        column_index = self._column_indices[name]
+        if (prefix_sums := self._prefix_sums.get(column_index)) is None:
+            column = self._columns[column_index]
+            prefix_sums = self._prefix_sums[column_index] = array(
+                column.typecode, itertools.accumulate(column, initial=0)
+            )
+        return prefix_sums[-1] - prefix_sums[min(start, len(self))]
+
+    def value(self, index: int, column: int) -> t.Any:
+        """Get the value of the `column`th field of the row at `index`."""
+        return self._columns[column][index]
+
+    def set_value(self, index: int, column: int, value: object) -> None:
+        """
+        Set the value of the `column`th field of the row at `index` to `value`.
+
+        Values set in array columns are converted to the column's type.
+        """
+        column_data = self._columns[column]
+        if isinstance(column_data, array):
+            value = float(value) if column_data.typecode == "d" else int(value)
+        elif value.__class__ is str:
+            value = sys.intern(value)
+        old_value = column_data[index]
+        column_data[index] = value
+        if (prefix_sums := self._prefix_sums.get(column)) is not None:
+            if index < 0:
+                index += len(self)
+            difference = value - old_value
+            for prefix_index in range(index + 1, len(prefix_sums)):
+                prefix_sums[prefix_index] += difference
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @t.overload
+    def __getitem__(self, index: int) -> RowT: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> list[RowT]: ...
+
+    def __getitem__(self, index: int | slice) -> RowT | list[RowT]:
+        if isinstance(index, slice):
+            return [self._view_type(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("route index out of range")
+        return self._view_type(self, index)
+
+
+@functools.cache
+def _row_view_type(row_type: type[RowT]) -> type[RowT]:
+    """
+    Create a view type for rows of `row_type` stored in `RouteEntries`.
+
+    The view subclasses `row_type`, with its fields replaced by properties accessing the columns,
+    so it keeps the `SystemEntry` interface and works with `dataclasses` functions like `astuple`.
+    Views compare equal to views and plain instances of `row_type` with the same field values.
+    """
+
+    def init(self: RowT, entries: RouteEntries[RowT], index: int) -> None:
+        self._entries = entries
+        self._index = index
+
+    def eq(self: RowT, other: object) -> bool:
+        if not isinstance(other, row_type):
+            return NotImplemented
+        return dataclasses.astuple(self) == dataclasses.astuple(other)
+
+    namespace = {
+        "__slots__": ("_entries", "_index"),
+        "__init__": init,
+        "__eq__": eq,
+    }
+    for column, field in enumerate(dataclasses.fields(row_type)):
+        namespace[field.name] = _column_property(
+            column, bool if field.type == "bool" else None
+        )
+    return type(f"{row_type.__name__}View", (row_type,), namespace)
+
+
+def _column_property(
+    column: int, converter: collections.abc.Callable[[t.Any], t.Any] | None
+) -> property:
+    """Create a property accessing the `column`th column of a row view, converting read values with `converter`."""
+
+    def getter(self: t.Any) -> t.Any:
+        value = self._entries.value(self._index, column)
+        return value if converter is None else converter(value)
+
+    def setter(self: t.Any, value: object) -> None:
+        self._entries.set_value(self._index, column, value)
+
+    return property(getter, setter)
+
 
 class Route(abc.ABC, t.Generic[RowT]):
     """
     A route of `SystemEntry` entries.
 
     When instantiated, an appropriate subclass is returned that can work with row specific data.
+    `populating` is True while rows are still being appended to the route as it's decoded,
+    and `truncated` is set if decoding failed before the whole route was appended.
     """
 
     _row_type_to_route_class = {}
     row_type: type[RowT] | None = None
+    # Keys leading to the array of row objects in Spansh's json result, None if the route can't be created from json.
+    json_rows_path: t.ClassVar[tuple[str, ...] | None] = None
 
     def __init_subclass__(cls, **kwargs):
         if hasattr(cls, "__orig_bases__"):
             cls._row_type_to_route_class[cls.__orig_bases__[0].__args__[0]] = cls
             cls.row_type = cls.__orig_bases__[0].__args__[0]
 
-    def __init__(self, route: list[RowT]):
-        self.entries = route
-        self._route_indices: dict[str, list[int]] = {}
+    def __init__(self, route: collections.abc.Iterable[RowT]):
+        if not isinstance(route, RouteEntries):
+            route = RouteEntries(self.row_type, route)
+        self.entries: RouteEntries[RowT] = route
+        # Built on the first `system_index` call so creating routes doesn't scan them.
+        self._route_indices: dict[str, list[int]] | None = None
         self._index = 0
-        self.update_indices()
+        self.populating = False
+        self.truncated = False
 
     @property
     def index(self) -> int:
@@ -268,10 +514,15 @@ class Route(abc.ABC, t.Generic[RowT]):
         """The remaining jumps of this route."""  # noqa: D401
         return len(self.entries) - self.index
 
+    @property
+    def total_distance(self) -> float | None:
+        """The total distance of this route in ly, or None if the route has no distances."""  # noqa: D401
+        return None
+
     @property
     def current_system(self) -> str:
         """The current system in the route."""  # noqa: D401
-        return self.entries[self.index].system
+        return self.entries.column("system")[self.index]
 
     def system_index(self, system: str) -> int:
         """
@@ -280,21 +531,43 @@ class Route(abc.ABC, t.Generic[RowT]):
         If the system appears multiple times in the route, try to get the find the first entry after the current index,
         if none is found return the index of the first occurrence.
         """
+        if self._route_indices is None:
+            self._route_indices = {}
+            for index, route_system in enumerate(self.entries.column("system")):
+                self._route_indices.setdefault(route_system, []).append(index)
+
         if (indices := self._route_indices.get(system)) is None:
             raise ValueError(f"System {system!r} not in route.")
 
-        try:
-            return more_itertools.first(
-                index for index in indices if index > self.index
-            )
-        except ValueError:
-            return indices[0]
+        position = bisect.bisect_right(indices, self.index)
+        if position < len(indices):
+            return indices[position]
+        return indices[0]
+
+    def update_indices(
+        self, index: int | None = None, previous_system: str | None = None
+    ) -> None:
+        """
+        Update system indices used in `system_index`.
 
-    def update_indices(self) -> None:
-        """Update system indices used in `system_index`."""
-        self._route_indices.clear()
-        for index, row in enumerate(self.entries):
-            self._route_indices.setdefault(row.system, []).append(index)
+        If `index` is passed, only the row at `index` which previously had `previous_system` as its system is updated,
+        otherwise the indices of the whole route are rebuilt on the next `system_index` call.
+        """
+        if index is None:
+            self._route_indices = None
+            return
+        if self._route_indices is None:
+            return
+
+        system = self.entries.column("system")[index]
+        if system == previous_system:
+            return
+        if previous_system is not None:
+            indices = self._route_indices[previous_system]
+            del indices[bisect.bisect_left(indices, index)]
+            if not indices:
+                del self._route_indices[previous_system]
+        bisect.insort(self._route_indices.setdefault(system, []), index)
 
     @classmethod
     @t.final
@@ -312,21 +585,17 @@ class Route(abc.ABC, t.Generic[RowT]):
 
             cls = cls._row_type_to_route_class[row_type]
             log.info(f"CSV file at {path} is of type {row_type.__name__}.")
-            route = cls.route_rows_from_csv(reader)
-
-        return cls(route)
+            return cls(cls.route_rows_from_csv(reader))
 
     @classmethod
     def route_rows_from_csv(
         cls,
         reader: more_itertools.peekable[list[str]],
-    ) -> list[RowT]:
+    ) -> collections.abc.Iterable[RowT]:
         """Get route rows for `row_type` from `reader`."""
-        return list(
-            more_itertools.unique_justseen(
-                (cls.row_type.from_csv_row(row) for row in filter(None, reader)),
-                key=attrgetter("system"),
-            )
+        return more_itertools.unique_justseen(
+            (cls.row_type.from_csv_row(row) for row in filter(None, reader)),
+            key=attrgetter("system"),
         )
 
     @t.final
@@ -337,6 +606,55 @@ class Route(abc.ABC, t.Generic[RowT]):
             writer.writerow(self.row_type.csv_header)
             writer.writerows(row.to_csv() for row in self.entries)
 
+    @t.final
+    def to_snapshot_file(self, path: Path) -> None:
+        """Atomically save this route and its index to a binary snapshot file at `path`."""
+        column_bytes = self.entries.column_bytes()
+        header = json.dumps(
+            {
+                "row_type": self.row_type.__name__,
+                "index": self.index,
+                "byteorder": sys.byteorder,
+                "column_sizes": [len(data) for data in column_bytes],
+            }
+        ).encode("utf8")
+        temp_path = path.with_stem("_TEMP" + path.stem)
+        with temp_path.open("wb") as snapshot_file:
+            snapshot_file.write(
+                _SNAPSHOT_PREFIX.pack(
+                    _SNAPSHOT_MAGIC, ROUTE_SNAPSHOT_VERSION, len(header)
+                )
+            )
+            snapshot_file.write(header)
+            snapshot_file.writelines(column_bytes)
+        temp_path.replace(path)
+
+    @classmethod
+    @t.final
+    def from_snapshot_file(cls, path: Path) -> Route:
+        """Create an instance with its saved index from the snapshot file at `path` created by `to_snapshot_file`."""
+        data = memoryview(path.read_bytes())
+        magic, version, header_size = _SNAPSHOT_PREFIX.unpack_from(data)
+        if magic != _SNAPSHOT_MAGIC or version != ROUTE_SNAPSHOT_VERSION:
+            raise ValueError(
+                f"{path} is not a version {ROUTE_SNAPSHOT_VERSION} route snapshot."
+            )
+        position = _SNAPSHOT_PREFIX.size + header_size
+        header = json.loads(bytes(data[_SNAPSHOT_PREFIX.size : position]))
+
+        row_type = _name_to_row_type[header["row_type"]]
+        column_bytes = []
+        for size in header["column_sizes"]:
+            column_bytes.append(data[position : position + size])
+            position += size
+        route = cls._row_type_to_route_class[row_type](
+            RouteEntries.from_column_bytes(
+                row_type, column_bytes, byteswap=header["byteorder"] != sys.byteorder
+            )
+        )
+        route.index = header["index"]
+        return route
+
     @classmethod
     @abc.abstractmethod
     def from_json(cls, json_dict: dict) -> te.Self:
@@ -354,49 +672,59 @@ class GenericRoute(Route[GenericPlotRow]):
 class NeutronRoute(Route[NeutronPlotRow]):
     """A route of the Spansh neutron plotter."""
 
+    json_rows_path: t.ClassVar = ("system_jumps",)
+
     @classmethod
     def from_json(cls, json_dict: dict) -> NeutronRoute:  # noqa: D102
-        route = [
+        return NeutronRoute(
             NeutronPlotRow.from_json(system_json)
             for system_json in json_dict["system_jumps"]
-        ]
-        return NeutronRoute(route)
+        )
 
     @property
     def total_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries)
+        return self.entries.column_sum("jumps")
 
     @property
     def remaining_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries[self.index :])
+        return self.entries.column_sum("jumps", self.index)
+
+    @property
+    def total_distance(self) -> float:  # noqa: D102
+        return self.entries.column_sum("dist_to_arrival")
 
 
 class ExactRoute(Route[ExactPlotRow]):
     """A route of the Spansh galaxy plotter."""
 
+    json_rows_path: t.ClassVar = ("jumps",)
+
     @classmethod
     def from_json(cls, json_dict: dict) -> ExactRoute:  # noqa: D102
-        route = [
+        return ExactRoute(
             ExactPlotRow.from_json(system_json) for system_json in json_dict["jumps"]
-        ]
-        return ExactRoute(route)
+        )
+
+    @property
+    def total_distance(self) -> float:  # noqa: D102
+        return self.entries.column_sum("dist")
 
 
 class RoadToRichesRoute(Route[RoadToRichesRow]):
     """A route of the Spansh Road 2 Riches plotter."""
 
+    json_rows_path: t.ClassVar = ()
+
     @classmethod
     def route_rows_from_csv(
         cls,
         reader: more_itertools.peekable[list[str]],
-    ) -> list[RowT]:
+    ) -> collections.abc.Iterator[RowT]:
         """
         Get the route from `reader`.
 
         All successive bodies in a single system are added to a single `RoadToRichesRow`.
         """
-        route = []
-
         for system_name, bodies in itertools.groupby(reader, itemgetter(0)):
             bodies = list(bodies)
             jumps = int(bodies[0][7])
@@ -406,26 +734,203 @@ class RoadToRichesRoute(Route[RoadToRichesRow]):
                 total_scan_value += int(body[5])
                 total_mapping_value += int(body[6])
 
-            route.append(
-                RoadToRichesRow(
-                    system_name,
-                    len(bodies),
-                    total_scan_value,
-                    total_mapping_value,
-                    jumps,
-                )
+            yield RoadToRichesRow(
+                system_name,
+                len(bodies),
+                total_scan_value,
+                total_mapping_value,
+                jumps,
             )
-        return route
 
     @classmethod
     def from_json(cls, json_dict: dict) -> te.Self:  # noqa: D102
-        route = [RoadToRichesRow.from_json(system_json) for system_json in json_dict]
-        return RoadToRichesRoute(route)
+        return RoadToRichesRoute(
+            RoadToRichesRow.from_json(system_json) for system_json in json_dict
+        )
 
     @property
     def total_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries)
+        return self.entries.column_sum("jumps")
 
     @property
     def remaining_jumps(self) -> int:  # noqa: D102
-        return sum(entry.jumps for entry in self.entries[self.index :])
+        return self.entries.column_sum("jumps", self.index)
+
+
+class RouteFileIndex:
+    """
+    Index of the byte offsets of the route rows in a route CSV file at `path`.
+
+    The file is scanned once when the index is created,
+    route rows are only parsed from the file when they're requested through `peek`.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._offsets = array("q")
+        with path.open("rb") as csv_file:
+            header_line = csv_file.readline()
+            header = tuple(
+                next(csv.reader([header_line.decode("utf8")], strict=True), ())
+            )
+            try:
+                self.row_type = _header_to_row_type[header]
+                position = len(header_line)
+            except KeyError:
+                # unknown route type, fall back to generic route with the header being a row.
+                self.row_type = GenericPlotRow
+                position = 0
+                csv_file.seek(0)
+            self.route_type: type[Route] = Route._row_type_to_route_class[self.row_type]
+
+            # A route row starts at every line with a system different from the previous line's,
+            # to match the deduplication and grouping done when a route is loaded.
+            previous_key = None
+            for line in csv_file:
+                key = _csv_line_key(line)
+                if key is not None and key != previous_key:
+                    self._offsets.append(position)
+                    previous_key = key
+                position += len(line)
+            self._end = position
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def peek(self, *indices: int) -> list[SystemEntry]:
+        """Parse the route rows at `indices` from the file, without loading the other rows."""
+        rows = []
+        with self.path.open("rb") as csv_file:
+            for index in indices:
+                if index < 0:
+                    index += len(self)
+                if not 0 <= index < len(self):
+                    raise IndexError("route index out of range")
+                start = self._offsets[index]
+                if index + 1 < len(self):
+                    end = self._offsets[index + 1]
+                else:
+                    end = self._end
+                csv_file.seek(start)
+                lines = csv_file.read(end - start).decode("utf8").splitlines()
+                reader = more_itertools.peekable(
+                    filter(None, csv.reader(lines, strict=True))
+                )
+                rows.append(
+                    more_itertools.one(self.route_type.route_rows_from_csv(reader))
+                )
+        return rows
+
+    def load(self) -> Route:
+        """Load the whole route from the file."""
+        return Route.from_csv_file(self.path)
+
+
+def _csv_line_key(line: bytes) -> bytes | None:
+    """Get the raw system name from the first field of a CSV `line`, or None if the line is empty."""
+    line = line.rstrip(b"\r\n")
+    if not line:
+        return None
+    if not line.startswith(b'"'):
+        return line.split(b",", 1)[0]
+    end = line.find(b'"', 1)
+    # Doubled quotes are an escaped quote inside of the field.
+    while end != -1 and line[end + 1 : end + 2] == b'"':
+        end = line.find(b'"', end + 2)
+    if end == -1:
+        return line
+    return line[1:end]
+
+
+class RouteProgressLog:
+    """
+    Save `route` to a snapshot at `snapshot_path`, and its later changes to an append-only log at `log_path`.
+
+    The log holds json lines, starting with the size and modification time of the snapshot it applies to,
+    followed by the route's index changes and edits of its rows.
+    After `compact_after` changes are logged, a new snapshot is saved and the log is restarted.
+    """
+
+    def __init__(
+        self,
+        route: Route,
+        snapshot_path: Path,
+        log_path: Path,
+        *,
+        compact_after: int = 1000,
+    ):
+        self.route = route
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.compact_after = compact_after
+        self._log_file: t.TextIO | None = None
+        self._logged_changes = 0
+
+    def save_snapshot(self) -> None:
+        """Save the route to a new snapshot and restart the log."""
+        self.close()
+        self.route.to_snapshot_file(self.snapshot_path)
+        stat = self.snapshot_path.stat()
+        self._log_file = self.log_path.open("w", encoding="utf8")
+        self._write({"snapshot": [stat.st_size, stat.st_mtime_ns]})
+        self._logged_changes = 0
+
+    def log_index(self, index: int) -> None:
+        """Log a change of the route's index to `index`."""
+        self._log_change({"index": index})
+
+    def log_edit(self, row: int, column: int, value: object) -> None:
+        """Log an edit of the `column`th field of the route's row at `row` to `value`."""
+        self._log_change({"edit": [row, column, value]})
+
+    def close(self) -> None:
+        """Close the log file, changes logged after this start a new snapshot."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+    def _log_change(self, change: dict[str, t.Any]) -> None:
+        """Append `change` to the log, or save a new snapshot if there's no log or the log should be compacted."""
+        if self._log_file is None or self._logged_changes >= self.compact_after:
+            # The route already holds the change, so the new snapshot includes it.
+            log.debug(f"Compacting route progress log at {self.log_path}.")
+            self.save_snapshot()
+            return
+        self._write(change)
+        self._logged_changes += 1
+
+    def _write(self, record: dict[str, t.Any]) -> None:
+        """Write `record` to the log as a json line and flush it."""
+        self._log_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._log_file.flush()
+
+    @staticmethod
+    def restore(snapshot_path: Path, log_path: Path) -> Route:
+        """
+        Load the route from the snapshot at `snapshot_path` and replay the changes from the log at `log_path`.
+
+        The log is ignored if it was written for a different snapshot,
+        and replaying stops at the first incomplete record in case it wasn't fully written.
+        """
+        stat = snapshot_path.stat()
+        route = Route.from_snapshot_file(snapshot_path)
+        try:
+            with log_path.open(encoding="utf8") as log_file:
+                header = json.loads(log_file.readline())
+                if header.get("snapshot") != [stat.st_size, stat.st_mtime_ns]:
+                    log.info(f"Route progress log at {log_path} is outdated.")
+                    return route
+
+                for line in log_file:
+                    change = json.loads(line)
+                    if (index := change.get("index")) is not None:
+                        route.index = index
+                    elif (edit := change.get("edit")) is not None:
+                        row, column, value = edit
+                        route.entries[row][column] = value
+                        route.update_indices()
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            log.warning(f"Incomplete record in route progress log at {log_path}.")
+        return route
@@ -0,0 +1,164 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import collections.abc
+import hashlib
+import json
+import logging
+import time
+import typing as t
+
+from auto_neutron.route import Route
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+ROUTE_CACHE_VERSION = 1
+
+
+class RouteCache:
+    """
+    Cache of plotted Spansh routes in `directory`, keyed by the endpoint and normalized request parameters.
+
+    Routes are saved as snapshots next to an index of the cached routes ordered from the least recently used.
+    Routes older than `ttl` seconds are not used,
+    and the least recently used routes are evicted when the cache holds more than
+    `max_entries` routes or `max_bytes` bytes of snapshots.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        ttl: float = 24 * 60 * 60,
+        max_entries: int = 50,
+        max_bytes: int = 50 * 1024 * 1024,
+        clock: collections.abc.Callable[[], float] = time.time,
+    ):
+        self._directory = directory
+        self._index_path = directory / "index.json"
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: dict[str, dict[str, t.Any]] | None = None
+
+    def get(self, endpoint: str, params: collections.abc.Mapping) -> Route | None:
+        """Get the cached route for a request to `endpoint` with `params`, or None if it isn't cached."""
+        entries = self._get_entries()
+        key = request_key(endpoint, params)
+        if (entry := entries.get(key)) is None:
+            return None
+        if self._clock() - entry["created"] > self._ttl:
+            log.debug(f"Evicting expired route {key} from cache.")
+            self._evict(key)
+            self._save_entries()
+            return None
+        try:
+            route = Route.from_snapshot_file(self._snapshot_path(key))
+        except Exception as e:
+            log.warning(f"Failed to load cached route {key}.", exc_info=e)
+            self._evict(key)
+            self._save_entries()
+            return None
+
+        entries[key] = entries.pop(key)
+        self._save_entries()
+        log.info(f"Using cached route {key} for {endpoint}.")
+        return route
+
+    def put(self, endpoint: str, params: collections.abc.Mapping, route: Route) -> None:
+        """Cache `route` as the result of a request to `endpoint` with `params`."""
+        entries = self._get_entries()
+        key = request_key(endpoint, params)
+        snapshot_path = self._snapshot_path(key)
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            route.to_snapshot_file(snapshot_path)
+            size = snapshot_path.stat().st_size
+        except OSError as e:
+            log.warning(f"Failed to cache route {key}.", exc_info=e)
+            return
+
+        entries.pop(key, None)
+        entries[key] = {"endpoint": endpoint, "created": self._clock(), "size": size}
+        total_size = sum(entry["size"] for entry in entries.values())
+        while len(entries) > self._max_entries or total_size > self._max_bytes:
+            oldest_key = next(iter(entries))
+            total_size -= entries[oldest_key]["size"]
+            log.debug(f"Evicting least recently used route {oldest_key} from cache.")
+            self._evict(oldest_key)
+        self._save_entries()
+
+    def clear(self) -> None:
+        """Remove all cached routes."""
+        for key in list(self._get_entries()):
+            self._evict(key)
+        self._save_entries()
+
+    def _snapshot_path(self, key: str) -> Path:
+        return self._directory / f"{key}.snapshot"
+
+    def _evict(self, key: str) -> None:
+        """Remove the route under `key` from the index and delete its snapshot."""
+        del self._entries[key]
+        try:
+            self._snapshot_path(key).unlink(missing_ok=True)
+        except OSError as e:
+            log.warning(f"Failed to delete cached route {key}.", exc_info=e)
+
+    def _get_entries(self) -> dict[str, dict[str, t.Any]]:
+        """Get the index entries, loading them from the index file on the first call."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                index = json.loads(self._index_path.read_bytes())
+                if index["version"] == ROUTE_CACHE_VERSION:
+                    self._entries = index["routes"]
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.warning(
+                    f"Failed to load route cache index from {self._index_path}.",
+                    exc_info=e,
+                )
+        return self._entries
+
+    def _save_entries(self) -> None:
+        """Atomically write the index entries to the index file."""
+        temp_path = self._index_path.with_stem("_TEMP" + self._index_path.stem)
+        try:
+            temp_path.write_text(
+                json.dumps({"version": ROUTE_CACHE_VERSION, "routes": self._entries}),
+                encoding="utf8",
+            )
+            temp_path.replace(self._index_path)
+        except OSError as e:
+            log.warning(
+                f"Failed to save route cache index to {self._index_path}.", exc_info=e
+            )
+
+
+def request_key(endpoint: str, params: collections.abc.Mapping) -> str:
+    """
+    Get the cache key of a request to `endpoint` with `params`.
+
+    System names are matched case insensitively by Spansh, so strings are compared stripped and casefolded,
+    and floats are rounded to ignore representation differences of spinbox values.
+    """
+    normalized = {}
+    for name, value in params.items():
+        if isinstance(value, str):
+            value = value.strip().casefold()
+        elif isinstance(value, bool):
+            value = int(value)
+        elif isinstance(value, float):
+            value = round(value, 6)
+        normalized[name] = value
+    return hashlib.sha256(
+        json.dumps([endpoint, normalized], sort_keys=True).encode()
+    ).hexdigest()
@@ -12,7 +12,7 @@ from PySide6.QtGui import QFont
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron import Theme
-from auto_neutron.constants import AHK_USER_SCRIPT_TEMPLATE
+from auto_neutron.constants import AHK_USER_SCRIPT_TEMPLATE, SPANSH_API_URL
 
 from .category_meta import SettingsCategory, SettingsParams
 
@@ -30,6 +30,7 @@ class General(metaclass=SettingsCategory):  # noqa: D101
     locale: t.Annotated[str, SettingsParams("en")]
     last_checked_release: t.Annotated[str, SettingsParams("")]
     loop_routes: t.Annotated[bool, SettingsParams(False)]
+    spansh_api_url: t.Annotated[str, SettingsParams(SPANSH_API_URL)]
 
 
 class AHK(metaclass=SettingsCategory):  # noqa: D101
@@ -3,52 +3,419 @@
 
 from __future__ import annotations
 
+import abc
 import collections.abc
 import logging
+import random
+import time
 import typing as t
 from functools import partial
 
 from PySide6 import QtCore, QtNetwork
 from __feature__ import snake_case, true_property  # noqa: F401
 
-from auto_neutron.constants import SPANSH_API_URL
+from auto_neutron import settings
 from auto_neutron.route import Route
+from auto_neutron.route_cache import RouteCache
+from auto_neutron.utils.json_stream import StreamingArrayDecoder
 from auto_neutron.utils.network import (
     NetworkError,
     json_from_network_req,
     make_network_request,
 )
+from auto_neutron.utils.telemetry import request_telemetry
+from auto_neutron.utils.utils import create_request_delay_iterator
 
 log = logging.getLogger(__name__)
 
 
-class SpanshRequestManager:
-    """Track the current reply from Spansh to allow termination."""
+class PollStrategy(abc.ABC):
+    """
+    Decide how long to wait before re-requesting the result of a queued Spansh job.
 
-    def __init__(self, parent: QtCore.QObject):
-        self._current_reply = None
-        self._delay_timer = QtCore.QTimer(parent)
-        self._delay_timer.single_shot_ = True
-        self._timer_connection = None
+    A new instance is used for every job, the job times out after `timeout` seconds from the instance's creation.
+    """
 
-    def _reply_callback(
+    def __init__(
         self,
-        reply: QtNetwork.QNetworkReply,
+        *,
+        timeout: float | None = None,
+        clock: collections.abc.Callable[[], float] = time.monotonic,
+    ):
+        self._timeout = timeout
+        self._clock = clock
+        self._started = clock()
+
+    def next_delay(self, job_response: dict) -> float | None:
+        """Get the delay in seconds before the next poll after the queued `job_response`, or None if the job timed out."""
+        delay = self._delay(job_response)
+        if self._timeout is None:
+            return delay
+        remaining = self._timeout - (self._clock() - self._started)
+        if remaining <= 0:
+            return None
+        return min(delay, remaining)
+
+    @abc.abstractmethod
+    def _delay(self, job_response: dict) -> float:
+        """Get the delay in seconds before the next poll after the queued `job_response`."""
+
+
+class ScheduledPollStrategy(PollStrategy):
+    """Poll with the delays from `delays`, or from the default request delay iterator."""
+
+    def __init__(
+        self,
+        delays: collections.abc.Iterator[float] | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(**kwargs)
+        if delays is None:
+            delays = create_request_delay_iterator()
+        self._delays = delays
+
+    def _delay(self, job_response: dict) -> float:
+        return next(self._delays)
+
+
+class AdaptivePollStrategy(PollStrategy):
+    """
+    Poll quickly at first and back off geometrically, following the job's progress when Spansh reports it.
+
+    The backoff delay starts at `min_delay` and is multiplied by `backoff` after every poll, up to `max_delay`.
+    If the queued response contains an `eta` in seconds, the next poll is made when the job is expected to finish,
+    and if it contains a `queue_position`, the delay is `seconds_per_position` for every job in front of it.
+    Every delay is randomly scaled by up to `jitter` to spread out polls from many clients,
+    delays from the job's progress are only scaled up so the poll isn't made before the job is expected to finish.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_delay: float = 0.5,
+        max_delay: float = 5,
+        backoff: float = 1.25,
+        seconds_per_position: float = 2,
+        jitter: float = 0.1,
+        timeout: float | None = 600,
+        rng: random.Random | None = None,
+        **kwargs: t.Any,
+    ):
+        super().__init__(timeout=timeout, **kwargs)
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._backoff = backoff
+        self._seconds_per_position = seconds_per_position
+        self._jitter = jitter
+        self._rng = rng if rng is not None else random.Random()
+        self._next_backoff_delay = min_delay
+
+    def _delay(self, job_response: dict) -> float:
+        delay = self._next_backoff_delay
+        self._next_backoff_delay = min(delay * self._backoff, self._max_delay)
+
+        eta = job_response.get("eta")
+        queue_position = job_response.get("queue_position")
+        min_jitter = 1
+        if isinstance(eta, int | float) and eta > 0:
+            delay = eta
+        elif isinstance(queue_position, int) and queue_position > 0:
+            delay = queue_position * self._seconds_per_position
+        else:
+            min_jitter = 1 - self._jitter
+
+        delay *= self._rng.uniform(min_jitter, 1 + self._jitter)
+        return min(max(delay, self._min_delay), self._max_delay)
+
+
+class SpanshJob:
+    """
+    Handle of a route plotting job submitted to Spansh through a `SpanshRequestManager`.
+
+    `route` is set to the decoded route when it's passed to the result callback, or `error` to the error message
+    if the job fails. A route passed to the callback early is still `populating` until the job finishes.
+    """
+
+    def __init__(
+        self,
+        manager: SpanshRequestManager,
+        endpoint: str,
+        params: collections.abc.Mapping,
+        route_type: type[Route],
+        *,
+        result_callback: collections.abc.Callable[[Route], t.Any],
+        error_callback: collections.abc.Callable[[str], t.Any],
+        early_result_rows: int | None = None,
+    ):
+        self.endpoint = endpoint
+        self.params = params
+        self.route_type = route_type
+        self.route: Route | None = None
+        self.error: str | None = None
+        self.aborted = False
+
+        self._manager = manager
+        self._result_callback = result_callback
+        self._error_callback = error_callback
+        self._early_result_rows = early_result_rows
+        self._poll_strategy: PollStrategy | None = None
+        self._reply: QtNetwork.QNetworkReply | None = None
+        self._decoder: StreamingArrayDecoder | None = None
+        self._streamed_route: Route | None = None
+        self._job_id: str | None = None
+        self._next_poll_at: float | None = None
+        self._polls = 0
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job's route was received, or it failed or was aborted."""  # noqa: D401
+        return self.aborted or self.route is not None or self.error is not None
+
+    def abort(self) -> None:
+        """Abort the job, no callbacks are called afterwards."""
+        self._manager._abort_job(self)
+
+
+class RouteComparison(t.NamedTuple):
+    """Summary of a route, to compare routes plotted with different parameters side by side."""
+
+    params: collections.abc.Mapping
+    total_jumps: int | None
+    total_distance: float | None
+    error: str | None
+
+    @classmethod
+    def from_route(
+        cls, params: collections.abc.Mapping, route: Route
+    ) -> RouteComparison:
+        """Summarize `route` plotted with `params`."""
+        return cls(params, route.total_jumps, route.total_distance, None)
+
+    @classmethod
+    def from_job(cls, job: SpanshJob) -> RouteComparison:
+        """Summarize the route of `job`, its totals are None until the route is fully decoded."""
+        if job.route is None or job.route.populating:
+            return cls(job.params, None, None, job.error)
+        return cls.from_route(job.params, job.route)
+
+
+class SpanshRequestManager(QtCore.QObject):
+    """
+    Run route plotting jobs on Spansh, up to `max_concurrent` of them at once.
+
+    Jobs submitted past the limit wait until a running job finishes.
+    Jobs are sent to `api_url`, or the Spansh API URL setting if it's None.
+    Queued jobs are polled with delays from poll strategies created by `poll_strategy_factory`,
+    through a single timer shared by all jobs. Jobs due within `poll_batch_window` seconds
+    of the earliest one are polled together.
+    Plotted routes can be looked up in and are added to `route_cache`.
+
+    Routes passed to result callbacks before they're fully decoded emit `route_rows_decoded`
+    with the route and the index of its first new row when rows are appended to them,
+    and `route_populated` when they stop being populated.
+    If their job fails instead, the routes are marked as truncated
+    and `route_decode_failed` is emitted with the route and the error message.
+    """
+
+    route_rows_decoded = QtCore.Signal(object, int)
+    route_populated = QtCore.Signal(object)
+    route_decode_failed = QtCore.Signal(object, str)
+
+    def __init__(
+        self,
+        parent: QtCore.QObject | None = None,
+        *,
+        max_concurrent: int = 4,
+        api_url: str | None = None,
+        poll_strategy_factory: collections.abc.Callable[
+            [], PollStrategy
+        ] = AdaptivePollStrategy,
+        poll_batch_window: float = 0.25,
+        route_cache: RouteCache | None = None,
+    ):
+        super().__init__(parent)
+        self.max_concurrent = max_concurrent
+        self._api_url = api_url
+        self.poll_strategy_factory = poll_strategy_factory
+        self.route_cache = route_cache
+        self._poll_batch_window = poll_batch_window
+        self._running_jobs = list[SpanshJob]()
+        self._pending_jobs = collections.deque[SpanshJob]()
+
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.single_shot_ = True
+        self._poll_timer.timeout.connect(self._poll_due_jobs)
+
+    @property
+    def api_url(self) -> str:
+        """The base URL of the Spansh API jobs are sent to."""  # noqa: D401
+        if self._api_url is not None:
+            return self._api_url
+        return settings.General.spansh_api_url
+
+    def cached_route(
+        self, endpoint: str, params: collections.abc.Mapping
+    ) -> Route | None:
+        """Get the route plotted by `endpoint` with `params` from the route cache, or None if it's not cached."""
+        if self.route_cache is None:
+            return None
+        return self.route_cache.get(f"{self.api_url}/{endpoint}", params)
+
+    def submit(
+        self,
+        endpoint: str,
+        params: collections.abc.Mapping,
+        route_type: type[Route],
         *,
         result_callback: collections.abc.Callable[[Route], t.Any],
         error_callback: collections.abc.Callable[[str], t.Any],
-        delay_iterator: collections.abc.Iterator[float],
-        result_decode_func: collections.abc.Callable[[dict], t.Any],
+        early_result_rows: int | None = None,
+    ) -> SpanshJob:
+        """
+        Submit a job plotting a `route_type` route to `endpoint` with `params`.
+
+        `result_callback` is called with the decoded route, or `error_callback` with an error message.
+        If `early_result_rows` is passed, `result_callback` is called as soon as the route has that many rows,
+        while the rest of it is still being decoded. The error callback isn't called after that,
+        failures emit `route_decode_failed` instead.
+        """
+        job = SpanshJob(
+            self,
+            endpoint,
+            params,
+            route_type,
+            result_callback=result_callback,
+            error_callback=error_callback,
+            early_result_rows=early_result_rows,
+        )
+        if len(self._running_jobs) < self.max_concurrent:
+            self._start_job(job)
+        else:
+            log.debug(f"Delaying job to {endpoint}, {self.max_concurrent} are running.")
+            self._pending_jobs.append(job)
+        return job
+
+    def abort(self) -> None:
+        """Abort all running and pending jobs, routes that were already passed to result callbacks are completed."""
+        for job in [*self._running_jobs, *self._pending_jobs]:
+            self._abort_job(job)
+
+    @property
+    def jobs(self) -> list[SpanshJob]:
+        """The running and pending jobs."""  # noqa: D401
+        return [*self._running_jobs, *self._pending_jobs]
+
+    def _start_job(self, job: SpanshJob) -> None:
+        """Send the request creating `job` on Spansh."""
+        self._running_jobs.append(job)
+        job._poll_strategy = self.poll_strategy_factory()
+        self._send_job_request(job, f"{self.api_url}/{job.endpoint}", job.params)
+
+    def _send_job_request(
+        self,
+        job: SpanshJob,
+        url: str,
+        params: collections.abc.Mapping = {},  # noqa: B006
+    ) -> None:
+        """
+        Send a request for `job` to `url`, decoding the route rows of the response as they're received.
+
+        The rows are added to the job's streamed route so the full response is never held in memory.
+        """
+        job._decoder = StreamingArrayDecoder(("result", *job.route_type.json_rows_path))
+        job._streamed_route = job.route_type([])
+        job._streamed_route.populating = True
+        job._reply = reply = make_network_request(
+            url,
+            params=params,
+            finished_callback=partial(self._reply_callback, job),
+        )
+        reply.readyRead.connect(partial(self._ready_read_callback, job, reply))
+
+    def _ready_read_callback(
+        self, job: SpanshJob, reply: QtNetwork.QNetworkReply
     ) -> None:
+        """Decode the received route rows, fail the job and abort `reply` if they're invalid."""
+        try:
+            self._decode_received(job, reply)
+        except Exception as e:
+            log.error(e)
+            self._fail_job(job, _("Received invalid response from Spansh."))
+            reply.abort()
+
+    def _decode_received(self, job: SpanshJob, reply: QtNetwork.QNetworkReply) -> None:
+        """Decode the route rows from the data `reply` received so far, error responses are left for the callback."""
+        status = reply.attribute(
+            QtNetwork.QNetworkRequest.Attribute.HttpStatusCodeAttribute
+        )
+        if status is not None and status >= 400:
+            return
+        row_type = job.route_type.row_type
+        route = job._streamed_route
+        first_row = len(route.entries)
+        route.entries.extend(
+            row_type.from_json(row_json)
+            for row_json in job._decoder.feed(reply.read_all().data())
+        )
+        if len(route.entries) == first_row:
+            return
+        route.update_indices()
+
+        if job.route is route:
+            self.route_rows_decoded.emit(route, first_row)
+        elif (
+            job._early_result_rows is not None
+            and len(route.entries) >= job._early_result_rows
+        ):
+            log.debug(f"Passing on route from {job.endpoint} while it's decoded.")
+            job.route = route
+            job._result_callback(route)
+
+    def _abort_job(self, job: SpanshJob) -> None:
+        if job.finished:
+            return
+        log.debug(f"Aborting route plot job to {job.endpoint}.")
+        job.aborted = True
+        if job in self._pending_jobs:
+            self._pending_jobs.remove(job)
+            return
+        if job._reply is not None:
+            job._reply.abort()
+        self._finish_job(job)
+
+    def _finish_job(self, job: SpanshJob) -> None:
+        """Remove `job` from the running jobs and start the next pending job."""
+        if not job.aborted:
+            request_telemetry.record_retries(
+                f"{self.api_url}/{job.endpoint}", job._polls
+            )
+        self._running_jobs.remove(job)
+        job._reply = None
+        job._next_poll_at = None
+        if self._pending_jobs and len(self._running_jobs) < self.max_concurrent:
+            self._start_job(self._pending_jobs.popleft())
+        self._schedule_poll()
+
+    def _reply_callback(self, job: SpanshJob, reply: QtNetwork.QNetworkReply) -> None:
         """
-        Handle a Spansh job reply, wait until a response is available and then return `result_decode_func` applied to it.
+        Handle a Spansh job reply, poll the job again if it's queued, or finish it with its route or an error.
 
-        When re-requesting for status, wait for `delay` seconds,
-        where `delay` is the next value from the `delay_iterator`
+        When re-requesting for status, wait for the delay from the job's poll strategy,
+        the job fails if the strategy timed it out.
         """
-        self._reset_reply()
+        job._reply = None
         try:
-            job_response = json_from_network_req(reply, json_error_key="error")
+            if reply.error() is not QtNetwork.QNetworkReply.NetworkError.NoError:
+                # Raises with the error from the response, which wasn't streamed.
+                json_from_network_req(reply, json_error_key="error")
+            reply.delete_later()
+            try:
+                self._decode_received(job, reply)
+                job_response = job._decoder.finish()
+            except Exception as e:
+                log.error(e)
+                self._fail_job(job, _("Received invalid response from Spansh."))
+                return
         except NetworkError as e:
             if (
                 e.error_type
@@ -57,64 +424,84 @@ class SpanshRequestManager:
                 return
 
             if e.reply_error is not None:
-                error_callback(
-                    _("Received error from Spansh: {}").format(e.reply_error)
+                self._fail_job(
+                    job, _("Received error from Spansh: {}").format(e.reply_error)
                 )
             else:
-                error_callback(
-                    e.error_message
-                )  # Fall back to Qt error message if spansh didn't respond
+                # Fall back to Qt error message if spansh didn't respond
+                self._fail_job(job, e.error_message)
         except Exception as e:
-            error_callback(str(e))
             log.error(e)
+            self._fail_job(job, str(e))
         else:
+            if job.aborted:
+                return
             if job_response.get("status") == "queued":
-                sec_delay = next(delay_iterator)
+                sec_delay = job._poll_strategy.next_delay(job_response)
+                if sec_delay is None:
+                    log.info(f"Spansh job {job_response['job']} timed out.")
+                    self._fail_job(
+                        job, _("Timed out waiting for Spansh to plot the route.")
+                    )
+                    return
                 log.debug(f"Re-requesting queued job result in {sec_delay} seconds.")
-                self._delay_timer.interval = sec_delay * 1000
-                self._timer_connection = self._delay_timer.timeout.connect(
-                    partial(
-                        self.make_request,
-                        SPANSH_API_URL + "/results/" + job_response["job"],
-                        finished_callback=partial(
-                            self._reply_callback,
-                            result_callback=result_callback,
-                            error_callback=error_callback,
-                            delay_iterator=delay_iterator,
-                            result_decode_func=result_decode_func,
-                        ),
-                    ),
-                )
-                self._delay_timer.start()
+                job._job_id = job_response["job"]
+                job._next_poll_at = time.monotonic() + sec_delay
+                self._schedule_poll()
             elif job_response.get("result") is not None:
-                log.debug("Received finished neutron job.")
-                result_callback(result_decode_func(job_response["result"]))
+                log.debug(f"Received finished job from {job.endpoint}.")
+                route = job._streamed_route
+                route.populating = False
+                if self.route_cache is not None:
+                    self.route_cache.put(
+                        f"{self.api_url}/{job.endpoint}", job.params, route
+                    )
+                self._finish_job(job)
+                if job.route is route:
+                    self.route_populated.emit(route)
+                else:
+                    job.route = route
+                    job._result_callback(route)
             else:
-                error_callback(_("Received invalid response from Spansh."))
+                self._fail_job(job, _("Received invalid response from Spansh."))
 
-    def route_decode_callback(
-        self,
-        *args: t.Any,
-        route_type: type[Route],
-        **kwargs: t.Any,
-    ) -> None:
-        """Callback to call the result callback with an ExactPlotRow list."""  # noqa: D401
-        self._reply_callback(*args, **kwargs, result_decode_func=route_type.from_json)
+    def _fail_job(self, job: SpanshJob, error: str) -> None:
+        # Ignore late replies or decode errors of jobs that already finished, like `_abort_job` does.
+        # Jobs whose routes were passed on early keep running until their routes are populated.
+        if job.aborted or job not in self._running_jobs:
+            return
+        job.error = error
+        self._finish_job(job)
+        if job.route is not None:
+            # The route was already passed on, it's left with the rows decoded before the error.
+            log.error(f"Decoding the route from {job.endpoint} failed: {error}")
+            job.route.populating = False
+            job.route.truncated = True
+            self.route_decode_failed.emit(job.route, error)
+        else:
+            job._error_callback(error)
 
-    def make_request(self, *args: t.Any, **kwargs: t.Any) -> None:
-        """Make a network request and store the result reply."""
-        self.abort()
-        self._current_reply = make_network_request(*args, **kwargs)
+    def _schedule_poll(self) -> None:
+        """Start the poll timer for the earliest due poll of the running jobs."""
+        poll_times = [
+            job._next_poll_at
+            for job in self._running_jobs
+            if job._next_poll_at is not None
+        ]
+        if not poll_times:
+            self._poll_timer.stop()
+            return
+        self._poll_timer.start(
+            max(round((min(poll_times) - time.monotonic()) * 1000), 0)
+        )
 
-    def abort(self) -> None:
-        """Abort the current request."""
-        if self._current_reply is not None:
-            log.debug("Aborting route plot request.")
-            self._current_reply.abort()
-        self._delay_timer.stop()
-
-    def _reset_reply(self) -> None:
-        """Reset the reply and disconnect the timer from the old make_request."""
-        self._current_reply = None
-        if self._timer_connection is not None:
-            self._delay_timer.disconnect(self._timer_connection)
+    @QtCore.Slot()
+    def _poll_due_jobs(self) -> None:
+        """Request the results of all jobs due to be polled within the batch window."""
+        poll_before = time.monotonic() + self._poll_batch_window
+        for job in self._running_jobs:
+            if job._next_poll_at is not None and job._next_poll_at <= poll_before:
+                job._next_poll_at = None
+                job._polls += 1
+                self._send_job_request(job, f"{self.api_url}/results/{job._job_id}")
+        self._schedule_poll()
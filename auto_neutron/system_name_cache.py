@@ -0,0 +1,120 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import json
+import logging
+import typing as t
+
+from auto_neutron.constants import SYSTEM_NAME_CACHE_FILE_NAME, get_config_dir
+from auto_neutron.utils.utils import intern_list
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+SYSTEM_NAME_CACHE_VERSION = 1
+
+_system_name_cache: SystemNameCache | None = None
+
+
+class SystemNameCache:
+    """
+    Least recently used cache of Spansh's system name suggestions for queries, persisted to `path`.
+
+    Queries are compared casefolded. A query that isn't cached is answered by filtering the suggestions
+    of its longest cached prefix. Responses with `truncated_size` or more suggestions
+    may have been cut off by Spansh, so suggestions filtered from them are marked as incomplete.
+    """
+
+    def __init__(
+        self, path: Path, *, max_entries: int = 1000, truncated_size: int = 20
+    ):
+        self._path = path
+        self._max_entries = max_entries
+        self._truncated_size = truncated_size
+        self._entries: dict[str, list[str]] | None = None
+        self._modified = False
+
+    def lookup(self, query: str) -> tuple[list[str], bool] | None:
+        """
+        Get the suggestions for `query` and whether they're complete, or None if no prefix of it is cached.
+
+        Incomplete suggestions should be refined with a request to Spansh.
+        """
+        entries = self._get_entries()
+        query = query.casefold()
+        if (suggestions := entries.get(query)) is not None:
+            entries[query] = entries.pop(query)
+            return suggestions, True
+
+        for prefix_end in range(len(query) - 1, 0, -1):
+            if (prefix_suggestions := entries.get(query[:prefix_end])) is not None:
+                suggestions = [
+                    suggestion
+                    for suggestion in prefix_suggestions
+                    if suggestion.casefold().startswith(query)
+                ]
+                return suggestions, len(prefix_suggestions) < self._truncated_size
+        return None
+
+    def put(self, query: str, suggestions: list[str]) -> None:
+        """Cache `suggestions` as Spansh's response to `query`, evicting the least recently used queries if full."""
+        entries = self._get_entries()
+        query = query.casefold()
+        entries.pop(query, None)
+        entries[query] = intern_list(suggestions)
+        while len(entries) > self._max_entries:
+            del entries[next(iter(entries))]
+        self._modified = True
+
+    def save(self) -> None:
+        """Atomically write the cache to its file if it was modified."""
+        if not self._modified:
+            return
+        temp_path = self._path.with_stem("_TEMP" + self._path.stem)
+        try:
+            temp_path.write_text(
+                json.dumps(
+                    {"version": SYSTEM_NAME_CACHE_VERSION, "queries": self._entries}
+                ),
+                encoding="utf8",
+            )
+            temp_path.replace(self._path)
+        except OSError as e:
+            log.warning(
+                f"Failed to save system name cache to {self._path}.", exc_info=e
+            )
+        else:
+            self._modified = False
+
+    def _get_entries(self) -> dict[str, list[str]]:
+        """Get the cached queries, loading them from the cache file on the first call."""
+        if self._entries is None:
+            self._entries = {}
+            try:
+                cache = json.loads(self._path.read_bytes())
+                if cache["version"] == SYSTEM_NAME_CACHE_VERSION:
+                    self._entries = {
+                        query: intern_list(suggestions)
+                        for query, suggestions in cache["queries"].items()
+                    }
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log.warning(
+                    f"Failed to load system name cache from {self._path}.", exc_info=e
+                )
+        return self._entries
+
+
+def get_system_name_cache() -> SystemNameCache:
+    """Get the system name cache in the config directory, creating it on the first call."""
+    global _system_name_cache
+    if _system_name_cache is None:
+        _system_name_cache = SystemNameCache(
+            get_config_dir() / SYSTEM_NAME_CACHE_FILE_NAME
+        )
+    return _system_name_cache
@@ -0,0 +1,126 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import codecs
+import json
+import typing as t
+
+if t.TYPE_CHECKING:
+    import collections.abc
+
+_WHITESPACE = frozenset(" \t\n\r")
+_decoder = json.JSONDecoder()
+
+
+class StreamingArrayDecoder:
+    """
+    Incrementally decode a JSON document fed in chunks, yielding the items of the array at `path` as they complete.
+
+    `path` is the sequence of object keys leading to the array, an empty path is an array at the top level.
+    The items are not kept, the rest of the document is returned by `finish` with the array left empty.
+    Only the item being decoded is buffered, so the memory used doesn't grow with the size of the array.
+    """
+
+    def __init__(self, path: collections.abc.Sequence[str]):
+        self._path = list(path)
+        self._text_decoder = codecs.getincrementaldecoder("utf8")()
+        self._buffer = ""
+        self._skeleton = list[str]()
+
+        # One entry for every open container, with the key of the value being decoded for objects.
+        self._containers = list[list]()
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._expecting_key = False
+        self._in_array = False
+        self._array_done = False
+
+    def feed(self, data: bytes) -> collections.abc.Iterator[t.Any]:
+        """Decode `data`, and yield the array's items completed by it."""
+        self._buffer += self._text_decoder.decode(data)
+        yield from self._process()
+
+    def finish(self) -> t.Any:
+        """
+        Get the document with an empty array after all of it was fed in.
+
+        A `json.JSONDecodeError` is raised if the document was invalid or incomplete.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        for _ in self._process():
+            pass
+        if self._in_array or self._buffer.strip():
+            raise json.JSONDecodeError("Incomplete JSON document", self._buffer, 0)
+        return json.loads("".join(self._skeleton))
+
+    def _process(self) -> collections.abc.Iterator[t.Any]:
+        """Consume the buffer up to the end of the last complete item, yield the decoded items."""
+        position = 0
+        buffer = self._buffer
+        while position < len(buffer):
+            if self._in_array:
+                char = buffer[position]
+                if char in _WHITESPACE or char == ",":
+                    position += 1
+                    continue
+                if char == "]":
+                    self._in_array = False
+                    self._array_done = True
+                    continue
+                try:
+                    item, position = _decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    # Assume the item is incomplete, malformed documents are caught by `finish`.
+                    break
+                yield item
+            else:
+                position = self._scan(buffer, position)
+        self._buffer = buffer[position:]
+
+    def _scan(self, buffer: str, position: int) -> int:
+        """Copy the character at `position` to the skeleton while tracking the current path, return the next position."""
+        char = buffer[position]
+        self._skeleton.append(char)
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if self._expecting_key:
+                    # Skeleton strings are complete json strings, the key is decoded from them.
+                    self._containers[-1][1] = json.loads(
+                        "".join(self._skeleton[self._string_start :])
+                    )
+        elif char == '"':
+            self._in_string = True
+            self._string_start = len(self._skeleton) - 1
+        elif char == "{":
+            self._containers.append(["{", None])
+            self._expecting_key = True
+        elif char == "[":
+            if not self._array_done and self._current_path() == self._path:
+                self._in_array = True
+            self._containers.append(["[", None])
+            self._expecting_key = False
+        elif char in "}]":
+            self._containers.pop()
+            self._expecting_key = False
+        elif char == ":":
+            self._expecting_key = False
+        elif char == ",":
+            self._expecting_key = self._containers[-1][0] == "{"
+        return position + 1
+
+    def _current_path(self) -> list[str] | None:
+        """Get the keys leading to the current value, or None if it's inside an array."""
+        path = []
+        for container_type, key in self._containers:
+            if container_type == "[":
+                return None
+            path.append(key)
+        return path
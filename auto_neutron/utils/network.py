@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
+import time
 import typing as t
 import urllib.parse
 from functools import partial
@@ -14,6 +16,7 @@ from __feature__ import snake_case, true_property  # noqa: F401
 
 import auto_neutron
 from auto_neutron.constants import APP, VERSION
+from auto_neutron.utils.telemetry import request_telemetry
 
 if t.TYPE_CHECKING:
     import collections.abc
@@ -36,6 +39,128 @@ class NetworkError(Exception):
         super().__init__(qt_error, reply_error)
 
 
+@dataclasses.dataclass
+class RequestTiming:
+    """
+    Times at which the phases of a request to `url` were reached, in seconds after the request was made.
+
+    `connecting` is None if the request reused an open connection.
+    """
+
+    url: str
+    connecting: float | None = None
+    sent: float | None = None
+    headers_received: float | None = None
+    finished: float | None = None
+    http2: bool = False
+
+    def durations(self) -> dict[str, float]:
+        """Get the seconds spent in the phases of the request that were reached."""
+        durations = {}
+        if self.connecting is not None and self.sent is not None:
+            durations["connect"] = self.sent - self.connecting
+        if self.sent is not None and self.headers_received is not None:
+            durations["wait"] = self.headers_received - self.sent
+        if self.headers_received is not None and self.finished is not None:
+            durations["download"] = self.finished - self.headers_received
+        if self.finished is not None:
+            durations["total"] = self.finished
+        return durations
+
+    def breakdown(self) -> str:
+        """Describe the time spent in the phases of the request."""
+        phases = [
+            f"{phase} {duration * 1000:.1f} ms"
+            for phase, duration in self.durations().items()
+        ]
+        if self.connecting is None:
+            phases.append("reused connection")
+        phases.append("HTTP/2" if self.http2 else "HTTP/1.1")
+        return ", ".join(phases)
+
+
+def _create_request(url: str) -> QtNetwork.QNetworkRequest:
+    """
+    Create a request to `url` with the app's user agent, allowing HTTP/2.
+
+    The Accept-Encoding header is left to Qt, which negotiates the compressions it supports
+    and only decompresses the reply transparently when it set the header itself.
+    """
+    request = QtNetwork.QNetworkRequest(QtCore.QUrl(url))
+    request.set_header(
+        QtNetwork.QNetworkRequest.KnownHeaders.UserAgentHeader, f"{APP}/{VERSION}"
+    )
+    request.set_attribute(
+        QtNetwork.QNetworkRequest.Attribute.Http2AllowedAttribute, True
+    )
+    return request
+
+
+def _track_request(
+    reply: QtNetwork.QNetworkReply, url: str, *, sent_bytes: int = 0
+) -> RequestTiming:
+    """
+    Record the times of `reply`'s request phases into a `RequestTiming`.
+
+    When the reply finishes, the timing is logged and added to the request telemetry
+    together with the `sent_bytes` size of the request's body and the size of the reply.
+    """
+    timing = RequestTiming(url)
+    start = time.perf_counter()
+    received_bytes = 0
+
+    def set_received_bytes(received: int, _total: int) -> None:
+        nonlocal received_bytes
+        received_bytes = received
+
+    def set_phase(phase: str) -> None:
+        if getattr(timing, phase) is None:
+            setattr(timing, phase, time.perf_counter() - start)
+
+    def finished() -> None:
+        set_phase("finished")
+        timing.http2 = bool(
+            reply.attribute(QtNetwork.QNetworkRequest.Attribute.Http2WasUsedAttribute)
+        )
+        log.debug(f"Request to {url} finished: {timing.breakdown()}")
+        request_telemetry.record_request(
+            timing,
+            sent_bytes=sent_bytes,
+            received_bytes=received_bytes,
+            error=reply.error() is not QtNetwork.QNetworkReply.NetworkError.NoError,
+        )
+
+    reply.socketStartedConnecting.connect(partial(set_phase, "connecting"))
+    reply.requestSent.connect(partial(set_phase, "sent"))
+    reply.metaDataChanged.connect(partial(set_phase, "headers_received"))
+    reply.downloadProgress.connect(set_received_bytes)
+    reply.finished.connect(finished)
+    return timing
+
+
+def preconnect(url: str) -> None:
+    """
+    Open a connection to the host of `url` ahead of requests to it, so they don't wait for the connection.
+
+    Encrypted connections offer HTTP/2 through ALPN, so the connection can be reused by HTTP/2 requests.
+    """
+    qurl = QtCore.QUrl(url)
+    log.debug(f"Preconnecting to {qurl.host()}.")
+    if qurl.scheme() == "https" and QtNetwork.QSslSocket.supports_ssl():
+        ssl_configuration = QtNetwork.QSslConfiguration.default_configuration()
+        ssl_configuration.set_allowed_next_protocols(
+            [
+                QtNetwork.QSslConfiguration.ALPNProtocolHTTP2.encode(),
+                QtNetwork.QSslConfiguration.NextProtocolHttp1_1.encode(),
+            ]
+        )
+        auto_neutron.network_mgr.connect_to_host_encrypted(
+            qurl.host(), qurl.port(443), ssl_configuration
+        )
+    else:
+        auto_neutron.network_mgr.connect_to_host(qurl.host(), qurl.port(80))
+
+
 def make_network_request(
     url: str,
     *,
@@ -46,12 +171,8 @@ def make_network_request(
     log.debug(f"Sending request to {url} with {params=}")
     if params:
         url += "?" + urllib.parse.urlencode(params)
-    qurl = QtCore.QUrl(url)
-    request = QtNetwork.QNetworkRequest(qurl)
-    request.set_header(
-        QtNetwork.QNetworkRequest.KnownHeaders.UserAgentHeader, f"{APP}/{VERSION}"
-    )
-    reply = auto_neutron.network_mgr.get(request)
+    reply = auto_neutron.network_mgr.get(_create_request(url))
+    _track_request(reply, url)
     reply.finished.connect(partial(finished_callback, reply))
 
     return reply
@@ -64,18 +185,13 @@ def post_request(
     finished_callback: collections.abc.Callable[[QtNetwork.QNetworkReply], t.Any],
 ) -> QtNetwork.QNetworkReply:
     """Make a post request to `url` with `json_` as its body. Connect its reply to `finished_callback`."""
-    qurl = QtCore.QUrl(url)
-    request = QtNetwork.QNetworkRequest(qurl)
-    request.set_header(
-        QtNetwork.QNetworkRequest.KnownHeaders.UserAgentHeader, f"{APP}/{VERSION}"
-    )
+    request = _create_request(url)
     request.set_header(
         QtNetwork.QNetworkRequest.KnownHeaders.ContentTypeHeader, "application/json"
     )
-    reply = auto_neutron.network_mgr.post(
-        request,
-        json.dumps(json_).encode(),
-    )
+    body = json.dumps(json_).encode()
+    reply = auto_neutron.network_mgr.post(request, body)
+    _track_request(reply, url, sent_bytes=len(body))
     reply.finished.connect(partial(finished_callback, reply))
 
     return reply
@@ -0,0 +1,168 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import bisect
+import collections
+import json
+import re
+import time
+import typing as t
+import urllib.parse
+
+if t.TYPE_CHECKING:
+    from pathlib import Path
+
+    from auto_neutron.utils.network import RequestTiming
+
+TELEMETRY_VERSION = 1
+
+# Roughly logarithmic upper bounds of the histogram buckets, values above the last bound go to an overflow bucket.
+DURATION_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+SIZE_BUCKETS_BYTES = (
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+RETRY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_ID_SEGMENT_RE = re.compile(r"[0-9a-fA-F-]{16,}")
+
+
+class Histogram:
+    """Count values into buckets with the upper bounds from `bounds`, keeping their count, sum, minimum and maximum."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def add(self, value: float) -> None:
+        """Count `value` into its bucket."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_json(self) -> dict[str, t.Any]:
+        """Get the histogram as a json serializable dict, the last bucket has no upper bound."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": [
+                {"le": bound, "count": count}
+                for bound, count in zip((*self.bounds, None), self.counts)
+            ],
+        }
+
+
+class RequestTelemetry:
+    """
+    Histograms of the phase durations, payload sizes and retry counts of network requests, grouped by endpoint.
+
+    Endpoints are the host and path of the request's URL,
+    with path segments that look like job ids replaced by `{id}` so they're grouped together.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._durations = collections.defaultdict[tuple[str, str], Histogram](
+            lambda: Histogram(DURATION_BUCKETS_MS)
+        )
+        self._sizes = collections.defaultdict[tuple[str, str], Histogram](
+            lambda: Histogram(SIZE_BUCKETS_BYTES)
+        )
+        self._retries = collections.defaultdict[str, Histogram](
+            lambda: Histogram(RETRY_BUCKETS)
+        )
+        self._errors = collections.Counter[str]()
+        self._http2_requests = collections.Counter[str]()
+        self._reused_connections = collections.Counter[str]()
+
+    def record_request(
+        self,
+        timing: RequestTiming,
+        *,
+        sent_bytes: int,
+        received_bytes: int,
+        error: bool,
+    ) -> None:
+        """Record the phase durations from `timing`, and the payload sizes of its request."""
+        endpoint = endpoint_name(timing.url)
+        for phase, duration in timing.durations().items():
+            self._durations[endpoint, phase].add(duration * 1000)
+        self._sizes[endpoint, "sent"].add(sent_bytes)
+        self._sizes[endpoint, "received"].add(received_bytes)
+        if error:
+            self._errors[endpoint] += 1
+        if timing.http2:
+            self._http2_requests[endpoint] += 1
+        if timing.connecting is None:
+            self._reused_connections[endpoint] += 1
+
+    def record_retries(self, url: str, retries: int) -> None:
+        """Record that an operation on `url` took `retries` requests after the first one."""
+        self._retries[endpoint_name(url)].add(retries)
+
+    def to_json(self) -> dict[str, t.Any]:
+        """Get the recorded histograms as a json serializable dict grouped by endpoint."""
+        endpoints = {}
+
+        def endpoint_json(endpoint: str) -> dict[str, t.Any]:
+            return endpoints.setdefault(
+                endpoint,
+                {
+                    "requests": 0,
+                    "errors": self._errors[endpoint],
+                    "http2_requests": self._http2_requests[endpoint],
+                    "reused_connections": self._reused_connections[endpoint],
+                    "durations_ms": {},
+                    "sizes_bytes": {},
+                },
+            )
+
+        for (endpoint, phase), histogram in sorted(self._durations.items()):
+            endpoint_json(endpoint)["durations_ms"][phase] = histogram.to_json()
+        for (endpoint, direction), histogram in sorted(self._sizes.items()):
+            endpoint_data = endpoint_json(endpoint)
+            endpoint_data["sizes_bytes"][direction] = histogram.to_json()
+            endpoint_data["requests"] = histogram.count
+        for endpoint, histogram in sorted(self._retries.items()):
+            endpoint_json(endpoint)["retries"] = histogram.to_json()
+
+        return {
+            "version": TELEMETRY_VERSION,
+            "started_at": self.started_at,
+            "exported_at": time.time(),
+            "endpoints": endpoints,
+        }
+
+    def export(self, path: Path) -> None:
+        """Write the recorded histograms to a json file at `path`."""
+        path.write_text(json.dumps(self.to_json(), indent=2), encoding="utf8")
+
+
+def endpoint_name(url: str) -> str:
+    """Get the endpoint of `url` for grouping requests, its host and path with job ids replaced by `{id}`."""
+    split_url = urllib.parse.urlsplit(url)
+    path = "/".join(
+        "{id}" if _ID_SEGMENT_RE.fullmatch(segment) else segment
+        for segment in split_url.path.split("/")
+    )
+    return split_url.netloc + path
+
+
+request_telemetry = RequestTelemetry()
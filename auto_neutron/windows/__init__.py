@@ -9,6 +9,7 @@ from .missing_journal_window import MissingJournalWindow
 from .nearest_window import NearestWindow
 from .new_route_window import NewRouteWindow
 from .opened_window_manager import create_or_activate_window
+from .route_comparison_window import RouteComparisonWindow
 from .settings_window import SettingsWindow
 from .shut_down_window import ShutDownWindow
 from .update_error_window import UpdateErrorWindow
@@ -21,6 +22,7 @@ __all__ = [
     "MissingJournalWindow",
     "NearestWindow",
     "NewRouteWindow",
+    "RouteComparisonWindow",
     "SettingsWindow",
     "ShutDownWindow",
     "UpdateErrorWindow",
@@ -14,6 +14,7 @@ from __feature__ import snake_case, true_property  # noqa: F401
 from auto_neutron.utils.file import get_file_name
 
 from ..utils.network import NetworkError, json_from_network_req, post_request
+from ..utils.telemetry import request_telemetry
 from ..utils.utils import get_application
 from .gui.error_window import ErrorWindowGUI
 
@@ -38,6 +39,7 @@ class ErrorWindow(ErrorWindowGUI):
         super().__init__(parent)
         self.quit_button.pressed.connect(get_application().quit)
         self.send_log.pressed.connect(self._send_error_report)
+        self.export_telemetry_button.pressed.connect(self._export_telemetry)
         self.error_template = ""
         self.retranslate()
 
@@ -68,6 +70,25 @@ class ErrorWindow(ErrorWindowGUI):
         else:
             log.info("No log file found.")
 
+    def _export_telemetry(self) -> None:
+        """Export the network request telemetry to a json file chosen by the user."""
+        path, __ = QtWidgets.QFileDialog.get_save_file_name(
+            self,
+            _("Export network statistics"),
+            "network_statistics.json",
+            filter=_("JSON files (*.json)"),
+        )
+        if not path:
+            return
+        log.info(f"Exporting network telemetry to {path}.")
+        try:
+            request_telemetry.export(Path(path))
+        except OSError as e:
+            log.warning("Failed to export network telemetry.", exc_info=e)
+            QtWidgets.QMessageBox.warning(
+                self, "Auto_Neutron", _("Failed to export network statistics.")
+            )
+
     def _receive_reply(self, reply: QtNetwork.QNetworkReply) -> None:
         """Receive response from the error api, if failed display a warning to the user."""
         self.cursor = QtCore.Qt.CursorShape.ArrowCursor
@@ -26,6 +26,7 @@ class ErrorWindowGUI(QtWidgets.QDialog):
         self.quit_button = QtWidgets.QPushButton(self)
         self.send_log = QtWidgets.QPushButton(self)
         self.save_button = QtWidgets.QPushButton(self)
+        self.export_telemetry_button = QtWidgets.QPushButton(self)
         self.quit_button.size_policy = QtWidgets.QSizePolicy(
             QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
         )
@@ -35,8 +36,12 @@ class ErrorWindowGUI(QtWidgets.QDialog):
         self.save_button.size_policy = QtWidgets.QSizePolicy(
             QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
         )
+        self.export_telemetry_button.size_policy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
 
         self.button_layout.add_widget(self.save_button)
+        self.button_layout.add_widget(self.export_telemetry_button)
         self.button_layout.add_widget(self.send_log)
         self.button_layout.add_widget(self.quit_button)
 
@@ -51,3 +56,4 @@ class ErrorWindowGUI(QtWidgets.QDialog):
         self.quit_button.text = _("Quit")
         self.send_log.text = _("Send session log")
         self.save_button.text = _("Save route")
+        self.export_telemetry_button.text = _("Export network statistics")
@@ -107,7 +107,7 @@ class TabGUIBase(QtWidgets.QWidget):
 
 
 class SpanshTabGUIBase(TabGUIBase):
-    """Base Spansh layout with the source/target sys inputs, cargo slider and nearest button above submit."""
+    """Base Spansh layout with the source/target sys inputs, cargo slider and nearest and compare buttons above submit."""
 
     def __init__(self, *args: object, **kwargs: object):
         super().__init__(*args, **kwargs)
@@ -125,6 +125,11 @@ class SpanshTabGUIBase(TabGUIBase):
         self.nearest_button.size_policy = QtWidgets.QSizePolicy(
             QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
         )
+        self.compare_button = QtWidgets.QPushButton(self)
+        self.compare_button.size_policy = QtWidgets.QSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed
+        )
+        self.compare_button.enabled = False
         submit_nearest_layout = QtWidgets.QVBoxLayout()
         submit_nearest_layout.add_spacer_item(
             QtWidgets.QSpacerItem(
@@ -135,6 +140,7 @@ class SpanshTabGUIBase(TabGUIBase):
             )
         )
         submit_nearest_layout.add_widget(self.nearest_button)
+        submit_nearest_layout.add_widget(self.compare_button)
         submit_nearest_layout.add_widget(self.submit_button)
         submit_nearest_layout.add_widget(self.abort_button)
 
@@ -162,6 +168,10 @@ class SpanshTabGUIBase(TabGUIBase):
         """Retranslate text that is always on display."""
         super().retranslate()
         self.nearest_button.text = _("Nearest")
+        self.compare_button.text = _("Compare")
+        self.compare_button.tool_tip = _(
+            "Plot the route with the current settings in a comparison window, next to the previously compared routes"
+        )
         self.source_edit.placeholder_text = _("Source system")
         self.target_edit.placeholder_text = _("Destination system")
 
@@ -0,0 +1,50 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+from PySide6 import QtCore, QtWidgets
+from __feature__ import snake_case, true_property  # noqa: F401
+
+
+class RouteComparisonWindowGUI(QtWidgets.QDialog):
+    """Provide a table of routes plotted with different settings, and a button to use the selected route."""
+
+    def __init__(self, parent: QtWidgets.QWidget):
+        super().__init__(parent)
+        self.set_attribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.main_layout = QtWidgets.QVBoxLayout(self)
+
+        self.table = QtWidgets.QTableWidget(0, 4, self)
+        self.table.edit_triggers = (
+            QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers
+        )
+        self.table.selection_behavior = (
+            QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.table.selection_mode = (
+            QtWidgets.QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self.table.vertical_header().visible = False
+        self.table.horizontal_header().stretch_last_section = True
+
+        self.use_route_button = QtWidgets.QPushButton(self)
+        self.use_route_button.enabled = False
+
+        self.button_layout = QtWidgets.QHBoxLayout()
+        self.button_layout.add_spacer_item(
+            QtWidgets.QSpacerItem(1, 1, QtWidgets.QSizePolicy.Policy.Expanding)
+        )
+        self.button_layout.add_widget(self.use_route_button)
+
+        self.main_layout.add_widget(self.table)
+        self.main_layout.add_layout(self.button_layout)
+        self.resize(520, 220)
+
+    def retranslate(self) -> None:
+        """Retranslate text that is always on display."""
+        self.window_title = _("Route comparison")
+        self.table.set_horizontal_header_labels(
+            [_("Settings"), _("Jumps"), _("Distance"), _("Status")]
+        )
+        self.use_route_button.text = _("Use route")
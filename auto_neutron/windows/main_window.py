@@ -3,11 +3,10 @@
 
 from __future__ import annotations
 
-import dataclasses
 import time
 import typing as t
 
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtGui
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron import settings
@@ -16,10 +15,9 @@ from auto_neutron.utils.signal import ReconnectingSignal
 from ..utils.utils import get_application
 from .gui.main_window import MainWindowGUI
 from .route_table_header import RouteTableHeader, header_from_row_type
+from .route_table_model import RouteTableModel
 
 if t.TYPE_CHECKING:
-    import collections.abc
-
     from auto_neutron.route import Route
 
 
@@ -28,12 +26,14 @@ class MainWindow(MainWindowGUI):
 
     def __init__(self):
         super().__init__()
+        self.route_model = RouteTableModel(self)
+        self.table.set_model(self.route_model)
         self.change_action.triggered.connect(
-            lambda: self.table.edit_item(self.table.current_item())
+            lambda: self.table.edit(self.table.current_index())
         )
         self.copy_action.triggered.connect(self.copy_table_item_text)
         self.resize_connection = ReconnectingSignal(
-            self.table.itemChanged,
+            self.route_model.route_edited,
             self.manage_item_changed,
         )
         self.resize_connection.connect()
@@ -52,37 +52,39 @@ class MainWindow(MainWindowGUI):
     @QtCore.Slot()
     def copy_table_item_text(self) -> None:
         """Copy the text of the selected table item into the clipboard."""
-        if (item := self.table.current_item()) is not None:
-            get_application().clipboard().set_text(item.text())
-
-    def mass_insert(
-        self, data: collections.abc.Iterable[collections.abc.Iterable[t.Any]]
-    ) -> None:
-        """Insert a rows from `data`, then resize columns and rows to contents."""
-        with self.resize_connection.temporarily_disconnect():
-            for row in data:
-                self.insert_row(row)
-        self.table.resize_columns_to_contents()
-        self.table.resize_rows_to_contents()
+        if (index := self.table.current_index()).is_valid():
+            get_application().clipboard().set_text(str(index.data()))
 
     def initialize_table(self, route: Route) -> None:
-        """Clear the table and insert plot rows from `Route` into it with appropriate columns."""
-        self._route = route
+        """
+        Display `route` in the table with appropriate columns.
 
-        self.table.clear()
-        self.table.row_count = 0
+        Rows are only laid out and rendered when they're visible,
+        so all rows are sized like the first one instead of being resized to their contents.
+        """
+        self._route = route
+        self.route_model.set_route(route)
 
         self._header_type = header = header_from_row_type(route.row_type)(self.table)
         header.initialize_headers()
         header.retranslate_headers()
 
-        self.mass_insert(dataclasses.astuple(row) for row in route.entries)
+        self.table.resize_columns_to_contents()
+        if self.route_model.row_count():
+            self.table.vertical_header().default_section_size = (
+                self.table.size_hint_for_row(0)
+            )
+        self.update_remaining_count()
+
+    def append_rows(self) -> None:
+        """Display the rows which were appended to the displayed route."""
+        self.route_model.rows_appended()
         self.update_remaining_count()
 
     def set_current_row(self, index: int) -> None:
         """Change the item colours before `index` to appear inactive and update the remaining systems/jump."""
         with self.resize_connection.temporarily_disconnect():
-            super().inactivate_before_index(index)
+            self.route_model.inactive_before = index
             self.update_remaining_count()
 
         if settings.Window.autoscroll and time.monotonic() - self._last_scroll_time > 1:
@@ -103,10 +105,10 @@ class MainWindow(MainWindowGUI):
             )
             self._header_type.format_jump_header()
 
-    @QtCore.Slot(QtWidgets.QTableWidgetItem)
-    def manage_item_changed(self, table_item: QtWidgets.QTableWidgetItem) -> None:
+    @QtCore.Slot(int, int, str)
+    def manage_item_changed(self, row: int, column: int, _: str) -> None:
         """Update the column sizes and information when an item is changed."""
-        self._header_type.item_changed(table_item)
+        self._header_type.item_changed(column)
 
     def restore_window(self) -> None:
         """Restore the size and position from the settings."""
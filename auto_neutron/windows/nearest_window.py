@@ -9,7 +9,7 @@ import typing as t
 from PySide6 import QtCore, QtGui, QtNetwork, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
-from auto_neutron.constants import SPANSH_API_URL
+from auto_neutron import settings
 from auto_neutron.utils.network import (
     NetworkError,
     json_from_network_req,
@@ -67,7 +67,7 @@ class NearestWindow(NearestWindowGUI):
         """Make a request to Spansh's nearest endpoint with the values from spinboxes."""
         self._abort_request()
         self._current_network_request = make_network_request(
-            SPANSH_API_URL + "/nearest",
+            settings.General.spansh_api_url + "/nearest",
             params={
                 "x": self.x_spinbox.value,
                 "y": self.y_spinbox.value,
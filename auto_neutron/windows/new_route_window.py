@@ -13,10 +13,11 @@ import babel.dates
 from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
-from auto_neutron.journal import Journal, get_unique_cmdr_journals
+from auto_neutron.journal import Journal, JournalScanner
 from auto_neutron.locale import get_active_locale
 from auto_neutron.route import Route
 from auto_neutron.spansh_request_manager import SpanshRequestManager
+from auto_neutron.utils.network import preconnect
 from auto_neutron.utils.signal import ReconnectingSignal
 from auto_neutron.utils.utils import N_, cmdr_display_name
 from auto_neutron.workers import GameWorker
@@ -41,7 +42,9 @@ class NewRouteWindow(NewRouteWindowGUI):
     route_created_signal = QtCore.Signal(Journal, Route)
     tabs: list[TabBase]
 
-    def __init__(self, parent: QtWidgets.QWidget):
+    def __init__(
+        self, parent: QtWidgets.QWidget, request_manager: SpanshRequestManager
+    ):
         def status_callback(*args, **kwargs) -> None:
             # Widget created in subclass, not available for tabs passed to the super init.
             self.status_widget.show_message(*args, **kwargs)
@@ -71,11 +74,18 @@ class NewRouteWindow(NewRouteWindowGUI):
                 ),
             ],
         )
-        self._request_manager = SpanshRequestManager(self)
+        self._request_manager = request_manager
+        # Warm up a connection for the route and system name requests made from the window.
+        preconnect(self._request_manager.api_url)
 
         self.selected_journal: Journal | None = None
+        self._pending_route: Route | None = None
         self._journals = list[Journal]()
         self._journal_worker: GameWorker | None = None
+        self._show_change_message = True
+        self._journal_scanner = JournalScanner()
+        self._journal_scanner.journal_found.connect(self._add_journal)
+        self._journal_scanner.finished.connect(self._journal_scan_finished)
 
         self.combo_signals = list[ReconnectingSignal]()
         self._source_sync_signals = list[ReconnectingSignal]()
@@ -124,8 +134,8 @@ class NewRouteWindow(NewRouteWindowGUI):
 
     @QtCore.Slot()
     def _abort_request(self) -> None:
-        """Abort the current network request, if any."""
-        self._request_manager.abort()
+        """Abort the route plots started from the window, if any."""
+        self._abort_plots()
         self.switch_submit_abort()
         self.status_widget.show_message("Cancelled route plot.", 2_500)
         self.cursor = QtGui.QCursor(QtCore.Qt.CursorShape.ArrowCursor)
@@ -170,48 +180,61 @@ class NewRouteWindow(NewRouteWindowGUI):
     @QtCore.Slot()
     def _populate_journal_combos(self, *, show_change_message: bool = True) -> None:
         """
-        Populate the combo boxes with CMDR names referring to latest active journal files.
+        Clear the combo boxes and the selected journal, and start a scan for the latest active journal files.
 
-        The journals they're referring to are stored in `self._journals`.
+        The combo boxes are filled with CMDR names as the scan finds journals,
+        the journals they're referring to are stored in `self._journals`.
+        The first journal found is selected again.
         """
-        font_metrics = self.tabs[0].journal_combo.font_metrics()
+        with contextlib.ExitStack() as exit_stack:
+            for signal in self.combo_signals:
+                exit_stack.enter_context(signal.temporarily_disconnect())
 
-        combo_items = []
-        self._journals = get_unique_cmdr_journals()
-        for journal in self._journals:
-            combo_items.append(
-                font_metrics.elided_text(
-                    cmdr_display_name(journal.cmdr),
-                    QtCore.Qt.TextElideMode.ElideRight,
-                    80,
-                )
-            )
+            for tab in self.tabs:
+                tab.journal_combo.clear()
+
+        self.selected_journal = None
+        for tab in self.tabs:
+            tab.set_journal(None)
+        if self._journal_worker is not None:
+            self._journal_worker.stop()
+            self._journal_worker = None
+
+        self._journals = []
+        self._show_change_message = show_change_message
+        self._journal_scanner.scan()
 
+    @QtCore.Slot(Journal)
+    def _add_journal(self, journal: Journal) -> None:
+        """Add `journal` to the combo boxes, and select it if it's the first one."""
+        font_metrics = self.tabs[0].journal_combo.font_metrics()
+        self._journals.append(journal)
+        combo_item = font_metrics.elided_text(
+            cmdr_display_name(journal.cmdr),
+            QtCore.Qt.TextElideMode.ElideRight,
+            80,
+        )
         with contextlib.ExitStack() as exit_stack:
             for signal in self.combo_signals:
                 exit_stack.enter_context(signal.temporarily_disconnect())
 
             for tab in self.tabs:
-                tab.journal_combo.clear()
+                tab.journal_combo.add_item(combo_item)
 
-            if self._journals:
-                log.info(
-                    f"Populating journal combos with {len(self._journals)} journals."
-                )
-                for tab in self.tabs:
-                    tab.journal_combo.add_items(combo_items)
-
-                self._change_journal(0, show_change_message=show_change_message)
-            else:
-                log.info("No valid journals found to populate combos with.")
-                self.status_widget.show_message(
-                    _("Found no active journal files from within the last week."),
-                    duration=10_000,
-                )
+            if len(self._journals) == 1:
+                self._change_journal(0, show_change_message=self._show_change_message)
 
-                self.selected_journal = None
-                for tab in self.tabs:
-                    tab.set_journal(None)
+    @QtCore.Slot()
+    def _journal_scan_finished(self) -> None:
+        """Display an error if the journal scan didn't find any journals."""
+        if self._journals:
+            log.info(f"Populated journal combos with {len(self._journals)} journals.")
+        else:
+            log.info("No valid journals found to populate combos with.")
+            self.status_widget.show_message(
+                _("Found no active journal files from within the last week."),
+                duration=10_000,
+            )
 
     def _change_journal(self, index: int, *, show_change_message: bool = True) -> None:
         """Change the current journal and update the UI with its data, or display an error if shut down."""
@@ -220,8 +243,6 @@ class NewRouteWindow(NewRouteWindowGUI):
 
         journal.parse()
         if journal.shut_down:
-            if self._journal_worker is not None:
-                self._journal_worker.stop()
             self._refresh_journals_on_shutdown()
             return
 
@@ -253,6 +274,10 @@ class NewRouteWindow(NewRouteWindowGUI):
                 duration=5_000,
             )
 
+        if self._pending_route is not None:
+            route, self._pending_route = self._pending_route, None
+            self.emit_and_close(route)
+
     def _refresh_journals_on_shutdown(self) -> None:
         """Refresh the journal combo box and display a message saying that the selected journal got shut down."""
         self.status_widget.show_message(
@@ -263,7 +288,10 @@ class NewRouteWindow(NewRouteWindowGUI):
 
     @QtCore.Slot()
     def emit_and_close(self, route: Route) -> None:
-        """Emit a new route and close the window."""
+        """Emit a new route and close the window, routes received while journals are rescanned wait for a journal."""
+        if self.selected_journal is None:
+            self._pending_route = route
+            return
         self.route_created_signal.emit(self.selected_journal, route)
         self.close()
 
@@ -278,9 +306,16 @@ class NewRouteWindow(NewRouteWindowGUI):
         for tab in tabs:
             tab.delete_later()
 
+    def _abort_plots(self) -> None:
+        """Abort the route plots of the window's tabs, routes that were already emitted keep being decoded."""
+        for tab in self.tabs:
+            if isinstance(tab, SpanshTabBase):
+                tab.abort_plot()
+
     def close_event(self, event: QtGui.QCloseEvent) -> None:
-        """Abort any running network request on close."""
-        self._request_manager.abort()
+        """Abort the window's route plots and journal scan on close."""
+        self._abort_plots()
+        self._journal_scanner.cancel()
         if self._journal_worker is not None:
             self._journal_worker.stop()
 
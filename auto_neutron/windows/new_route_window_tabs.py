@@ -8,7 +8,6 @@ import csv
 import json
 import logging
 import typing as t
-import weakref
 from contextlib import suppress
 from functools import partial
 from pathlib import Path
@@ -17,22 +16,31 @@ from PySide6 import QtCore, QtGui, QtNetwork, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron import settings
-from auto_neutron.constants import ROUTE_FILE_NAME, SPANSH_API_URL, get_config_dir
+from auto_neutron.constants import (
+    ROUTE_FILE_NAME,
+    ROUTE_PROGRESS_FILE_NAME,
+    ROUTE_SNAPSHOT_FILE_NAME,
+    get_config_dir,
+)
 from auto_neutron.game_state import Location
 from auto_neutron.journal import Journal
-from auto_neutron.route import ExactRoute, NeutronRoute, RoadToRichesRoute, Route
+from auto_neutron.route import (
+    ExactRoute,
+    NeutronRoute,
+    RoadToRichesRoute,
+    Route,
+    RouteFileIndex,
+    RouteProgressLog,
+)
 from auto_neutron.ship import Ship
-from auto_neutron.spansh_request_manager import SpanshRequestManager
+from auto_neutron.spansh_request_manager import SpanshJob, SpanshRequestManager
+from auto_neutron.system_name_cache import get_system_name_cache
 from auto_neutron.utils.network import (
     NetworkError,
     json_from_network_req,
     make_network_request,
 )
-from auto_neutron.utils.utils import (
-    create_request_delay_iterator,
-    get_application,
-    intern_list,
-)
+from auto_neutron.utils.utils import get_application
 from auto_neutron.windows import NearestWindow
 from auto_neutron.windows.gui.new_route_window import (
     CSVTabGUI,
@@ -44,6 +52,7 @@ from auto_neutron.windows.gui.new_route_window import (
     TabGUIBase,
 )
 from auto_neutron.windows.opened_window_manager import create_or_activate_window
+from auto_neutron.windows.route_comparison_window import RouteComparisonWindow
 
 log = logging.getLogger(__name__)
 
@@ -90,6 +99,7 @@ class TabBase(TabGUIBase):
         """Set the tracked journal to `journal`."""
         if self._journal_shutdown_connection is not None:
             self._journal.disconnect(self._journal_shutdown_connection)
+            self._journal_shutdown_connection = None
         if journal is not None:
             self._journal_shutdown_connection = journal.shut_down_sig.connect(
                 self._set_submit_sensitive
@@ -184,51 +194,82 @@ class LastRouteTab(TabBase, LastTabGUI):  # noqa: D101
         status_callback: StatusCallback,
     ):
         super().__init__(status_callback=status_callback)
-        self._loaded_route: Route | None = None
+        self._load_saved_route: collections.abc.Callable[[], Route] | None = None
+        self._saved_route_index = 0
+        # source, saved location and destination systems of the saved route
+        self._saved_route_systems: tuple[str, str, str] | None = None
 
     @QtCore.Slot()
     def _set_submit_sensitive(self) -> None:
         self.submit_button.enabled = (
             self._journal is not None
             and not self._journal.shut_down
-            and bool(self._loaded_route)
+            and self._load_saved_route is not None
         )
 
     @QtCore.Slot()
     def _get_route(self) -> None:
         log.info("Submitting last route.")
-        if self._loaded_route is not None:
-            self.emit_route_with_index(
-                self._loaded_route, settings.General.last_route_index
-            )
+        if self._load_saved_route is not None:
+            try:
+                route = self._load_saved_route()
+            except Exception:
+                log.exception("Unable to load the saved route.")
+                self._status_callback(_("Unable to load the saved route."), 5_000)
+                return
+            self.emit_route_with_index(route, self._saved_route_index)
 
     def _update_saved_route_text(self) -> None:
-        """Update the saved route information from the currently loaded route."""
-        if self._loaded_route is not None:
+        """Update the saved route information from the saved route systems."""
+        if self._saved_route_systems is not None:
+            source, location, destination = self._saved_route_systems
             # NOTE: Source system
-            self.source_label.text = _("Source: {}").format(
-                self._loaded_route.entries[0].system
-            )
-            self.location_label.text = _("Saved location: {}").format(
-                self._loaded_route.entries[
-                    min(
-                        settings.General.last_route_index,
-                        len(self._loaded_route.entries) - 1,
-                    )
-                ].system
-            )
+            self.source_label.text = _("Source: {}").format(source)
+            self.location_label.text = _("Saved location: {}").format(location)
             # NOTE: destination system
-            self.destination_label.text = _("Destination: {}").format(
-                self._loaded_route.entries[-1].system
+            self.destination_label.text = _("Destination: {}").format(destination)
+
+    def _read_saved_route(self) -> None:
+        """
+        Get the saved route's systems and index, and set up the loading of the route.
+
+        The route snapshot with the changes from its progress log is used if it's available.
+        Otherwise the CSV route is indexed and only the rows displayed in the labels are parsed,
+        with the whole route being loaded when it's submitted.
+        """
+        try:
+            route = RouteProgressLog.restore(
+                get_config_dir() / ROUTE_SNAPSHOT_FILE_NAME,
+                get_config_dir() / ROUTE_PROGRESS_FILE_NAME,
             )
+        except FileNotFoundError:
+            log.info("No route snapshot found, falling back to CSV route.")
+        except Exception:
+            log.exception("Unable to read route snapshot, falling back to CSV route.")
+        else:
+            if route.entries:
+                self._saved_route_systems = (
+                    route.entries[0].system,
+                    route.current_system,
+                    route.entries[-1].system,
+                )
+                self._saved_route_index = route.index
+                self._load_saved_route = lambda: route
+                return
+
+        route_file = RouteFileIndex(get_config_dir() / ROUTE_FILE_NAME)
+        index = min(settings.General.last_route_index, len(route_file) - 1)
+        self._saved_route_systems = tuple(
+            row.system for row in route_file.peek(0, index, -1)
+        )
+        self._saved_route_index = index
+        self._load_saved_route = route_file.load
 
     def show_event(self, event: QtGui.QShowEvent) -> None:
         """Try to get the saved route on the first show, or until valid."""
-        if not self._loaded_route:
+        if self._load_saved_route is None:
             try:
-                self._loaded_route = Route.from_csv_file(
-                    get_config_dir() / ROUTE_FILE_NAME,
-                )
+                self._read_saved_route()
             except Exception:
                 self._status_callback(_("No saved route found."), 5_000)
             self._update_saved_route_text()
@@ -240,12 +281,6 @@ class LastRouteTab(TabBase, LastTabGUI):  # noqa: D101
         self._update_saved_route_text()
 
 
-class DictWeakref(dict):
-    """Dict that can have weakrefs made to it."""
-
-    __slots__ = ("__weakref__",)
-
-
 class SpanshTabBase(TabBase, SpanshTabGUIBase):
     """
     Base class for tabs that interface with Spansh.
@@ -263,9 +298,7 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
     started_plotting = QtCore.Signal()
     plotting_error = QtCore.Signal()
 
-    _completer_caches: weakref.WeakValueDictionary[
-        QtWidgets.QWidget, DictWeakref[str, list[str]]
-    ] = weakref.WeakValueDictionary()
+    COMPLETER_DEBOUNCE_MS = 250
 
     def __init__(
         self,
@@ -274,8 +307,11 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
     ):
         super().__init__(status_callback=status_callback)
         self._request_manager: SpanshRequestManager | None = None
+        self._job: SpanshJob | None = None
+        self._comparison_window: RouteComparisonWindow | None = None
         self._connections = list[QtCore.QMetaObject.Connection]()
         self.nearest_button.pressed.connect(self._display_nearest_window)
+        self.compare_button.pressed.connect(self._compare_route)
         self.source_edit.textChanged.connect(self._set_submit_sensitive)
         self.target_edit.textChanged.connect(self._set_submit_sensitive)
 
@@ -288,9 +324,12 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         self._setup_completer(self.target_completer, line_edit=self.target_edit)
 
         self._completer_request: QtNetwork.QNetworkReply | None = None
-        self._completer_cache = self._completer_caches.setdefault(
-            self.parent(), DictWeakref()
-        )
+        self._completer_cache = get_system_name_cache()
+        self._pending_completer_query: tuple[str, QtWidgets.QCompleter] | None = None
+        self._completer_timer = QtCore.QTimer(self)
+        self._completer_timer.single_shot_ = True
+        self._completer_timer.interval = self.COMPLETER_DEBOUNCE_MS
+        self._completer_timer.timeout.connect(self._send_completer_request)
         self.destroyed.connect(partial(self.__class__._close_cleanup, self))
 
     def set_journal(self, journal: Journal | None) -> None:
@@ -331,6 +370,14 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         """Set the request manager to `manager`."""
         self._request_manager = manager
 
+    def abort_plot(self) -> None:
+        """Abort the tab's route plot jobs, other jobs of the shared request manager are left running."""
+        if self._job is not None:
+            self._job.abort()
+            self._job = None
+        if self._comparison_window is not None:
+            self._comparison_window.abort()
+
     @QtCore.Slot()
     def _set_submit_sensitive(self) -> None:
         """Set submit to be active when both source and target are filled, and a journal is selected."""
@@ -340,6 +387,7 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
             and self._journal is not None
             and not self._journal.shut_down
         )
+        self.compare_button.enabled = self.submit_button.enabled
 
     def _request_params(self) -> dict[str, t.Any] | None:
         """Get the params to send with the request."""
@@ -356,19 +404,50 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         if params is None:
             return
 
-        self._request_manager.make_request(
-            f"{SPANSH_API_URL}/{self.endpoint}",
-            params=params,
-            finished_callback=partial(
-                self._request_manager.route_decode_callback,
-                error_callback=self._spansh_error_callback,
-                delay_iterator=create_request_delay_iterator(),
-                result_callback=self.emit_route_with_index,
-                route_type=self.route_type,
-            ),
+        route = self._request_manager.cached_route(self.endpoint, params)
+        if route is not None:
+            self.emit_route_with_index(route)
+            return
+
+        # Only one route is plotted from the tab at a time.
+        self.abort_plot()
+        self._job = self._request_manager.submit(
+            self.endpoint,
+            params,
+            self.route_type,
+            result_callback=self.emit_route_with_index,
+            error_callback=self._spansh_error_callback,
+            # Emit the route as soon as the system at its starting index is decoded.
+            early_result_rows=2,
         )
         self.started_plotting.emit()
 
+    @QtCore.Slot()
+    def _compare_route(self) -> None:
+        """Plot the route with the current params in the comparison window, next to the previously compared routes."""
+        assert (
+            self._request_manager is not None
+        ), "Request manager must be set before a request is made."
+        params = self._request_params()
+        if params is None:
+            return
+
+        if self._comparison_window is None:
+            log.info("Displaying route comparison window.")
+            self._comparison_window = RouteComparisonWindow(self, self._request_manager)
+            self._comparison_window.route_selected.connect(self.emit_route_with_index)
+            self._comparison_window.destroyed.connect(self._clear_comparison_window)
+            self._comparison_window.show()
+        else:
+            self._comparison_window.activate_window()
+            self._comparison_window.raise_()
+        self._comparison_window.plot(self.endpoint, params, self.route_type)
+
+    @QtCore.Slot()
+    def _clear_comparison_window(self) -> None:
+        """Forget the comparison window after it's destroyed."""
+        self._comparison_window = None
+
     @QtCore.Slot()
     def _display_nearest_window(self) -> None:
         """Display the nearest system finder window and link its signals."""
@@ -438,18 +517,34 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
         query: str,
         completer: QtWidgets.QCompleter,
     ) -> None:
+        """
+        Display the suggestions for `query` in `completer`.
+
+        Suggestions are taken from the cache when possible,
+        otherwise they're requested from Spansh after the user stops typing for `COMPLETER_DEBOUNCE_MS`.
+        """
         if self._completer_request is not None:
             self._completer_request.abort()
+        self._completer_timer.stop()
         if not query:
             return
 
-        if (cached_response := self._completer_cache.get(query.casefold())) is not None:
-            completer.model().set_string_list(cached_response)
+        if (cached := self._completer_cache.lookup(query)) is not None:
+            suggestions, complete = cached
+            completer.model().set_string_list(suggestions)
             completer.complete()
-            return
+            if complete:
+                return
 
+        self._pending_completer_query = (query, completer)
+        self._completer_timer.start()
+
+    @QtCore.Slot()
+    def _send_completer_request(self) -> None:
+        """Request the suggestions for the last query from Spansh."""
+        query, completer = self._pending_completer_query
         self._completer_request = make_network_request(
-            SPANSH_API_URL + "/systems/field_values/system_names",
+            settings.General.spansh_api_url + "/systems/field_values/system_names",
             params={"q": query},
             finished_callback=partial(
                 self._update_model_from_completer_query_result,
@@ -466,9 +561,8 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
     ) -> None:
         with suppress(NetworkError):
             response = json_from_network_req(reply)
-            suggestions = self._completer_cache[query_to_cache.casefold()] = (
-                intern_list(response["values"])
-            )
+            suggestions = response["values"]
+            self._completer_cache.put(query_to_cache, suggestions)
 
             completer.model().set_string_list(suggestions)
             completer.complete()
@@ -493,9 +587,10 @@ class SpanshTabBase(TabBase, SpanshTabGUIBase):
 
     @QtCore.Slot()
     def _close_cleanup(self) -> None:
-        """Abort any requests on close and disconnect signals."""
+        """Abort any requests on close, save the completer cache and disconnect signals."""
         if self._completer_request is not None:
             self._completer_request.abort()
+        self._completer_cache.save()
         for connection in self._connections:
             self._journal.disconnect(connection)
 
@@ -583,6 +678,7 @@ class ExactTab(SpanshTabBase, ExactTabGUI):  # noqa: D101
             and not self._journal.shut_down
             and (self._journal.ship is not None or self.use_clipboard_checkbox.checked)
         )
+        self.compare_button.enabled = self.submit_button.enabled
 
     @QtCore.Slot()
     def _update_from_cargo(self, new_cargo: int) -> None:
@@ -638,6 +734,7 @@ class RoadToRichesTab(SpanshTabBase, RoadToRichesTabGUI):  # noqa: D101
             and self._journal is not None
             and not self._journal.shut_down
         )
+        self.compare_button.enabled = self.submit_button.enabled
 
     def event_filter(self, watched: QtWidgets.QWidget, event: QtCore.QEvent) -> bool:
         """Allow scrolling when hovering disabled loop checkbox."""
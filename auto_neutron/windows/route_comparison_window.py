@@ -0,0 +1,159 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import collections.abc
+import logging
+
+from PySide6 import QtCore, QtGui, QtWidgets
+from __feature__ import snake_case, true_property  # noqa: F401
+
+from auto_neutron.route import Route
+from auto_neutron.spansh_request_manager import (
+    RouteComparison,
+    SpanshJob,
+    SpanshRequestManager,
+)
+
+from .gui.route_comparison_window import RouteComparisonWindowGUI
+
+log = logging.getLogger(__name__)
+
+
+class RouteComparisonWindow(RouteComparisonWindowGUI):
+    """
+    Plot routes with different settings concurrently through `request_manager`, and compare them side by side.
+
+    The settings column only shows the parameters that differ between the plotted routes.
+    `route_selected` is emitted with the selected route when the user chooses to use it.
+    """
+
+    route_selected = QtCore.Signal(Route)
+
+    def __init__(
+        self, parent: QtWidgets.QWidget, request_manager: SpanshRequestManager
+    ):
+        super().__init__(parent)
+        self._request_manager = request_manager
+        self._plots = list[
+            tuple[collections.abc.Mapping, SpanshJob | None, Route | None]
+        ]()
+        self.table.itemSelectionChanged.connect(self._set_use_route_sensitive)
+        self.table.cellDoubleClicked.connect(self._emit_selected_route)
+        self.use_route_button.pressed.connect(self._emit_selected_route)
+        self.retranslate()
+
+    def plot(
+        self,
+        endpoint: str,
+        params: collections.abc.Mapping,
+        route_type: type[Route],
+    ) -> None:
+        """Add a route plotted by `endpoint` with `params` to the comparison, without aborting the other plots."""
+        log.info(f"Adding route from {endpoint} to the comparison.")
+        route = self._request_manager.cached_route(endpoint, params)
+        if route is not None:
+            self._plots.append((params, None, route))
+        else:
+            job = self._request_manager.submit(
+                endpoint,
+                params,
+                route_type,
+                result_callback=self._update_rows,
+                error_callback=self._update_rows,
+            )
+            self._plots.append((params, job, None))
+        self._update_rows()
+
+    def abort(self) -> None:
+        """Abort the plots that are still running."""
+        for _params, job, _route in self._plots:
+            if job is not None:
+                job.abort()
+
+    @property
+    def comparisons(self) -> list[RouteComparison]:
+        """The summaries of the compared routes, in the order they were added."""  # noqa: D401
+        return [
+            (
+                RouteComparison.from_job(job)
+                if job is not None
+                else RouteComparison.from_route(params, route)
+            )
+            for params, job, route in self._plots
+        ]
+
+    def _selected_route(self) -> Route | None:
+        """Get the selected route, or None if no route is selected or it wasn't received."""
+        rows = self.table.selection_model().selected_rows()
+        if not rows:
+            return None
+        __, job, route = self._plots[rows[0].row()]
+        if job is not None:
+            return None if job.error is not None else job.route
+        return route
+
+    def _update_rows(self, *args: object) -> None:
+        """Fill the table with the compared routes' settings, totals and plot status."""
+        comparisons = self.comparisons
+        first_params = comparisons[0].params
+        keys = [
+            key
+            for key in first_params
+            if any(
+                comparison.params.get(key) != first_params[key]
+                for comparison in comparisons
+            )
+        ]
+        if not keys:
+            keys = [key for key in first_params if key not in {"from", "to"}]
+
+        self.table.row_count = len(comparisons)
+        for row, comparison in enumerate(comparisons):
+            if comparison.total_jumps is None:
+                jumps = distance = ""
+            else:
+                jumps = str(comparison.total_jumps)
+                if comparison.total_distance is None:
+                    distance = "-"
+                else:
+                    distance = (
+                        format(comparison.total_distance, ".2f").rstrip("0").rstrip(".")
+                        + " Ly"
+                    )
+            if comparison.error is not None:
+                status = comparison.error
+            elif comparison.total_jumps is None:
+                status = _("Plotting")
+            else:
+                status = _("Done")
+
+            settings_text = ", ".join(
+                f"{key}: {comparison.params.get(key)}" for key in keys
+            )
+            for column, text in enumerate((settings_text, jumps, distance, status)):
+                self.table.set_item(row, column, QtWidgets.QTableWidgetItem(text))
+        self.table.resize_columns_to_contents()
+        self._set_use_route_sensitive()
+
+    @QtCore.Slot()
+    def _set_use_route_sensitive(self) -> None:
+        """Enable the use route button when a received route is selected."""
+        self.use_route_button.enabled = self._selected_route() is not None
+
+    @QtCore.Slot()
+    def _emit_selected_route(self) -> None:
+        """Emit `route_selected` with the selected route if it was received."""
+        route = self._selected_route()
+        if route is not None:
+            self.route_selected.emit(route)
+
+    def close_event(self, event: QtGui.QCloseEvent) -> None:
+        """Abort the running plots on close."""
+        self.abort()
+
+    def change_event(self, event: QtCore.QEvent) -> None:
+        """Retranslate the GUI when a language change occurs."""
+        if event.type() == QtCore.QEvent.Type.LanguageChange:
+            self.retranslate()
@@ -5,7 +5,7 @@ import dataclasses
 import typing as t
 from functools import cached_property
 
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 from __feature__ import snake_case, true_property  # noqa: F401
 
 from auto_neutron.route import (
@@ -46,21 +46,14 @@ class RouteTableHeader:
 
     _header_sections: t.ClassVar[tuple[HeaderSection, ...]]
 
-    def __init__(self, table: QtWidgets.QTableWidget):
+    def __init__(self, table: QtWidgets.QTableView):
         self._table = table
         self._remaining_jumps: int | None = None
         self._total_jumps: int | None = None
         self._delegates = []
 
     def initialize_headers(self) -> None:
-        """Initialize the table's columns and headers."""
-        self._table.column_count = self.column_count
-        for column in range(self.column_count):
-            if self._table.horizontal_header_item(column) is None:
-                self._table.set_horizontal_header_item(
-                    column, QtWidgets.QTableWidgetItem()
-                )
-
+        """Initialize the table's column resize modes and delegates."""
         header = self._table.horizontal_header()
         for index, header_section in enumerate(self._header_sections):
             header.set_section_resize_mode(index, header_section.resize_mode)
@@ -76,30 +69,31 @@ class RouteTableHeader:
     def retranslate_headers(self) -> None:
         """Retranslate the headers of the table."""
         for index, header_section in enumerate(self._header_sections):
-            if (
-                not header_section.has_jumps
-                and (header := self._table.horizontal_header_item(index)) is not None
-            ):
-                header.set_text(_(header_section.text))
+            if not header_section.has_jumps:
+                self._table.model().set_header_data(
+                    index, QtCore.Qt.Orientation.Horizontal, _(header_section.text)
+                )
 
         self.format_jump_header()
 
-    def item_changed(self, item: QtWidgets.QTableWidgetItem) -> None:
+    def item_changed(self, column: int) -> None:
         """
-        Update the headers after a change to `item`.
+        Update the headers after a change to an item in `column`.
 
         By default resizes the first column if the changes was in that column.
         """
-        if item.column() == 0:
+        if column == 0:
             self._table.resize_column_to_contents(0)
 
     def format_jump_header(self) -> None:
         """Update the header with the jump information."""
-        self._table.horizontal_header_item(self._jump_col_index).set_text(
+        self._table.model().set_header_data(
+            self._jump_col_index,
+            QtCore.Qt.Orientation.Horizontal,
             _(self._header_sections[self._jump_col_index].text).format(
                 self._remaining_jumps,
                 self._total_jumps,
-            )
+            ),
         )
         self._table.resize_column_to_contents(self._jump_col_index)
 
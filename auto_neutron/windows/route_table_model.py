@@ -0,0 +1,165 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+from __future__ import annotations
+
+import dataclasses
+import typing as t
+
+from PySide6 import QtCore, QtGui
+from __feature__ import snake_case, true_property  # noqa: F401
+
+if t.TYPE_CHECKING:
+    from auto_neutron.route import Route
+
+_INACTIVE_BRUSH = QtGui.QBrush(QtGui.QColor(150, 150, 150))
+
+
+class RouteTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model reading its data directly from the entries of a route.
+
+    Rows before `inactive_before` are displayed as inactive with a grey foreground.
+    `route_edited` is emitted with the row, column and the row's previous system after an edit of the route.
+    """
+
+    route_edited = QtCore.Signal(int, int, str)
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._route: Route | None = None
+        self._row_count = 0
+        self._header_labels: list[str] = []
+        self._bool_columns = frozenset[int]()
+        self._inactive_before = 0
+
+    def set_route(self, route: Route) -> None:
+        """Reset the model to display `route`."""
+        self.begin_reset_model()
+        self._route = route
+        fields = dataclasses.fields(route.row_type)
+        self._header_labels = [""] * len(fields)
+        self._bool_columns = frozenset(
+            column for column, field in enumerate(fields) if field.type == "bool"
+        )
+        self._inactive_before = 0
+        self._row_count = len(route.entries)
+        self.end_reset_model()
+
+    def rows_appended(self) -> None:
+        """
+        Insert the rows that were appended to the route since it was set or rows were last inserted.
+
+        The model keeps its own row count, so views only see the new rows once they're inserted here.
+        """
+        row_count = len(self._route.entries)
+        if row_count == self._row_count:
+            return
+        self.begin_insert_rows(QtCore.QModelIndex(), self._row_count, row_count - 1)
+        self._row_count = row_count
+        self.end_insert_rows()
+
+    @property
+    def inactive_before(self) -> int:
+        """The index of the first active row."""  # noqa: D401
+        return self._inactive_before
+
+    @inactive_before.setter
+    def inactive_before(self, index: int) -> None:
+        """Set the index of the first active row, only the rows between the old and new index are updated."""
+        first_changed, last_changed = sorted((self._inactive_before, index))
+        self._inactive_before = index
+        last_changed = min(last_changed, self.row_count()) - 1
+        if first_changed <= last_changed:
+            self.dataChanged.emit(
+                self.index(first_changed, 0),
+                self.index(last_changed, self.column_count() - 1),
+                [QtCore.Qt.ItemDataRole.ForegroundRole],
+            )
+
+    def row_count(  # noqa: D102
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = None
+    ) -> int:
+        if self._route is None or (parent is not None and parent.is_valid()):
+            return 0
+        return self._row_count
+
+    def column_count(  # noqa: D102
+        self, parent: QtCore.QModelIndex | QtCore.QPersistentModelIndex = None
+    ) -> int:
+        if parent is not None and parent.is_valid():
+            return 0
+        return len(self._header_labels)
+
+    def data(  # noqa: D102
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> t.Any:
+        if role in {
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+        }:
+            value = self._route.entries.value(index.row(), index.column())
+            if index.column() in self._bool_columns:
+                return bool(value)
+            return value
+        elif role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
+        elif (
+            role == QtCore.Qt.ItemDataRole.ForegroundRole
+            and index.row() < self._inactive_before
+        ):
+            return _INACTIVE_BRUSH
+        return None
+
+    def set_data(  # noqa: D102
+        self,
+        index: QtCore.QModelIndex | QtCore.QPersistentModelIndex,
+        value: t.Any,
+        role: int = QtCore.Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if role != QtCore.Qt.ItemDataRole.EditRole or not index.is_valid():
+            return False
+        entry = self._route.entries[index.row()]
+        previous_system = entry.system
+        entry[index.column()] = value
+        self.dataChanged.emit(index, index)
+        self.route_edited.emit(index.row(), index.column(), previous_system)
+        return True
+
+    def flags(  # noqa: D102
+        self, index: QtCore.QModelIndex | QtCore.QPersistentModelIndex
+    ) -> QtCore.Qt.ItemFlag:
+        if not index.is_valid():
+            return super().flags(index)
+        return super().flags(index) | QtCore.Qt.ItemFlag.ItemIsEditable
+
+    def header_data(  # noqa: D102
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole,
+    ) -> t.Any:
+        if (
+            orientation == QtCore.Qt.Orientation.Horizontal
+            and role == QtCore.Qt.ItemDataRole.DisplayRole
+            and section < len(self._header_labels)
+        ):
+            return self._header_labels[section]
+        return None
+
+    def set_header_data(  # noqa: D102
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        value: t.Any,
+        role: int = QtCore.Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if orientation != QtCore.Qt.Orientation.Horizontal or section >= len(
+            self._header_labels
+        ):
+            return False
+        self._header_labels[section] = value
+        self.headerDataChanged.emit(orientation, section, section)
+        return True
@@ -7,7 +7,6 @@ import contextlib
 import json
 import logging
 import typing as t
-from functools import partial
 
 from PySide6 import QtCore
 from __feature__ import snake_case, true_property  # noqa: F401
@@ -18,6 +17,7 @@ from auto_neutron.route import Route
 
 if t.TYPE_CHECKING:
     import collections.abc
+    from pathlib import Path
 
     from auto_neutron.game_state import Location
     from auto_neutron.journal import Journal
@@ -26,50 +26,107 @@ log = logging.getLogger(__name__)
 
 
 class _WorkerBase(QtCore.QObject):
-    """The base class used for workers that advance generators at a given interval."""
+    """
+    The base class used for workers that advance generators when a file changes.
+
+    The generator should yield whether it found new data after being advanced.
+    Changes to the watched file are picked up through a file system watcher,
+    with a fallback poll timer that starts at `min_interval` and backs off up to `max_interval`
+    while the generator doesn't find any new data.
+    """
 
     def __init__(
         self,
         parent: QtCore.QObject,
-        generator: collections.abc.Generator,
-        interval: int,
+        generator: collections.abc.Generator[bool, None, None],
+        watched_path: Path,
+        *,
+        min_interval: int,
+        max_interval: int,
     ):
         super().__init__(parent)
         self._generator = generator
+        self._watched_path = watched_path
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._file_changed)
+
         self._timer = QtCore.QTimer(self)
-        self._timer.interval = interval
-        self._timer.timeout.connect(partial(next, self._generator))
+        self._timer.single_shot_ = True
+        self._timer.interval = min_interval
+        self._timer.timeout.connect(self._advance)
         self._stopped = False
 
     def start(self) -> None:
         """Start the worker to tail the journal file."""
-        log.debug("Starting GameWorker.")
+        log.debug(f"Starting {self.__class__.__name__}.")
         if self._stopped:
             raise RuntimeError("Can't restart a stopped worker.")
+        self._watch_path()
         self._timer.start()
 
     def stop(self) -> None:
         """Stop the worker from tailing the journal file."""
         log.debug(f"Stopping {self.__class__.__name__}.")
         self._timer.stop()
+        if self._watcher.files():
+            self._watcher.remove_paths(self._watcher.files())
         self._generator.close()
         self._stopped = True
 
+    @QtCore.Slot(str)
+    def _file_changed(self, _path: str) -> None:
+        """Advance the generator after a change notification, and re-add the path if the file was replaced."""
+        if self._stopped:
+            return
+        self._watch_path()
+        self._advance()
+
+    @QtCore.Slot()
+    def _advance(self) -> None:
+        """
+        Advance the generator and schedule the next fallback poll.
+
+        The poll interval is reset when new data was found, and doubled otherwise.
+        """
+        if next(self._generator):
+            self._timer.interval = self._min_interval
+        else:
+            self._timer.interval = min(self._timer.interval * 2, self._max_interval)
+        self._timer.start()
+
+    def _watch_path(self) -> None:
+        """Watch the worker's path if it isn't being watched already."""
+        path_str = str(self._watched_path)
+        if path_str not in self._watcher.files() and self._watched_path.exists():
+            self._watcher.add_path(path_str)
+
 
 class GameWorker(_WorkerBase):
-    """Handle dispatching route signals from the journal's tailer."""
+    """
+    Handle dispatching route signals from the journal's tailer.
+
+    Reaching the last row of a route that's still being populated doesn't end the route,
+    the location is kept until `emit_pending_system` is called after the route changes.
+    """
 
     new_system_index_sig = QtCore.Signal(int)
     route_end_sig = QtCore.Signal(int)
 
     def __init__(self, parent: QtCore.QObject, route: Route | None, journal: Journal):
-        super().__init__(parent, journal.tail(), 500)
+        super().__init__(
+            parent, journal.tail(), journal.path, min_interval=100, max_interval=500
+        )
         self.route = route
+        self._pending_location: Location | None = None
         self._journal_connection = journal.system_sig.connect(self.emit_next_system)
 
     @QtCore.Slot(object)
     def emit_next_system(self, location: Location) -> None:
         """Emit the next system in the route and its index if location is in the route, or the end of route signal."""
+        self._pending_location = None
         if self.route is None:
             return
 
@@ -77,12 +134,19 @@ class GameWorker(_WorkerBase):
             new_index = self.route.system_index(location.name) + 1
             if new_index < len(self.route.entries):
                 self.new_system_index_sig.emit(new_index)
+            elif self.route.populating:
+                self._pending_location = location
             else:
                 if settings.General.loop_routes:
                     self.new_system_index_sig.emit(0)
                 else:
                     self.route_end_sig.emit(new_index)
 
+    def emit_pending_system(self) -> None:
+        """Emit the next system for the location that reached the end of the route while it was populating."""
+        if self._pending_location is not None:
+            self.emit_next_system(self._pending_location)
+
     def stop(self) -> None:
         """Disconnect the journal system signal."""
         super().stop()
@@ -95,10 +159,12 @@ class StatusWorker(_WorkerBase):
     status_signal = QtCore.Signal(dict)
 
     def __init__(self, parent: QtCore.QObject):
-        super().__init__(parent, self.read_status(), 250)
+        super().__init__(
+            parent, self.read_status(), STATUS_PATH, min_interval=100, max_interval=1000
+        )
 
-    def read_status(self) -> collections.abc.Generator[None, None, None]:
-        """Emit status_signal with the status dict on every status file change."""
+    def read_status(self) -> collections.abc.Generator[bool, None, None]:
+        """Emit status_signal with the status dict on every status file change, yield whether it changed."""
         last_content = None
         with open(STATUS_PATH, encoding="utf8") as file:
             while True:
@@ -107,4 +173,6 @@ class StatusWorker(_WorkerBase):
                 if content and content != last_content:
                     self.status_signal.emit(json.loads(content))
                     last_content = content
-                yield
+                    yield True
+                else:
+                    yield False
@@ -0,0 +1,373 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+"""
+A local stand-in for the Spansh API, to run the plotters without network access.
+
+Submitting a route to `/api/route`, `/api/generic/route` or `/api/riches/route` queues a job
+that finishes after a duration taken from the server's `job_durations`.
+Results are polled from `/api/results/<job>`, and queued responses include the job's `eta`
+and `queue_position` if `report_progress` is set.
+`/api/nearest` and `/api/systems/field_values/system_names` respond immediately.
+
+Every response is delayed by `latency` seconds. Routes have `route_systems` systems if it's set,
+otherwise the number of systems follows from the distance and jump range,
+and `system_name_count` names are suggested for every query.
+"""
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import hashlib
+import itertools
+import json
+import math
+import threading
+import time
+import typing as t
+import urllib.parse
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_ROUTE_DISTANCE = 22_000
+
+
+def _route_names(source: str, destination: str, systems: int) -> list[str]:
+    """Get the names of a route with `systems` systems from `source` to `destination`."""
+    return [
+        source,
+        *(f"Synthetic Sector {index}" for index in range(max(systems - 2, 0))),
+        destination,
+    ]
+
+
+def neutron_route_result(
+    source: str,
+    destination: str,
+    *,
+    range_: float = 60,
+    efficiency: float = 60,
+    distance: float = DEFAULT_ROUTE_DISTANCE,
+    systems: int | None = None,
+) -> dict:
+    """
+    Create a synthetic neutron route result from `source` to `destination`.
+
+    Lower efficiencies take longer detours through neutron stars with fewer jumps in between them.
+    The route has `systems` systems if it's passed.
+    """
+    total_distance = distance * (1 + (100 - efficiency) / 1000)
+    boosted_range = range_ * 4
+    if systems is None:
+        systems = math.ceil(total_distance / boosted_range) + 1
+    else:
+        boosted_range = total_distance / max(systems - 1, 1)
+    jumps_per_system = 1 + int(efficiency // 50)
+    return {
+        "source_system": source,
+        "destination_system": destination,
+        "system_jumps": [
+            {
+                "system": name,
+                "distance_jumped": min(boosted_range, total_distance) if index else 0,
+                "distance_left": max(total_distance - index * boosted_range, 0),
+                "jumps": jumps_per_system if index else 0,
+            }
+            for index, name in enumerate(_route_names(source, destination, systems))
+        ],
+    }
+
+
+def exact_route_result(
+    source: str,
+    destination: str,
+    *,
+    range_: float = 50,
+    distance: float = DEFAULT_ROUTE_DISTANCE,
+    systems: int | None = None,
+) -> dict:
+    """
+    Create a synthetic galaxy plotter result from `source` to `destination` with a jump range of `range_`.
+
+    Every fourth system is a neutron star, and fuel is scooped every tenth jump.
+    The route has `systems` systems if it's passed.
+    """
+    if systems is None:
+        systems = math.ceil(distance / range_) + 1
+    else:
+        range_ = distance / max(systems - 1, 1)
+    return {
+        "source_system": source,
+        "destination_system": destination,
+        "jumps": [
+            {
+                "name": name,
+                "distance": min(range_, distance) if index else 0,
+                "distance_to_destination": max(distance - index * range_, 0),
+                "must_refuel": int(index % 10 == 9),
+                "has_neutron": index % 4 == 3,
+            }
+            for index, name in enumerate(_route_names(source, destination, systems))
+        ],
+    }
+
+
+def riches_route_result(
+    source: str,
+    destination: str | None,
+    *,
+    max_results: int = 100,
+    systems: int | None = None,
+) -> list[dict]:
+    """
+    Create a synthetic road to riches result from `source`, visiting `max_results` systems or `systems` if it's passed.
+
+    Every system has one to three bodies, the route loops back to `source` if there's no `destination`.
+    """
+    if systems is None:
+        systems = max_results
+    return [
+        {
+            "name": name,
+            "jumps": 0 if index == 0 else 1 + index % 3,
+            "bodies": [
+                {
+                    "name": f"{name} {body_index + 1}",
+                    "estimated_scan_value": 500_000 + 10_000 * index,
+                    "estimated_mapping_value": 1_500_000 + 30_000 * index,
+                }
+                for body_index in range(1 + index % 3)
+            ],
+        }
+        for index, name in enumerate(
+            _route_names(source, destination or source, systems)
+        )
+    ]
+
+
+def nearest_result(x: float, y: float, z: float) -> dict:
+    """Create a synthetic nearest system response for the coordinates, the system is offset from them by a few ly."""
+    return {
+        "system": {
+            "name": f"Synthetic Sector {round(x)} {round(y)} {round(z)}",
+            "distance": 3.0,
+            "x": x + 1,
+            "y": y + 2,
+            "z": z + 2,
+        }
+    }
+
+
+def system_names_result(query: str, count: int = 20) -> dict:
+    """Create a synthetic system name suggestion response with `count` names starting with `query`."""
+    seed = int.from_bytes(hashlib.sha256(query.encode()).digest()[:2], "big")
+    return {
+        "values": [f"{query}{suffix}" for suffix in range(seed, seed + count)],
+    }
+
+
+class FakeSpanshServer(ThreadingHTTPServer):
+    """
+    Serve the fake Spansh API on `address`.
+
+    `polls` counts the result requests made for every job.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        *,
+        job_durations: collections.abc.Iterable[float] = (2,),
+        report_progress: bool = False,
+        latency: float = 0,
+        route_systems: int | None = None,
+        system_name_count: int = 20,
+    ):
+        super().__init__(address, _SpanshRequestHandler)
+        self.report_progress = report_progress
+        self.latency = latency
+        self.route_systems = route_systems
+        self.system_name_count = system_name_count
+        self.polls = collections.Counter[str]()
+        self._job_durations = itertools.cycle(job_durations)
+        self._jobs: dict[str, tuple[float, t.Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def api_url(self) -> str:
+        """The base URL of the API."""  # noqa: D401
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def submit_job(self, result: t.Any) -> str:
+        """Queue a job finishing with `result` after the next job duration, return its id."""
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            finished_at = time.monotonic() + next(self._job_durations)
+            self._jobs[job_id] = (finished_at, result)
+        return job_id
+
+    def job_response(self, job_id: str) -> dict | None:
+        """Get the response for a poll of `job_id`, or None if there's no such job."""
+        with self._lock:
+            self.polls[job_id] += 1
+            if job_id not in self._jobs:
+                return None
+            finished_at, result = self._jobs[job_id]
+            remaining = finished_at - time.monotonic()
+            queue_position = sum(
+                other_finished_at < finished_at
+                for other_finished_at, _ in self._jobs.values()
+                if other_finished_at > time.monotonic()
+            )
+        if remaining <= 0:
+            return {"job": job_id, "status": "ok", "result": result}
+        response = {"job": job_id, "status": "queued"}
+        if self.report_progress:
+            response["eta"] = remaining
+            response["queue_position"] = queue_position
+        return response
+
+
+class _SpanshRequestHandler(BaseHTTPRequestHandler):
+    server: FakeSpanshServer
+    # Keep connections alive between requests like Spansh does,
+    # without Nagle's algorithm delaying the body written after the headers.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        try:
+            if url.path.startswith("/api/results/"):
+                response = self.server.job_response(url.path.rsplit("/", 1)[1])
+                if response is None:
+                    self._send_json({"error": "Job not found"}, HTTPStatus.NOT_FOUND)
+                else:
+                    self._send_json(response)
+            elif url.path == "/api/route":
+                self._submit_route(
+                    neutron_route_result(
+                        params["from"],
+                        params["to"],
+                        range_=float(params.get("range", 60)),
+                        efficiency=float(params.get("efficiency", 60)),
+                        systems=self.server.route_systems,
+                    ),
+                )
+            elif url.path == "/api/generic/route":
+                self._submit_route(
+                    exact_route_result(
+                        params["source"],
+                        params["destination"],
+                        systems=self.server.route_systems,
+                    ),
+                )
+            elif url.path == "/api/riches/route":
+                self._submit_route(
+                    riches_route_result(
+                        params["from"],
+                        params.get("to") or None,
+                        max_results=int(params.get("max_results", 100)),
+                        systems=self.server.route_systems,
+                    ),
+                )
+            elif url.path == "/api/nearest":
+                self._send_json(
+                    nearest_result(
+                        float(params["x"]), float(params["y"]), float(params["z"])
+                    )
+                )
+            elif url.path == "/api/systems/field_values/system_names":
+                self._send_json(
+                    system_names_result(params["q"], self.server.system_name_count)
+                )
+            else:
+                self._send_json({"error": "Unknown endpoint"}, HTTPStatus.NOT_FOUND)
+        except (KeyError, ValueError) as e:
+            self._send_json(
+                {"error": f"Invalid parameters: {e}"}, HTTPStatus.BAD_REQUEST
+            )
+
+    def _submit_route(self, result: t.Any) -> None:
+        """Queue a job finishing with `result` and send its queued response."""
+        job_id = self.server.submit_job(result)
+        self._send_json({"job": job_id, "status": "queued"})
+
+    def _send_json(self, content: t.Any, status: HTTPStatus = HTTPStatus.OK) -> None:
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: t.Any) -> None:  # noqa: A002
+        """Don't log requests to stderr."""
+
+
+def main() -> None:
+    """Serve the fake API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8000)
+    parser.add_argument(
+        "-d",
+        "--job-durations",
+        nargs="+",
+        type=float,
+        default=[2],
+        help="seconds until a job finishes, cycled through for every submitted job",
+    )
+    parser.add_argument(
+        "--report-progress",
+        action="store_true",
+        help="include the eta and queue position in queued responses",
+    )
+    parser.add_argument(
+        "-l",
+        "--latency",
+        type=float,
+        default=0,
+        help="seconds every response is delayed by",
+    )
+    parser.add_argument(
+        "-s",
+        "--route-systems",
+        type=int,
+        default=None,
+        help="number of systems in every plotted route",
+    )
+    parser.add_argument(
+        "--system-name-count",
+        type=int,
+        default=20,
+        help="number of system names suggested for every query",
+    )
+    args = parser.parse_args()
+
+    server = FakeSpanshServer(
+        (args.host, args.port),
+        job_durations=args.job_durations,
+        report_progress=args.report_progress,
+        latency=args.latency,
+        route_systems=args.route_systems,
+        system_name_count=args.system_name_count,
+    )
+    print(f"Serving the fake Spansh API at {server.api_url}")  # noqa: T201
+    print(  # noqa: T201
+        "Set spansh_api_url in the General section of the settings to use it."
+    )
+    with server:
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
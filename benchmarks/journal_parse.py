@@ -0,0 +1,214 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+"""Compare the journal parsers against a per line `readline()` parser on synthetic journals."""
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from auto_neutron.journal import Journal
+
+NOISE_EVENTS = (
+    {
+        "event": "Scan",
+        "ScanType": "Detailed",
+        "BodyName": "Synthetic Sector AB-C d1-23 4 a",
+        "BodyID": 12,
+        "Parents": [{"Planet": 11}, {"Star": 0}],
+        "DistanceFromArrivalLS": 1234.56789,
+        "TidalLock": False,
+        "TerraformState": "",
+        "PlanetClass": "Icy body",
+        "Atmosphere": "",
+        "Volcanism": "",
+        "MassEM": 0.001234,
+        "Radius": 1234567.0,
+        "SurfaceGravity": 0.123456,
+        "SurfaceTemperature": 45.678,
+        "Landable": True,
+        "Materials": [
+            {"Name": "sulphur", "Percent": 26.5},
+            {"Name": "carbon", "Percent": 22.3},
+            {"Name": "phosphorus", "Percent": 14.3},
+            {"Name": "iron", "Percent": 12.0},
+        ],
+    },
+    {"event": "Music", "MusicTrack": "Supercruise"},
+    {
+        "event": "ReceiveText",
+        "From": "",
+        "Message": "$COMMS_entered:#name=$cmdr_decorate:#name=Synthetic;",
+        "Channel": "npc",
+    },
+    {
+        "event": "FSSSignalDiscovered",
+        "SystemAddress": 12345678,
+        "SignalName": "$MULTIPLAYER_SCENARIO14_TITLE;",
+        "IsStation": False,
+    },
+)
+
+LOADOUT_EVENT = {
+    "event": "Loadout",
+    "Ship": "asp",
+    "ShipID": 1,
+    "UnladenMass": 345.6,
+    "CargoCapacity": 16,
+    "FuelCapacity": {"Main": 32.0, "Reserve": 0.63},
+    "Modules": [
+        {
+            "Slot": "FrameShiftDrive",
+            "Item": "int_hyperdrive_size5_class5",
+            "On": True,
+            "Priority": 0,
+        },
+        {
+            "Slot": "Slot01_Size6",
+            "Item": "int_guardianfsdbooster_size5",
+            "On": True,
+            "Priority": 0,
+        },
+    ],
+}
+
+
+def write_synthetic_journal(path: Path, size: int, seed: int = 0) -> int:
+    """
+    Write a journal of roughly `size` bytes with mostly noise events to `path`, return the number of lines.
+
+    The loadout is only written after the header, so recovering the state has to search the whole journal for it.
+    """
+    rng = random.Random(seed)
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(0))
+    written = 0
+    lines = 0
+    with path.open("w", encoding="utf8", newline="\r\n") as journal_file:
+        for entry in (
+            {"event": "Fileheader", "Odyssey": True},
+            {"event": "Commander", "Name": "Synthetic"},
+            LOADOUT_EVENT,
+        ):
+            line = json.dumps({"timestamp": timestamp, **entry}, separators=(",", ":"))
+            journal_file.write(line + "\n")
+        while written < size:
+            roll = rng.random()
+            if roll < 0.05:
+                entries = (
+                    {
+                        "event": "FSDTarget",
+                        "Name": f"Synthetic Sector {lines}",
+                        "SystemAddress": rng.getrandbits(55),
+                        "RemainingJumpsInRoute": rng.randint(1, 100),
+                    },
+                    {
+                        "event": "FSDJump",
+                        "StarSystem": f"Synthetic Sector {lines}",
+                        "StarPos": [rng.uniform(-1000, 1000) for _ in range(3)],
+                    },
+                )
+            elif roll < 0.06:
+                entries = (
+                    {
+                        "event": "Cargo",
+                        "Vessel": rng.choice(("Ship", "SRV")),
+                        "Count": rng.randint(0, 16),
+                    },
+                )
+            else:
+                entries = (rng.choice(NOISE_EVENTS),)
+            for entry in entries:
+                line = json.dumps(
+                    {"timestamp": timestamp, **entry}, separators=(",", ":")
+                )
+                journal_file.write(line + "\n")
+                written += len(line) + 2
+                lines += 1
+    return lines
+
+
+def readline_parse(journal: Journal) -> None:
+    """Parse the journal by decoding every line read through `readline()`."""
+    with journal.path.open(encoding="utf8") as journal_file:
+        while line := journal_file.readline():
+            entry = json.loads(line)
+            if (handler := journal._event_handlers.get(entry["event"])) is not None:
+                handler(entry)
+
+
+def chunked_parse(journal: Journal) -> None:
+    """Parse the journal by reading it in chunks, like the journal tailer does."""
+    with journal.path.open("rb") as journal_file:
+        journal._parse_new_lines(journal_file)
+
+
+def mmap_parse(journal: Journal) -> None:
+    """Parse the journal through the memory mapped forward parse of `Journal.parse`, resuming after the header."""
+    with journal.path.open("rb") as journal_file:
+        journal._last_file_pos = len(journal_file.readline())
+    journal.parse()
+
+
+def recover_state(journal: Journal) -> None:
+    """Recover the journal's state through `Journal.recover_state`."""
+    journal.recover_state()
+
+
+PARSE_FUNCS = (readline_parse, chunked_parse, mmap_parse, recover_state)
+
+
+def measure_peak_memory(
+    parse_func: collections.abc.Callable[[Journal], None], path: Path
+) -> int:
+    """Get the peak memory traced by tracemalloc while `parse_func` parses the journal at `path`."""
+    journal = Journal(path)
+    tracemalloc.start()
+    try:
+        parse_func(journal)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the parsers over journals of the sizes passed in by the user and print the best timings and peak memory."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=float,
+        default=[1, 5, 20],
+        help="journal sizes in MB",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            path = Path(temp_dir, f"Journal.{size}.log")
+            lines = write_synthetic_journal(path, int(size * 1024 * 1024))
+            print(f"{size} MB, {lines} lines:")  # noqa: T201
+            for parse_func in PARSE_FUNCS:
+                best = float("inf")
+                for _ in range(args.repeat):
+                    journal = Journal(path)
+                    start = time.perf_counter()
+                    parse_func(journal)
+                    best = min(best, time.perf_counter() - start)
+                peak_memory = measure_peak_memory(parse_func, path)
+
+                print(  # noqa: T201
+                    f"    {parse_func.__name__:>15}: {best * 1000:8.1f} ms,"
+                    f" peak memory {peak_memory / 1024:8.1f} KiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
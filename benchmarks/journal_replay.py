@@ -0,0 +1,539 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+"""
+Generate synthetic game sessions and replay them against the journal tailer, status worker and fuel warner.
+
+Sessions consist of bursts of FSDJump events with noise events in between, large Loadout events,
+Status.json updates, and a final Shutdown. They are replayed either offline at full speed,
+or live with the timing of the game.
+The replay runs in a temporary user profile so `JOURNAL_PATH` points to the generated files,
+and the latency from an event being written to it being handled is reported.
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import datetime
+import gettext
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import typing as t
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# JOURNAL_PATH is created from the user profile on import, never replay into the real journal directory.
+os.environ["userprofile"] = tempfile.mkdtemp(prefix="auto_neutron_replay")
+
+from PySide6 import QtCore, QtWidgets  # noqa: E402
+from __feature__ import snake_case, true_property  # noqa: F401, E402
+
+from auto_neutron.constants import JOURNAL_PATH, STATUS_PATH  # noqa: E402
+from auto_neutron.fuel_warn import (  # noqa: E402
+    FSD_COOLDOWN_FLAG,
+    IN_SUPERCRUISE_FLAG,
+    FuelWarn,
+)
+from auto_neutron.game_state import PlotterState  # noqa: E402
+from auto_neutron.plotters import Plotter  # noqa: E402
+from auto_neutron.route import GenericPlotRow, GenericRoute  # noqa: E402
+from auto_neutron.settings import set_settings  # noqa: E402
+from auto_neutron.settings.toml_settings import TOMLSettings  # noqa: E402
+
+if t.TYPE_CHECKING:
+    import collections.abc
+
+SESSION_START = datetime.datetime(3310, 1, 1, tzinfo=datetime.UTC)
+JOURNAL_FILE_NAME = "Journal.2024-01-01T000000.01.log"
+TANK_SIZE = 32.0
+MAX_FUEL_PER_JUMP = 5.0
+
+NOISE_EVENTS = (
+    {"event": "Music", "MusicTrack": "Supercruise"},
+    {
+        "event": "ReceiveText",
+        "From": "",
+        "Message": "$COMMS_entered:#name=$cmdr_decorate:#name=Synthetic;",
+        "Channel": "npc",
+    },
+    {
+        "event": "FSSSignalDiscovered",
+        "SystemAddress": 12345678,
+        "SignalName": "$MULTIPLAYER_SCENARIO14_TITLE;",
+        "IsStation": False,
+    },
+    {"event": "FuelScoop", "Scooped": 4.2, "Total": 32.0},
+    {"event": "ReservoirReplenished", "FuelMain": 31.5, "FuelReservoir": 0.63},
+)
+
+
+class ReplayEvent(t.NamedTuple):
+    """An entry written to the journal or the status file at `time` seconds from the start of the session."""
+
+    time: float
+    file: t.Literal["journal", "status"]
+    entry: dict
+
+
+def synthetic_loadout(modules: int, rng: random.Random) -> dict:
+    """Create a Loadout event of a ship with `modules` engineered optional modules."""
+    module_list = [
+        {
+            "Slot": "FrameShiftDrive",
+            "Item": "int_hyperdrive_size5_class5",
+            "On": True,
+            "Priority": 0,
+            "Health": 1.0,
+            "Engineering": {
+                "Engineer": "Felicity Farseer",
+                "BlueprintName": "FSD_LongRange",
+                "Level": 5,
+                "Quality": 1.0,
+                "Modifiers": [
+                    {
+                        "Label": "FSDOptimalMass",
+                        "Value": 1692.6,
+                        "OriginalValue": 1050.0,
+                    },
+                    {
+                        "Label": "MaxFuelPerJump",
+                        "Value": MAX_FUEL_PER_JUMP,
+                        "OriginalValue": MAX_FUEL_PER_JUMP,
+                    },
+                ],
+            },
+        },
+        {"Slot": "Slot01_Size5", "Item": "int_guardianfsdbooster_size5", "On": True},
+    ]
+    for index in range(modules):
+        module_list.append(
+            {
+                "Slot": f"Slot{index + 2:02}_Size{rng.randint(1, 6)}",
+                "Item": "int_shieldgenerator_size5_class2",
+                "On": True,
+                "Priority": rng.randint(0, 4),
+                "Health": rng.random(),
+                "Value": rng.randint(1000, 10_000_000),
+                "Engineering": {
+                    "Engineer": "Didi Vatermann",
+                    "BlueprintName": "ShieldGenerator_Reinforced",
+                    "Level": rng.randint(1, 5),
+                    "Quality": rng.random(),
+                    "Modifiers": [
+                        {
+                            "Label": f"Modifier{modifier}",
+                            "Value": rng.uniform(0, 100),
+                            "OriginalValue": rng.uniform(0, 100),
+                            "LessIsGood": rng.randint(0, 1),
+                        }
+                        for modifier in range(8)
+                    ],
+                },
+            }
+        )
+    return {
+        "event": "Loadout",
+        "Ship": "anaconda",
+        "ShipID": 1,
+        "ShipName": "Synthetic",
+        "HullValue": 142_447_820,
+        "UnladenMass": 400.0,
+        "CargoCapacity": 0,
+        "MaxJumpRange": 70.0,
+        "FuelCapacity": {"Main": TANK_SIZE, "Reserve": 1.07},
+        "Modules": module_list,
+    }
+
+
+def route_systems(jumps: int) -> list[str]:
+    """Get the systems of a session with `jumps` jumps, starting with the starting location and ending after the last jump."""
+    return [f"Synthetic Sector {index}" for index in range(jumps + 2)]
+
+
+def generate_session(
+    *,
+    jumps: int = 500,
+    burst_size: int = 20,
+    jump_interval: float = 45,
+    burst_pause: float = 300,
+    status_interval: float = 1,
+    noise_rate: float = 0.5,
+    loadout_modules: int = 40,
+    seed: int = 0,
+) -> list[ReplayEvent]:
+    """
+    Generate the events of a session with `jumps` jumps, sorted by their time.
+
+    The jumps are made in bursts of `burst_size` jumps `jump_interval` seconds apart,
+    with a pause of `burst_pause` seconds and a new Loadout event between bursts.
+    Noise events are written at `noise_rate` events per second,
+    and the status is updated every `status_interval` seconds with the fuel used up by the jumps.
+    """
+    rng = random.Random(seed)
+    systems = route_systems(jumps)
+    events = [
+        ReplayEvent(
+            0,
+            "journal",
+            {"event": "Fileheader", "part": 1, "Odyssey": True, "gameversion": "4.0"},
+        ),
+        ReplayEvent(0, "journal", {"event": "Commander", "Name": "Synthetic"}),
+        ReplayEvent(0, "journal", synthetic_loadout(loadout_modules, rng)),
+        ReplayEvent(
+            0,
+            "journal",
+            {"event": "Location", "StarSystem": systems[0], "StarPos": [0, 0, 0]},
+        ),
+    ]
+
+    jump_times = []
+    current_time = 0.0
+    for jump in range(jumps):
+        if jump and not jump % burst_size:
+            current_time += burst_pause
+            events.append(
+                ReplayEvent(
+                    current_time - burst_pause / 2,
+                    "journal",
+                    synthetic_loadout(loadout_modules, rng),
+                )
+            )
+        current_time += jump_interval
+        jump_times.append(current_time)
+        events.append(
+            ReplayEvent(
+                current_time,
+                "journal",
+                {
+                    "event": "FSDJump",
+                    "StarSystem": systems[jump + 1],
+                    "StarPos": [rng.uniform(-1000, 1000) for _ in range(3)],
+                    "JumpDist": rng.uniform(20, 70),
+                    "FuelUsed": MAX_FUEL_PER_JUMP / 2,
+                    "FuelLevel": TANK_SIZE,
+                },
+            )
+        )
+    end_time = current_time + jump_interval
+
+    noise_time = rng.expovariate(noise_rate) if noise_rate else end_time
+    while noise_time < end_time:
+        events.append(ReplayEvent(noise_time, "journal", rng.choice(NOISE_EVENTS)))
+        noise_time += rng.expovariate(noise_rate)
+
+    jump_index = 0
+    status_time = 0.0
+    while status_time < end_time:
+        while jump_index < len(jump_times) and jump_times[jump_index] <= status_time:
+            jump_index += 1
+        flags = IN_SUPERCRUISE_FLAG
+        if jump_index and status_time - jump_times[jump_index - 1] < 10:
+            flags |= FSD_COOLDOWN_FLAG
+        # Refuelled at the start of every burst, the fuel falls under the warning threshold by the end of long ones.
+        fuel = max(
+            TANK_SIZE
+            - (jump_index % burst_size) * MAX_FUEL_PER_JUMP / 2
+            - status_time % 1,
+            0,
+        )
+        events.append(
+            ReplayEvent(
+                status_time,
+                "status",
+                {
+                    "event": "Status",
+                    "Flags": flags,
+                    "Fuel": {"FuelMain": round(fuel, 6), "FuelReservoir": 0.5},
+                    "Cargo": 0.0,
+                },
+            )
+        )
+        status_time += status_interval
+
+    events.append(ReplayEvent(end_time, "journal", {"event": "Shutdown"}))
+    events.sort(key=lambda event: event.time)
+    return events
+
+
+def write_session(
+    events: collections.abc.Iterable[ReplayEvent],
+    journal_dir: Path,
+    *,
+    live: bool = False,
+    speed: float = 1,
+    written_at: dict[str, float] | None = None,
+) -> None:
+    """
+    Write `events` to the journal and status files in `journal_dir`.
+
+    In live mode, the events are written at their times divided by `speed`, otherwise as fast as possible.
+    If `written_at` is passed, it's filled with the write time of every written line as given by `time.perf_counter`.
+    """
+    start = time.perf_counter()
+    status_path = journal_dir / STATUS_PATH.name
+    with (journal_dir / JOURNAL_FILE_NAME).open(
+        "a", encoding="utf8", newline="\r\n"
+    ) as journal_file:
+        for event in events:
+            if live and (delay := start + event.time / speed - time.perf_counter()) > 0:
+                time.sleep(delay)
+            timestamp = SESSION_START + datetime.timedelta(seconds=event.time)
+            line = json.dumps(
+                {"timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%SZ"), **event.entry},
+                separators=(",", ":"),
+            )
+            if written_at is not None:
+                written_at[line] = time.perf_counter()
+            if event.file == "journal":
+                journal_file.write(line + "\n")
+                journal_file.flush()
+            else:
+                status_path.write_text(line, encoding="utf8")
+
+
+class _RecordingPlotter(Plotter):
+    """Record the time every system was received at."""
+
+    def __init__(self):
+        super().__init__()
+        self.received_at: dict[int, float] = {}
+
+    @QtCore.Slot(str, int)
+    @QtCore.Slot(str)
+    def update_system(self, system: str, system_index: int | None = None) -> None:
+        """Record the time `system_index` was received at."""
+        self.received_at[system_index] = time.perf_counter()
+
+
+def replay_session(
+    events: list[ReplayEvent], *, live: bool, speed: float, timeout: float
+) -> dict[str, tuple[int, list[float]]]:
+    """
+    Replay `events` against the journal tailer, status worker and fuel warner.
+
+    Return the number of written events and the latencies of the handled events in seconds,
+    for the plotter updates from FSDJump events, status updates and the Shutdown event.
+    """
+    from auto_neutron.journal import Journal
+    from auto_neutron.workers import StatusWorker
+
+    JOURNAL_PATH.mkdir(parents=True, exist_ok=True)
+    # The header and location are in the journal before it's opened, like with a running game.
+    start_events = [event for event in events if event.time == 0]
+    write_session(start_events, JOURNAL_PATH)
+    written_at = {}
+    jumps = sum(event.entry["event"] == "FSDJump" for event in events)
+
+    journal = Journal(JOURNAL_PATH / JOURNAL_FILE_NAME)
+    plotter_state = PlotterState(None)
+    plotter_state.journal = journal
+    route = GenericRoute(GenericPlotRow(system) for system in route_systems(jumps))
+    plotter_state.create_worker_with_route(route)
+    plotter = _RecordingPlotter()
+    plotter_state.plotter = plotter
+
+    alert_widget = QtWidgets.QWidget()
+    fuel_warner = FuelWarn(None, alert_widget)
+    fuel_warner.set_journal(journal)
+    status_worker = StatusWorker(None)
+    status_worker.status_signal.connect(fuel_warner.warn)
+    status_received_at = {}
+    status_worker.status_signal.connect(
+        lambda status: status_received_at.setdefault(
+            _status_key(status), time.perf_counter()
+        )
+    )
+    status_worker.start()
+    shut_down_at = []
+    journal.shut_down_sig.connect(lambda: shut_down_at.append(time.perf_counter()))
+
+    writer = threading.Thread(
+        target=write_session,
+        args=(events[len(start_events) :], JOURNAL_PATH),
+        kwargs={"live": live, "speed": speed, "written_at": written_at},
+    )
+    writer_done_at = []
+    app = QtWidgets.QApplication.instance()
+
+    def check_done() -> None:
+        if writer.is_alive():
+            return
+        if not writer_done_at:
+            writer_done_at.append(time.perf_counter())
+        # Let the workers pick up the last status update before stopping.
+        if (
+            shut_down_at and time.perf_counter() - writer_done_at[0] > 0.5
+        ) or time.perf_counter() - writer_done_at[0] > timeout:
+            app.quit()
+
+    poll_timer = QtCore.QTimer()
+    poll_timer.timeout.connect(check_done)
+    poll_timer.start(50)
+    writer.start()
+    app.exec()
+    poll_timer.stop()
+    status_worker.stop()
+    plotter_state.journal = None
+
+    status_written = {
+        _status_key(json.loads(line)): written
+        for line, written in written_at.items()
+        if '"event":"Status"' in line
+    }
+    # The plotter receives the system after the one that was jumped to.
+    jump_written = {
+        _jumped_route_index(line) + 1: written
+        for line, written in written_at.items()
+        if '"event":"FSDJump"' in line
+    }
+    shut_down_written = [
+        written for line, written in written_at.items() if '"Shutdown"' in line
+    ]
+    return {
+        "plotter": (
+            len(jump_written),
+            [
+                plotter.received_at[index] - written
+                for index, written in jump_written.items()
+                if index in plotter.received_at
+            ],
+        ),
+        "status": (
+            len(status_written),
+            [
+                status_received_at[key] - written
+                for key, written in status_written.items()
+                if key in status_received_at
+            ],
+        ),
+        "shutdown": (
+            len(shut_down_written),
+            [
+                received - written
+                for received, written in zip(shut_down_at, shut_down_written)
+            ],
+        ),
+    }
+
+
+def _status_key(status: dict) -> str:
+    """Get a key identifying `status`, the status signal's dicts have their keys sorted by Qt."""
+    return json.dumps(status, sort_keys=True)
+
+
+def _jumped_route_index(line: str) -> int:
+    """Get the route index of the system jumped to in the FSDJump `line`."""
+    return int(json.loads(line)["StarSystem"].rsplit(maxsplit=1)[1])
+
+
+def _format_latencies(name: str, written: int, latencies: list[float]) -> str:
+    """Format the statistics of `latencies` in ms."""
+    if not latencies:
+        return f"{name:>10}: {written} written, none handled"
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    percentiles = (
+        statistics.quantiles(latencies_ms, n=100, method="inclusive")
+        if len(latencies_ms) > 1
+        else latencies_ms * 99
+    )
+    return (
+        f"{name:>10}: {written} written, {len(latencies_ms)} handled,"
+        f" mean {statistics.fmean(latencies_ms):7.2f} ms,"
+        f" p50 {percentiles[49]:7.2f} ms, p95 {percentiles[94]:7.2f} ms,"
+        f" max {latencies_ms[-1]:7.2f} ms"
+    )
+
+
+def main() -> None:
+    """Generate a session from the arguments, replay it and print the latencies."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-j", "--jumps", type=int, default=500)
+    parser.add_argument("--burst-size", type=int, default=20)
+    parser.add_argument(
+        "--jump-interval", type=float, default=45, help="seconds between jumps"
+    )
+    parser.add_argument(
+        "--burst-pause", type=float, default=300, help="seconds between bursts"
+    )
+    parser.add_argument(
+        "--status-interval",
+        type=float,
+        default=1,
+        help="seconds between status updates",
+    )
+    parser.add_argument(
+        "--noise-rate", type=float, default=0.5, help="noise events per second"
+    )
+    parser.add_argument(
+        "--loadout-modules",
+        type=int,
+        default=40,
+        help="engineered modules in the Loadout events",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="write the events with the timing of the game instead of at full speed",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1,
+        help="speed up factor of the game time in live mode",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=10,
+        help="seconds to wait for the events to be handled after the last write",
+    )
+    parser.add_argument(
+        "--journal-dir",
+        type=Path,
+        help="only write the session to this directory instead of replaying it against the workers",
+    )
+    args = parser.parse_args()
+
+    events = generate_session(
+        jumps=args.jumps,
+        burst_size=args.burst_size,
+        jump_interval=args.jump_interval,
+        burst_pause=args.burst_pause,
+        status_interval=args.status_interval,
+        noise_rate=args.noise_rate,
+        loadout_modules=args.loadout_modules,
+        seed=args.seed,
+    )
+    event_counts = collections.Counter(event.entry["event"] for event in events)
+    print(  # noqa: T201
+        f"{len(events)} events spanning {events[-1].time / 3600:.1f} hours of game time:",
+        ", ".join(f"{count} {event}" for event, count in event_counts.most_common()),
+    )
+    if args.journal_dir is not None:
+        args.journal_dir.mkdir(parents=True, exist_ok=True)
+        write_session(events, args.journal_dir, live=args.live, speed=args.speed)
+        return
+
+    QtWidgets.QApplication(sys.argv)
+    gettext.NullTranslations().install()
+    settings_dir = tempfile.TemporaryDirectory()
+    set_settings(TOMLSettings(Path(settings_dir.name, "config.toml")))
+
+    start = time.perf_counter()
+    results = replay_session(
+        events, live=args.live, speed=args.speed, timeout=args.timeout
+    )
+    print(f"Replayed in {time.perf_counter() - start:.2f} s")  # noqa: T201
+    for name, (written, latencies) in results.items():
+        print(_format_latencies(name, written, latencies))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+"""
+Benchmark the route hot paths on synthetic routes and compare the results against previous runs.
+
+Qt runs on the offscreen platform. Results are appended to a json history file,
+and the script exits with a non zero status when a benchmark is slower than its best recorded time
+by more than the allowed threshold.
+"""
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import datetime
+import gettext
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6 import QtWidgets  # noqa: E402
+from __feature__ import snake_case, true_property  # noqa: F401, E402
+
+from auto_neutron.route import (  # noqa: E402
+    ExactRoute,
+    GenericPlotRow,
+    GenericRoute,
+    NeutronRoute,
+    RoadToRichesRoute,
+    Route,
+)
+from auto_neutron.settings import set_settings  # noqa: E402
+from auto_neutron.settings.toml_settings import TOMLSettings  # noqa: E402
+
+DEFAULT_HISTORY_PATH = Path(__file__).with_name("route_hot_paths_history.json")
+
+Benchmark = collections.abc.Callable[[Path, int], collections.abc.Callable[[], object]]
+
+
+def synthetic_route_json(route_type: type[Route], size: int, seed: int = 0) -> object:
+    """Create Spansh json of a `route_type` route with `size` systems, systems repeat every 500 rows."""
+    rng = random.Random(seed)
+    systems = [f"Synthetic Sector {index % 500} {index}" for index in range(size)]
+    if route_type is NeutronRoute:
+        return {
+            "system_jumps": [
+                {
+                    "system": system,
+                    "distance_jumped": rng.uniform(0, 500),
+                    "distance_left": rng.uniform(0, 50_000),
+                    "jumps": rng.randint(1, 4),
+                }
+                for system in systems
+            ]
+        }
+    elif route_type is ExactRoute:
+        return {
+            "jumps": [
+                {
+                    "name": system,
+                    "distance": rng.uniform(0, 80),
+                    "distance_to_destination": rng.uniform(0, 50_000),
+                    "must_refuel": rng.randint(0, 1),
+                    "has_neutron": rng.random() < 0.3,
+                }
+                for system in systems
+            ]
+        }
+    elif route_type is RoadToRichesRoute:
+        return [
+            {
+                "name": system,
+                "jumps": rng.randint(1, 4),
+                "bodies": [
+                    {
+                        "estimated_scan_value": rng.randint(500, 100_000),
+                        "estimated_mapping_value": rng.randint(500, 1_000_000),
+                    }
+                    for _ in range(rng.randint(1, 3))
+                ],
+            }
+            for system in systems
+        ]
+    raise ValueError(f"{route_type.__name__} can't be created from json.")
+
+
+def synthetic_route(route_type: type[Route], size: int, seed: int = 0) -> Route:
+    """Create a `route_type` route with `size` systems."""
+    if route_type is GenericRoute:
+        return GenericRoute(
+            GenericPlotRow(f"Synthetic Sector {index % 500} {index}")
+            for index in range(size)
+        )
+    return route_type.from_json(synthetic_route_json(route_type, size, seed))
+
+
+def _from_csv_file(
+    route_type: type[Route],
+) -> Benchmark:
+    def setup(temp_dir: Path, size: int) -> collections.abc.Callable[[], object]:
+        path = temp_dir / f"{route_type.__name__}.{size}.csv"
+        synthetic_route(route_type, size).to_csv_file(path)
+        return lambda: Route.from_csv_file(path)
+
+    return setup
+
+
+def _from_json(route_type: type[Route]) -> Benchmark:
+    def setup(temp_dir: Path, size: int) -> collections.abc.Callable[[], object]:
+        route_json = synthetic_route_json(route_type, size)
+        return lambda: route_type.from_json(route_json)
+
+    return setup
+
+
+def _to_csv_file(temp_dir: Path, size: int) -> collections.abc.Callable[[], object]:
+    route = synthetic_route(ExactRoute, size)
+    return lambda: route.to_csv_file(temp_dir / "to_csv_file.csv")
+
+
+def _system_index(temp_dir: Path, size: int) -> collections.abc.Callable[[], object]:
+    route = synthetic_route(ExactRoute, size)
+    route.index = size // 2
+    systems = random.Random(0).choices(route.entries.column("system"), k=1000)
+    route.system_index(systems[0])  # Build the indices outside of the measured time.
+
+    def run() -> None:
+        for system in systems:
+            route.system_index(system)
+
+    return run
+
+
+def _initialize_table(
+    temp_dir: Path, size: int
+) -> collections.abc.Callable[[], object]:
+    window = _main_window()
+    route = synthetic_route(ExactRoute, size)
+
+    def run() -> None:
+        window.initialize_table(route)
+        QtWidgets.QApplication.process_events()
+
+    return run
+
+
+def _set_current_row(temp_dir: Path, size: int) -> collections.abc.Callable[[], object]:
+    window = _main_window()
+    route = synthetic_route(ExactRoute, size)
+    window.initialize_table(route)
+
+    def run() -> None:
+        """Advance through 100 rows, starting from the middle of the route."""
+        for index in range(size // 2, min(size // 2 + 100, size)):
+            route.index = index
+            window.set_current_row(index)
+            QtWidgets.QApplication.process_events()
+
+    return run
+
+
+_main_window_instance = None
+
+
+def _main_window() -> QtWidgets.QMainWindow:
+    """Get the shared main window, creating it on the first call."""
+    global _main_window_instance
+    if _main_window_instance is None:
+        from auto_neutron.windows.main_window import MainWindow
+
+        _main_window_instance = MainWindow()
+        _main_window_instance.show()
+    return _main_window_instance
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    **{
+        f"{route_type.__name__}.from_csv_file": _from_csv_file(route_type)
+        for route_type in (GenericRoute, NeutronRoute, ExactRoute, RoadToRichesRoute)
+    },
+    "NeutronRoute.from_json": _from_json(NeutronRoute),
+    "ExactRoute.from_json": _from_json(ExactRoute),
+    "Route.to_csv_file": _to_csv_file,
+    "Route.system_index": _system_index,
+    "MainWindow.initialize_table": _initialize_table,
+    "MainWindow.set_current_row": _set_current_row,
+}
+
+
+def run_benchmarks(
+    names: collections.abc.Iterable[str], sizes: list[int], repeat: int
+) -> dict[str, float]:
+    """Run the benchmarks `names` for every size in `sizes`, return the best of `repeat` runs in seconds."""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name in names:
+            for size in sizes:
+                run = BENCHMARKS[name](Path(temp_dir), size)
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    run()
+                    best = min(best, time.perf_counter() - start)
+                results[f"{name}[{size}]"] = best
+    return results
+
+
+def load_history(path: Path) -> list[dict]:
+    """Load the recorded runs from the history file at `path`."""
+    try:
+        return json.loads(path.read_text(encoding="utf8"))
+    except FileNotFoundError:
+        return []
+
+
+def find_regressions(
+    results: dict[str, float], history: list[dict], threshold: float
+) -> dict[str, float]:
+    """Get the results that are slower than the best recorded result by more than `threshold`, with their baselines."""
+    regressions = {}
+    for key, result in results.items():
+        recorded = [run["results"][key] for run in history if key in run["results"]]
+        if recorded and result > (baseline := min(recorded)) * (1 + threshold):
+            regressions[key] = baseline
+    return regressions
+
+
+def _current_commit() -> str | None:
+    """Get the hash of the checked out git commit, or None if it can't be determined."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Run the benchmarks, print and record the results, and exit with 1 if there were regressions."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[100, 10_000, 100_000],
+        help="route sizes in rows",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        nargs="+",
+        choices=BENCHMARKS,
+        default=list(BENCHMARKS),
+        metavar="BENCHMARK",
+    )
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH)
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed slowdown against the best recorded result, as a fraction",
+    )
+    parser.add_argument(
+        "--no-record",
+        action="store_true",
+        help="don't add the results to the history",
+    )
+    args = parser.parse_args()
+
+    QtWidgets.QApplication(sys.argv)
+    # The benchmarks don't need translations, which may not be compiled in a source checkout.
+    gettext.NullTranslations().install()
+    settings_dir = tempfile.TemporaryDirectory()
+    set_settings(TOMLSettings(Path(settings_dir.name, "config.toml")))
+
+    results = run_benchmarks(args.benchmarks, args.sizes, args.repeat)
+    history = load_history(args.history)
+    regressions = find_regressions(results, history, args.threshold)
+
+    for key, result in results.items():
+        line = f"{key:>45}: {result * 1000:10.3f} ms"
+        if key in regressions:
+            line += f"  REGRESSION, best recorded {regressions[key] * 1000:.3f} ms"
+        print(line)  # noqa: T201
+
+    if not args.no_record:
+        history.append(
+            {
+                "time": datetime.datetime.now(datetime.UTC).isoformat(),
+                "commit": _current_commit(),
+                "results": results,
+            }
+        )
+        args.history.write_text(json.dumps(history, indent=2), encoding="utf8")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
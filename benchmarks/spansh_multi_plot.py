@@ -0,0 +1,98 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+"""Plot neutron routes with several efficiencies against the fake Spansh server, serially and concurrently, and compare them."""
+from __future__ import annotations
+
+import argparse
+import gettext
+import sys
+import threading
+import time
+
+from PySide6 import QtCore, QtNetwork
+from __feature__ import snake_case, true_property  # noqa: F401
+
+import auto_neutron
+from auto_neutron.route import NeutronRoute
+from auto_neutron.spansh_request_manager import (
+    RouteComparison,
+    SpanshJob,
+    SpanshRequestManager,
+)
+from benchmarks.fake_spansh import FakeSpanshServer
+
+
+def plot_all(
+    server: FakeSpanshServer, efficiencies: list[int], max_concurrent: int
+) -> tuple[float, list[SpanshJob]]:
+    """Plot a route for every efficiency with up to `max_concurrent` jobs at once, return the time taken and the jobs."""
+    manager = SpanshRequestManager(
+        api_url=server.api_url, max_concurrent=max_concurrent
+    )
+    loop = QtCore.QEventLoop()
+
+    def job_done(*_: object) -> None:
+        if not manager.jobs:
+            loop.quit()
+
+    start = time.perf_counter()
+    jobs = [
+        manager.submit(
+            "route",
+            {"from": "Sol", "to": "Colonia", "range": 60, "efficiency": efficiency},
+            NeutronRoute,
+            result_callback=job_done,
+            error_callback=job_done,
+        )
+        for efficiency in efficiencies
+    ]
+    loop.exec()
+    return time.perf_counter() - start, jobs
+
+
+def main() -> None:
+    """Plot the routes for the passed in efficiencies and print the time taken and the routes side by side."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-e", "--efficiencies", nargs="+", type=int, default=[40, 60, 80, 100]
+    )
+    parser.add_argument(
+        "-d",
+        "--job-durations",
+        nargs="+",
+        type=float,
+        default=[3, 5, 2, 4],
+        help="seconds until the jobs finish, cycled through for every job",
+    )
+    parser.add_argument("-c", "--max-concurrent", type=int, default=4)
+    args = parser.parse_args()
+
+    app = QtCore.QCoreApplication(sys.argv)  # noqa: F841
+    gettext.NullTranslations().install()
+    auto_neutron.network_mgr = QtNetwork.QNetworkAccessManager()
+
+    for name, max_concurrent in (("serial", 1), ("concurrent", args.max_concurrent)):
+        server = FakeSpanshServer(job_durations=args.job_durations)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            elapsed, jobs = plot_all(server, args.efficiencies, max_concurrent)
+        finally:
+            server.shutdown()
+            server.server_close()
+        print(f"{name}: {elapsed:.2f} s")  # noqa: T201
+
+    print(f"{'efficiency':>10} {'jumps':>6} {'distance':>10}")  # noqa: T201
+    for job in jobs:
+        comparison = RouteComparison.from_job(job)
+        if comparison.error is not None:
+            print(f"{job.params['efficiency']:>10} {comparison.error}")  # noqa: T201
+        else:
+            print(  # noqa: T201
+                f"{job.params['efficiency']:>10} {comparison.total_jumps:>6}"
+                f" {comparison.total_distance:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
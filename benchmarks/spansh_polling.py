@@ -0,0 +1,116 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+"""Measure the time to the first result of Spansh jobs with the poll strategies against the fake Spansh server."""
+from __future__ import annotations
+
+import argparse
+import collections.abc
+import gettext
+import statistics
+import sys
+import threading
+import time
+
+from PySide6 import QtCore, QtNetwork
+from __feature__ import snake_case, true_property  # noqa: F401
+
+import auto_neutron
+from auto_neutron.route import NeutronRoute
+from auto_neutron.spansh_request_manager import (
+    AdaptivePollStrategy,
+    PollStrategy,
+    ScheduledPollStrategy,
+    SpanshRequestManager,
+)
+from benchmarks.fake_spansh import FakeSpanshServer
+
+STRATEGIES: dict[str, tuple[collections.abc.Callable[[], PollStrategy], bool]] = {
+    "scheduled": (ScheduledPollStrategy, False),
+    "adaptive": (AdaptivePollStrategy, False),
+    "adaptive with eta": (AdaptivePollStrategy, True),
+}
+
+
+def time_to_result(
+    server: FakeSpanshServer,
+    poll_strategy_factory: collections.abc.Callable[[], PollStrategy],
+) -> tuple[float, int]:
+    """Plot a route on `server` and get the seconds until the result was received, and the number of polls made."""
+    manager = SpanshRequestManager(
+        api_url=server.api_url, poll_strategy_factory=poll_strategy_factory
+    )
+    loop = QtCore.QEventLoop()
+    outcome = []
+
+    def result_callback(route: NeutronRoute) -> None:
+        outcome.append(time.perf_counter())
+        loop.quit()
+
+    def error_callback(error: str) -> None:
+        outcome.append(error)
+        loop.quit()
+
+    start = time.perf_counter()
+    manager.submit(
+        "route",
+        {"from": "Sol", "to": "Colonia", "range": 60, "efficiency": 60},
+        NeutronRoute,
+        result_callback=result_callback,
+        error_callback=error_callback,
+    )
+    loop.exec()
+    if isinstance(outcome[0], str):
+        raise RuntimeError(outcome[0])
+    return outcome[0] - start, server.polls.total()
+
+
+def main() -> None:
+    """Plot routes with jobs of the given durations using every strategy, and print the time to result and polls."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-d",
+        "--job-durations",
+        nargs="+",
+        type=float,
+        default=[0.5, 2.1, 5, 9, 14],
+        help="seconds until the jobs finish",
+    )
+    parser.add_argument(
+        "-s",
+        "--strategies",
+        nargs="+",
+        choices=STRATEGIES,
+        default=list(STRATEGIES),
+        metavar="STRATEGY",
+    )
+    args = parser.parse_args()
+
+    app = QtCore.QCoreApplication(sys.argv)  # noqa: F841
+    gettext.NullTranslations().install()
+    auto_neutron.network_mgr = QtNetwork.QNetworkAccessManager()
+
+    for strategy_name in args.strategies:
+        strategy_factory, report_progress = STRATEGIES[strategy_name]
+        print(f"{strategy_name}:")  # noqa: T201
+        lags = []
+        for duration in args.job_durations:
+            server = FakeSpanshServer(
+                job_durations=[duration], report_progress=report_progress
+            )
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                elapsed, polls = time_to_result(server, strategy_factory)
+            finally:
+                server.shutdown()
+                server.server_close()
+            lags.append(elapsed - duration)
+            print(  # noqa: T201
+                f"    {duration:6.1f} s job: result after {elapsed:6.2f} s,"
+                f" {elapsed - duration:5.2f} s late, {polls:3} polls"
+            )
+        print(f"    mean lateness {statistics.fmean(lags):.2f} s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import os
+import tempfile
+
+# Keep the tests away from the user's config and journal directories, and don't open windows.
+os.environ["userprofile"] = tempfile.mkdtemp(prefix="auto_neutron_tests")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
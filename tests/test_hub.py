@@ -0,0 +1,83 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import contextlib
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from auto_neutron.constants import ROUTE_PROGRESS_FILE_NAME, ROUTE_SNAPSHOT_FILE_NAME
+from auto_neutron.hub import Hub
+from auto_neutron.route import ExactPlotRow, ExactRoute, RouteProgressLog
+
+
+def _route(name: str) -> ExactRoute:
+    return ExactRoute(
+        [
+            ExactPlotRow(f"{name} {index}", 50.0, 100.0 - index, False, False)
+            for index in range(5)
+        ]
+    )
+
+
+class SaveOnExitTest(unittest.TestCase):
+    """The route restored after quitting with routes saved on quit."""
+
+    def setUp(self) -> None:
+        """Patch the config directory and settings, and save a stale route with progress to it."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.config_dir = Path(temp_dir.name)
+        self.settings = mock.Mock()
+        self.settings.General.save_on_quit = True
+        for name, new in (
+            ("get_config_dir", lambda: self.config_dir),
+            ("settings", self.settings),
+            ("delay_sync", contextlib.nullcontext),
+        ):
+            patcher = mock.patch(f"auto_neutron.hub.{name}", new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        stale_log = RouteProgressLog(
+            _route("Stale"),
+            self.config_dir / ROUTE_SNAPSHOT_FILE_NAME,
+            self.config_dir / ROUTE_PROGRESS_FILE_NAME,
+        )
+        stale_log.log_index(3)
+        stale_log.close()
+
+        self.route = _route("Current")
+        self.route.index = 2
+        self.hub = Hub.__new__(Hub)
+        self.hub.window = mock.Mock()
+        self.hub.plotter_state = types.SimpleNamespace(route=self.route)
+        self.hub._progress_log = None
+
+    def assert_current_route_restored(self) -> None:
+        """Assert the current route with its index is restored from the config directory."""
+        restored = RouteProgressLog.restore(
+            self.config_dir / ROUTE_SNAPSHOT_FILE_NAME,
+            self.config_dir / ROUTE_PROGRESS_FILE_NAME,
+        )
+        self.assertEqual(list(restored.entries), list(self.route.entries))
+        self.assertEqual(restored.index, 2)
+
+    def test_quit_without_logged_changes(self) -> None:
+        """A new route is restored even if none of its changes were logged before quitting."""
+        self.hub._update_progress_log()
+        self.hub.save_on_exit()
+
+        self.assert_current_route_restored()
+
+    def test_save_on_quit_enabled_mid_session(self) -> None:
+        """The current route is restored after enabling saving on quit while it was displayed."""
+        self.settings.General.save_on_quit = False
+        self.hub._update_progress_log()
+        self.settings.General.save_on_quit = True
+        self.hub._update_progress_log()
+        self.hub.save_on_exit()
+
+        self.assert_current_route_restored()
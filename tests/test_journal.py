@@ -0,0 +1,49 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from auto_neutron.journal import Journal
+
+_EVENTS = (
+    {"event": "Fileheader", "Odyssey": True},
+    {"event": "Commander", "Name": "Synthetic"},
+    {"event": "Location", "StarSystem": "Sol", "StarPos": [0.0, 0.0, 0.0]},
+    {"event": "Shutdown"},
+)
+
+
+class RecoverStateTest(unittest.TestCase):
+    """Recovery of the journal state from the end of the file."""
+
+    def setUp(self) -> None:
+        """Create a directory for the journal files."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.journal_dir = Path(temp_dir.name)
+
+    def recover(self, trailing_data: bytes) -> Journal:
+        """Recover a journal that ends in a shut down followed by `trailing_data`."""
+        path = self.journal_dir / "Journal.2022-01-01T000000.01.log"
+        lines = (json.dumps(event).encode() for event in _EVENTS)
+        path.write_bytes(b"\r\n".join(lines) + b"\r\n" + trailing_data)
+        journal = Journal(path)
+        journal.recover_state()
+        return journal
+
+    def test_shut_down_before_blank_lines(self) -> None:
+        """Blank lines after the shut down don't hide it."""
+        journal = self.recover(b"\r\n\r\n")
+
+        self.assertTrue(journal.shut_down)
+        self.assertEqual(journal.location.name, "Sol")
+
+    def test_shut_down_before_undecodable_line(self) -> None:
+        """Lines of null bytes after the shut down, left by a crash, don't hide it."""
+        journal = self.recover(b"\x00\x00\x00\r\n")
+
+        self.assertTrue(journal.shut_down)
+        self.assertEqual(journal.cmdr, "Synthetic")
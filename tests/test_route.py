@@ -0,0 +1,28 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import unittest
+
+from auto_neutron.route import ExactPlotRow, NeutronPlotRow, RouteEntries
+
+
+class RowViewTest(unittest.TestCase):
+    """Comparisons of the row views of `RouteEntries`."""
+
+    def test_view_equals_plain_row(self) -> None:
+        """Views are equal to plain rows with the same values, in both directions."""
+        row = ExactPlotRow("Sol", 1.5, 10.25, True, False)
+        entries = RouteEntries(ExactPlotRow, [row])
+
+        self.assertEqual(entries[0], row)
+        self.assertEqual(row, entries[0])
+        self.assertEqual(entries[0], entries[:1][0])
+
+    def test_view_differs_from_row_with_other_values(self) -> None:
+        """Views aren't equal to rows with other values or of another type."""
+        entries = RouteEntries(
+            ExactPlotRow, [ExactPlotRow("Sol", 1.5, 10.25, True, False)]
+        )
+
+        self.assertNotEqual(entries[0], ExactPlotRow("Sol", 1.5, 10.25, False, False))
+        self.assertNotEqual(entries[0], NeutronPlotRow("Sol", 1.5, 10.25, 1))
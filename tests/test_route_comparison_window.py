@@ -0,0 +1,107 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import gettext
+import threading
+import unittest
+
+from PySide6 import QtCore, QtNetwork, QtWidgets
+from __feature__ import snake_case, true_property  # noqa: F401
+
+import auto_neutron
+from auto_neutron.route import NeutronRoute
+from auto_neutron.spansh_request_manager import SpanshRequestManager
+from auto_neutron.windows.route_comparison_window import RouteComparisonWindow
+from benchmarks.fake_spansh import FakeSpanshServer
+
+
+class RouteComparisonWindowTest(unittest.TestCase):
+    """Routes plotted with several efficiencies against the fake Spansh server, and compared in the window."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the application the window runs in, and the network manager of the requests."""
+        if QtWidgets.QApplication.instance() is None:
+            cls.app = QtWidgets.QApplication([])
+        gettext.NullTranslations().install()
+        auto_neutron.network_mgr = QtNetwork.QNetworkAccessManager()
+
+    def setUp(self) -> None:
+        """Start the fake Spansh server, and create the window plotting through it."""
+        server = FakeSpanshServer(job_durations=(0.3,))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        self.manager = SpanshRequestManager(api_url=server.api_url)
+        self.window = RouteComparisonWindow(None, self.manager)
+        self.addCleanup(self.window.close)
+
+    def _wait_for_jobs(self) -> None:
+        """Run the event loop until the manager's jobs finish."""
+        loop = QtCore.QEventLoop()
+
+        def quit_when_done() -> None:
+            if not self.manager.jobs:
+                loop.quit()
+
+        poll_timer = QtCore.QTimer()
+        poll_timer.timeout.connect(quit_when_done)
+        poll_timer.start(50)
+        QtCore.QTimer.single_shot(15_000, loop.quit)
+        loop.exec()
+        poll_timer.stop()
+        self.assertEqual(self.manager.jobs, [])
+
+    def test_concurrent_plots(self) -> None:
+        """The routes are plotted at once, and each row shows its own route's totals."""
+        efficiencies = (40, 60, 100)
+        for efficiency in efficiencies:
+            self.window.plot(
+                "route",
+                {"from": "Sol", "to": "Colonia", "range": 60, "efficiency": efficiency},
+                NeutronRoute,
+            )
+        self.assertEqual(len(self.manager._running_jobs), len(efficiencies))
+        self.assertEqual(len(self.manager._pending_jobs), 0)
+
+        self._wait_for_jobs()
+
+        comparisons = self.window.comparisons
+        self.assertEqual(
+            [comparison.params["efficiency"] for comparison in comparisons],
+            list(efficiencies),
+        )
+        for comparison in comparisons:
+            self.assertIsNone(comparison.error)
+        self.assertEqual(
+            len({comparison.total_jumps for comparison in comparisons}),
+            len(efficiencies),
+        )
+        self.assertEqual(
+            [self.window.table.item(row, 0).text() for row in range(len(efficiencies))],
+            [f"efficiency: {efficiency}" for efficiency in efficiencies],
+        )
+        self.assertEqual(
+            [self.window.table.item(row, 1).text() for row in range(len(efficiencies))],
+            [str(comparison.total_jumps) for comparison in comparisons],
+        )
+
+    def test_use_route(self) -> None:
+        """The selected row's route is emitted once it's plotted."""
+        selected_routes = []
+        self.window.route_selected.connect(selected_routes.append)
+        self.window.plot(
+            "route",
+            {"from": "Sol", "to": "Colonia", "range": 60, "efficiency": 60},
+            NeutronRoute,
+        )
+        self.window.table.select_row(0)
+        self.assertFalse(self.window.use_route_button.enabled)
+
+        self._wait_for_jobs()
+
+        self.assertTrue(self.window.use_route_button.enabled)
+        self.window.use_route_button.click()
+        self.assertEqual(len(selected_routes), 1)
+        self.assertIsInstance(selected_routes[0], NeutronRoute)
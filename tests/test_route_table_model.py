@@ -0,0 +1,71 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import unittest
+
+from PySide6 import QtCore, QtGui, QtTest
+from __feature__ import snake_case, true_property  # noqa: F401
+
+from auto_neutron.route import ExactPlotRow, ExactRoute
+from auto_neutron.windows.route_table_model import RouteTableModel
+
+
+def _rows(start: int, stop: int) -> list[ExactPlotRow]:
+    return [
+        ExactPlotRow(f"System {index}", 50.0, 1000.0 - index, False, False)
+        for index in range(start, stop)
+    ]
+
+
+class RouteTableModelTest(unittest.TestCase):
+    """The model's behaviour checked by `QAbstractItemModelTester` while the route's rows are streamed in."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the application the model's views would run in."""
+        if QtGui.QGuiApplication.instance() is None:
+            cls.app = QtGui.QGuiApplication([])
+
+    def setUp(self) -> None:
+        """Collect the warnings reported by the model tester."""
+        self.warnings = []
+
+        def handle_message(
+            message_type: QtCore.QtMsgType,
+            _: QtCore.QMessageLogContext,
+            message: str,
+        ) -> None:
+            if message_type is not QtCore.QtMsgType.QtDebugMsg:
+                self.warnings.append(message)
+
+        previous_handler = QtCore.qInstallMessageHandler(handle_message)
+        self.addCleanup(QtCore.qInstallMessageHandler, previous_handler)
+
+    def test_streamed_rows(self) -> None:
+        """Rows appended to the route only appear in the model once they're inserted."""
+        route = ExactRoute(_rows(0, 3))
+        route.populating = True
+        model = RouteTableModel()
+        model.set_route(route)
+        self.tester = QtTest.QAbstractItemModelTester(
+            model, QtTest.QAbstractItemModelTester.FailureReportingMode.Warning
+        )
+
+        for start in range(3, 30, 9):
+            route.entries.extend(_rows(start, start + 9))
+            self.assertEqual(model.row_count(), start)
+            model.rows_appended()
+            self.assertEqual(model.row_count(), start + 9)
+
+        self.assertEqual(model.data(model.index(29, 0)), "System 29")
+        self.assertEqual(self.warnings, [])
+
+    def test_no_new_rows(self) -> None:
+        """Nothing is inserted if the route didn't grow."""
+        model = RouteTableModel()
+        model.set_route(ExactRoute(_rows(0, 3)))
+        spy = QtTest.QSignalSpy(model.rowsInserted)
+
+        model.rows_appended()
+
+        self.assertEqual(spy.count(), 0)
@@ -0,0 +1,75 @@
+# This file is part of Auto_Neutron. See the main.py file for more details.
+# Copyright (C) 2019  Numerlor
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from auto_neutron.game_state import Location
+from auto_neutron.journal import Journal
+from auto_neutron.route import ExactPlotRow, ExactRoute
+from auto_neutron.workers import GameWorker
+
+
+def _rows(start: int, stop: int) -> list[ExactPlotRow]:
+    return [
+        ExactPlotRow(f"System {index}", 50.0, 1000.0 - index, False, False)
+        for index in range(start, stop)
+    ]
+
+
+class GameWorkerTest(unittest.TestCase):
+    """Signals of the game worker when the last row of a route that's still being decoded is reached."""
+
+    def setUp(self) -> None:
+        """Create a worker following a populating route, and collect its signals."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        journal_path = Path(temp_dir.name, "Journal.2022-01-01T000000.01.log")
+        journal_path.touch()
+
+        self.settings = mock.Mock()
+        self.settings.General.loop_routes = False
+        patcher = mock.patch("auto_neutron.workers.settings", self.settings)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.route = ExactRoute(_rows(0, 3))
+        self.route.populating = True
+        self.worker = GameWorker(None, self.route, Journal(journal_path))
+        self.new_indices = []
+        self.route_ends = []
+        self.worker.new_system_index_sig.connect(self.new_indices.append)
+        self.worker.route_end_sig.connect(self.route_ends.append)
+
+    def test_rows_appended_after_last_row(self) -> None:
+        """The next system is emitted once rows are appended after the reached last row."""
+        self.worker.emit_next_system(Location("System 2", 0, 0, 0))
+        self.assertEqual((self.new_indices, self.route_ends), ([], []))
+
+        self.route.entries.extend(_rows(3, 6))
+        self.route.update_indices()
+        self.worker.emit_pending_system()
+
+        self.assertEqual((self.new_indices, self.route_ends), ([3], []))
+
+    def test_route_populated_after_last_row(self) -> None:
+        """The route ends once it's populated without new rows after the reached last row."""
+        self.worker.emit_next_system(Location("System 2", 0, 0, 0))
+        self.route.populating = False
+        self.worker.emit_pending_system()
+        self.worker.emit_pending_system()
+
+        self.assertEqual((self.new_indices, self.route_ends), ([], [3]))
+
+    def test_looped_route_populated_after_last_row(self) -> None:
+        """Looped routes only go back to their start once they're populated."""
+        self.settings.General.loop_routes = True
+        self.worker.emit_next_system(Location("System 2", 0, 0, 0))
+        self.assertEqual(self.new_indices, [])
+
+        self.route.populating = False
+        self.worker.emit_pending_system()
+
+        self.assertEqual((self.new_indices, self.route_ends), ([0], []))